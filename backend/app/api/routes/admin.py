@@ -0,0 +1,93 @@
+"""Admin router.
+
+Exposes operational endpoints that change server state, currently the
+zero-downtime model reload. All routes require ``Authorization: Bearer
+<ADMIN_TOKEN>`` and are disabled while no admin token is configured.
+"""
+
+import asyncio
+import hmac
+import logging
+
+from fastapi import APIRouter, Header, HTTPException, status
+
+from app.core.config import get_settings
+from app.schemas.prediction import ReloadResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+settings = get_settings()
+
+
+def require_admin(authorization: str | None) -> None:
+    """Checks the bearer token of an admin request.
+
+    Args:
+        authorization: Value of the ``Authorization`` header, if any.
+
+    Raises:
+        HTTPException 404: If no admin token is configured.
+        HTTPException 401: If the token is missing or wrong.
+    """
+    if not settings.admin_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token, settings.admin_token):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid admin token.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@router.post(
+    "/admin/reload",
+    response_model=ReloadResponse,
+    summary="Reload Model Artifacts",
+    description=(
+        "Loads the model artifacts from disk, validates them on canary rows "
+        "from the training CSV and atomically swaps them in. The current "
+        "model keeps serving until the swap; requests in flight finish on it."
+    ),
+    tags=["Admin"],
+)
+async def reload_model(authorization: str | None = Header(None)) -> ReloadResponse:
+    """Hot-swaps the model artifacts without restarting the server.
+
+    Args:
+        authorization: Bearer admin token.
+
+    Returns:
+        ReloadResponse with the previous and new artifact versions.
+
+    Raises:
+        HTTPException 401/404: If the request is not authorised.
+        HTTPException 409: If a reload is already running or the new
+            artifacts fail canary validation.
+        HTTPException 500: If the new artifacts cannot be loaded.
+    """
+    require_admin(authorization)
+
+    from app.services.ml_service import ModelValidationError, ReloadInProgressError, ml_service
+
+    try:
+        # Loading and validation run off the event loop; serving continues.
+        result = await asyncio.to_thread(ml_service.reload)
+    except ReloadInProgressError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    except ModelValidationError as exc:
+        logger.warning("Model reload rejected: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"New model rejected, previous model still serving: {exc}",
+        ) from exc
+    except Exception as exc:
+        logger.exception("Model reload failed: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Model reload failed, previous model still serving: {exc}",
+        ) from exc
+
+    logger.info("Model reload %s: version %s", result.status, result.artifact_version)
+    return result
@@ -1,14 +1,21 @@
 """Health check router.
 
-Exposes a /health endpoint for uptime monitoring and deployment readiness checks.
+Exposes a /health endpoint for uptime monitoring and deployment readiness checks,
+plus operational statistics for the prediction cache, price lattice, request
+coalescer and prediction log.
 """
 
 import logging
 
 from fastapi import APIRouter
 
-from app.schemas.prediction import HealthResponse
-from app.services.ml_service import ml_service
+from app.schemas.prediction import (
+    CacheStatsResponse,
+    CoalescerStatsResponse,
+    HealthResponse,
+    LatticeStatsResponse,
+    PredictionLogStatsResponse,
+)
 from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -30,6 +37,8 @@ async def health_check() -> HealthResponse:
     Returns:
         HealthResponse with status indicator and model load state.
     """
+    from app.services.ml_service import ml_service
+
     model_loaded = ml_service.is_loaded
     status = "healthy" if model_loaded else "degraded"
     message = (
@@ -45,4 +54,83 @@ async def health_check() -> HealthResponse:
         model_loaded=model_loaded,
         version=settings.app_version,
         message=message,
+        artifact_version=ml_service.version,
     )
+
+
+@router.get(
+    "/cache/stats",
+    response_model=CacheStatsResponse,
+    summary="Prediction Cache Statistics",
+    description="Returns size, hit/miss and eviction counters of the prediction cache.",
+    tags=["System"],
+)
+async def cache_stats() -> CacheStatsResponse:
+    """Returns prediction cache counters, used to size the cache.
+
+    Returns:
+        CacheStatsResponse with current size and hit/miss/eviction counters.
+    """
+    from app.services.ml_service import ml_service
+
+    return ml_service.get_cache_stats()
+
+
+@router.get(
+    "/lattice/stats",
+    response_model=LatticeStatsResponse,
+    summary="Price Lattice Statistics",
+    description="Returns build time, memory footprint and error of the precomputed price lattice.",
+    tags=["System"],
+)
+async def lattice_stats() -> LatticeStatsResponse:
+    """Returns statistics for the precomputed price lattice.
+
+    Returns:
+        LatticeStatsResponse, with ``enabled=False`` if the lattice is not active.
+    """
+    from app.services.ml_service import ml_service
+
+    return ml_service.get_lattice_stats()
+
+
+@router.get(
+    "/coalescer/stats",
+    response_model=CoalescerStatsResponse,
+    summary="Request Coalescer Statistics",
+    description="Returns the batch-size distribution and queueing delay of coalesced predictions.",
+    tags=["System"],
+)
+async def coalescer_stats() -> CoalescerStatsResponse:
+    """Returns statistics for the /predict micro-batching coalescer.
+
+    Returns:
+        CoalescerStatsResponse, with ``enabled=False`` if coalescing is off.
+    """
+    if not settings.coalesce_enabled:
+        return CoalescerStatsResponse(enabled=False)
+
+    from app.services.coalescer import prediction_coalescer
+
+    return prediction_coalescer.stats()
+
+
+@router.get(
+    "/prediction-log/stats",
+    response_model=PredictionLogStatsResponse,
+    summary="Prediction Log Statistics",
+    description="Returns buffer occupancy, drops and flush counters of the prediction log.",
+    tags=["System"],
+)
+async def prediction_log_stats() -> PredictionLogStatsResponse:
+    """Returns statistics for the asynchronous prediction log.
+
+    Returns:
+        PredictionLogStatsResponse, with ``enabled=False`` if logging is off.
+    """
+    if not settings.prediction_log_enabled:
+        return PredictionLogStatsResponse(enabled=False)
+
+    from app.services.prediction_log import prediction_log
+
+    return prediction_log.stats()
@@ -0,0 +1,25 @@
+"""Prometheus metrics router.
+
+Exposes GET /metrics in the Prometheus text exposition format, outside the
+versioned API prefix where scrapers expect it.
+"""
+
+from fastapi import APIRouter, Response
+
+from app.core.metrics import REGISTRY
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Returns all registered metrics for a Prometheus scrape.
+
+    Returns:
+        Plain-text response in exposition format 0.0.4, empty if metrics are
+        disabled.
+    """
+    # Importing the services registers their scrape-time callbacks.
+    from app.services import ml_service, prediction_log  # noqa: F401
+
+    return Response(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
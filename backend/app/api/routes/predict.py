@@ -1,29 +1,184 @@
 """Prediction and model-info router.
 
-Exposes endpoints for house price prediction, location listing,
-and model metadata. All routes are versioned under /api/v1.
+Exposes endpoints for house price prediction, what-if sweeps and explanations,
+location listing and comparison, and model metadata. All routes are versioned
+under /api/v1.
 """
 
+import json
 import logging
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Literal
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 
+from app.api.fast_path import decode_prediction, fast_path_route, is_json_content
+from app.core.config import get_settings
+from app.core.metrics import VALIDATION_STAGE
 from app.schemas.prediction import (
+    BatchPredictionRequest,
+    BatchPredictionResponse,
+    ExplanationResponse,
+    LocationComparisonResponse,
     LocationsResponse,
     ModelInfoResponse,
     NaviMumbaiLocation,
     PredictionRequest,
     PredictionResponse,
+    SweepAxis,
+    SweepRequest,
+    SweepResponse,
 )
-from app.services.ml_service import ml_service
+
+if TYPE_CHECKING:
+    from app.services.prediction_cache import RequestValues
 
 logger = logging.getLogger(__name__)
 
+# Numeric PredictionRequest fields, in the order of ``request_values``.
+FEATURE_FIELDS = tuple(name for name in PredictionRequest.model_fields if name != "location")
+_RESPONSE_SERIALIZER = PredictionResponse.__pydantic_serializer__
+_ENUM_LOCATIONS = sorted(location.value for location in NaviMumbaiLocation)
+
 router = APIRouter()
+settings = get_settings()
 
 
-@router.post(
+async def _serve_prediction(
+    location: str, values: "RequestValues", request: PredictionRequest | None = None
+) -> PredictionResponse:
+    """Prices one property for /predict, mapping failures to HTTP errors.
+
+    Args:
+        location: Location value, as in ``NaviMumbaiLocation``.
+        values: Numeric request fields from ``request_values``.
+        request: The validated request, if the standard path built one.
+
+    Returns:
+        PredictionResponse with price estimate and confidence interval.
+
+    Raises:
+        HTTPException 503: If the ML model is not loaded or the inference
+            queue is full.
+        HTTPException 400: If the location is not supported by the model.
+        HTTPException 500: For unexpected inference errors.
+    """
+    from app.services.coalescer import prediction_coalescer
+    from app.services.inference_executor import ExecutorSaturatedError, inference_executor
+    from app.services.ml_service import ml_service
+    from app.services.prediction_log import prediction_log
+
+    if not ml_service.is_loaded:
+        logger.error("Prediction attempted but model is not loaded.")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="ML model is not ready. Please try again in a moment.",
+        )
+
+    try:
+        logger.info(
+            "Prediction request: location=%s area=%.1f bhk=%d", location, values[0], values[1]
+        )
+        start = time.perf_counter()
+        if settings.coalesce_enabled and request is not None:
+            result = await prediction_coalescer.submit(request)
+        else:
+            result = await inference_executor.predict_values(location, values)
+        if prediction_log.enabled:
+            if request is None:
+                request = PredictionRequest.model_construct(
+                    location=NaviMumbaiLocation(location), **dict(zip(FEATURE_FIELDS, values))
+                )
+            prediction_log.record(
+                "predict", request, result, ml_service.version, time.perf_counter() - start
+            )
+        logger.info("Prediction result: ₹%.0f", result.predicted_price)
+        return result
+    except ExecutorSaturatedError as exc:
+        logger.warning("Prediction rejected: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy. Please retry shortly.",
+            headers={"Retry-After": "1"},
+        ) from exc
+    except ValueError as exc:
+        logger.warning("Invalid prediction input: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+    except Exception as exc:
+        logger.exception("Unexpected error during prediction: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred during prediction. Please try again.",
+        ) from exc
+
+
+async def _predict_fast(request: Request) -> Response | None:
+    """Serves a valid JSON /predict body without FastAPI's pydantic round-trips.
+
+    Decodes a canonical body with ``decode_prediction`` instead of building a
+    PredictionRequest (any other body, or every body while coalescing needs
+    the request object, is validated with ``model_validate_json``), times
+    that as the ``validation`` stage, and writes the response with the
+    model's serializer instead of re-validating it against
+    ``response_model``. Declines (returns None) when the fast path is
+    disabled, the body is not JSON, or it fails validation, so the standard
+    handler reports the 422.
+    """
+    if not settings.fast_path_enabled:
+        return None
+    if not is_json_content(request.headers.get("content-type")):
+        return None
+    body = await request.body()
+    start = time.perf_counter()
+    decoded = None if settings.coalesce_enabled else decode_prediction(body)
+    validated = None
+    if decoded is None:
+        from app.services.prediction_cache import request_values
+
+        try:
+            validated = PredictionRequest.model_validate_json(body)
+        except ValidationError:
+            return None
+        decoded = (validated.location.value, request_values(validated))
+    VALIDATION_STAGE.observe(time.perf_counter() - start)
+
+    result = await _serve_prediction(*decoded, validated)
+    return Response(_RESPONSE_SERIALIZER.to_json(result), media_type="application/json")
+
+
+async def predict_price(request: PredictionRequest) -> PredictionResponse:
+    """Predicts property price based on provided features.
+
+    Valid JSON bodies are answered by ``_predict_fast`` before this handler
+    runs; it serves everything else, and every request while the fast path
+    is disabled.
+
+    Args:
+        request: Validated prediction request containing property attributes.
+
+    Returns:
+        PredictionResponse with price estimate and confidence interval.
+
+    Raises:
+        HTTPException 503: If the ML model is not loaded or the inference
+            queue is full.
+        HTTPException 422: Automatically raised by FastAPI for invalid inputs.
+        HTTPException 500: For unexpected inference errors.
+    """
+    from app.services.prediction_cache import request_values
+
+    return await _serve_prediction(request.location.value, request_values(request), request)
+
+
+router.add_api_route(
     "/predict",
+    predict_price,
+    methods=["POST"],
     response_model=PredictionResponse,
     status_code=status.HTTP_200_OK,
     summary="Predict House Price",
@@ -32,49 +187,303 @@ router = APIRouter()
         "in INR for a property in Navi Mumbai."
     ),
     tags=["Prediction"],
+    route_class_override=fast_path_route(_predict_fast),
 )
-async def predict_price(request: PredictionRequest) -> PredictionResponse:
-    """Predicts property price based on provided features.
+
+
+@router.post(
+    "/predict/batch",
+    response_model=BatchPredictionResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Predict House Prices in Batch",
+    description=(
+        "Accepts a list of property feature sets and prices all of them in a "
+        "single vectorized inference call. Rows that cannot be priced are "
+        "reported individually without failing the whole batch."
+    ),
+    tags=["Prediction"],
+)
+async def predict_price_batch(request: BatchPredictionRequest) -> BatchPredictionResponse:
+    """Predicts property prices for a batch of feature sets.
 
     Args:
-        request: Validated prediction request containing property attributes.
+        request: Validated batch request containing property attributes per row.
 
     Returns:
-        PredictionResponse with price estimate and confidence interval.
+        BatchPredictionResponse with a result or error for every row.
 
     Raises:
-        HTTPException 503: If the ML model is not loaded.
-        HTTPException 422: Automatically raised by FastAPI for invalid inputs.
+        HTTPException 503: If the ML model is not loaded or the inference
+            queue is full.
+        HTTPException 400: If the batch exceeds the configured maximum size.
         HTTPException 500: For unexpected inference errors.
     """
+    from app.services.inference_executor import ExecutorSaturatedError, inference_executor
+    from app.services.ml_service import ml_service
+    from app.services.prediction_log import prediction_log
+
     if not ml_service.is_loaded:
-        logger.error("Prediction attempted but model is not loaded.")
+        logger.error("Batch prediction attempted but model is not loaded.")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="ML model is not ready. Please try again in a moment.",
+        )
+
+    if len(request.items) > settings.max_batch_size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"Batch of {len(request.items)} rows exceeds the maximum "
+                f"of {settings.max_batch_size}."
+            ),
+        )
+
+    try:
+        logger.info("Batch prediction request: %d rows", len(request.items))
+        start = time.perf_counter()
+        results = await inference_executor.predict_batch(request.items)
+    except ExecutorSaturatedError as exc:
+        logger.warning("Batch prediction rejected: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy. Please retry shortly.",
+            headers={"Retry-After": "1"},
+        ) from exc
+    except Exception as exc:
+        logger.exception("Unexpected error during batch prediction: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred during prediction. Please try again.",
+        ) from exc
+
+    if prediction_log.enabled:
+        prediction_log.record_many(
+            "predict/batch",
+            [
+                (request.items[item.index], item.prediction)
+                for item in results
+                if item.prediction is not None
+            ],
+            ml_service.version,
+            time.perf_counter() - start,
+        )
+    failed = sum(1 for item in results if item.error is not None)
+    logger.info("Batch prediction complete: %d ok, %d failed", len(results) - failed, failed)
+    return BatchPredictionResponse(
+        results=results,
+        total=len(results),
+        succeeded=len(results) - failed,
+        failed=failed,
+    )
+
+
+def _sweep_chunks(request: SweepRequest, chunk_points: int) -> list[SweepRequest]:
+    """Splits a sweep along its first axis into sweeps of about ``chunk_points``."""
+    first, *rest = request.axes
+    row_points = rest[0].size if rest else 1
+    rows = max(1, chunk_points // row_points)
+    points = first.points()
+    chunks = []
+    for start in range(0, len(points), rows):
+        part = points[start:start + rows]
+        axis = (
+            SweepAxis(feature="location", locations=part)
+            if first.feature == "location"
+            else SweepAxis(feature=first.feature, values=part)
+        )
+        chunks.append(request.model_copy(update={"axes": [axis, *rest]}))
+    return chunks
+
+
+async def _stream_sweep(
+    request: SweepRequest, first: SweepResponse, chunks: list[SweepRequest]
+) -> AsyncIterator[str]:
+    """Yields a sweep as NDJSON: a header, one line per first-axis value, a summary.
+
+    The status line is already sent, so a failure after the header is reported
+    as a final ``{"error": ...}`` line instead of the summary.
+    """
+    from app.services.inference_executor import ExecutorSaturatedError, inference_executor
+
+    header = {
+        "axes": [{"feature": a.feature, "values": a.points()} for a in request.axes],
+        "points": request.size,
+        "artifact_version": first.artifact_version,
+    }
+    yield json.dumps(header) + "\n"
+
+    index, priced, errors = 0, 0, []
+    result = first
+    for chunk in [None, *chunks]:
+        if chunk is not None:
+            try:
+                result = await inference_executor.sweep(chunk)
+            except ExecutorSaturatedError as exc:
+                logger.warning("Streamed sweep aborted: %s", exc)
+                yield json.dumps({"error": f"Sweep aborted: {exc}"}) + "\n"
+                return
+            except Exception as exc:
+                logger.exception("Unexpected error during streamed sweep: %s", exc)
+                yield json.dumps({"error": "Sweep aborted: an error occurred."}) + "\n"
+                return
+        key = "prices" if len(request.axes) == 2 else "price"
+        for value, prices in zip(result.axes[0].values, result.prices):
+            yield json.dumps({"index": index, "value": value, key: prices}) + "\n"
+            index += 1
+        priced += result.priced
+        errors.extend(e for e in result.errors if e not in errors)
+    yield json.dumps({"points": request.size, "priced": priced, "errors": errors}) + "\n"
+
+
+@router.post(
+    "/predict/sweep",
+    response_model=SweepResponse,
+    status_code=status.HTTP_200_OK,
+    summary="What-if Price Sweep",
+    description=(
+        "Varies one or two features of a base property over a numeric range "
+        "or a set of locations and prices the whole curve or grid in one "
+        "batched inference call. With ?stream=true the grid is returned as "
+        "newline-delimited JSON, one line per value of the first axis, ending "
+        "with a summary line, or an error line if pricing fails mid-stream."
+    ),
+    tags=["Prediction"],
+)
+async def sweep_price(
+    request: SweepRequest, stream: bool = False
+) -> SweepResponse | StreamingResponse:
+    """Prices a what-if curve or grid around a base property.
+
+    Args:
+        request: Validated sweep request with the base property and axes.
+        stream: Stream the grid as NDJSON, priced in chunks.
+
+    Returns:
+        SweepResponse, or a streaming NDJSON response if ``stream`` is set.
+
+    Raises:
+        HTTPException 503: If the ML model is not loaded or the inference
+            queue is full.
+        HTTPException 400: If the grid is too large or the base location is
+            not supported.
+        HTTPException 500: For unexpected inference errors.
+    """
+    from app.services.inference_executor import ExecutorSaturatedError, inference_executor
+    from app.services.ml_service import ml_service
+
+    if not ml_service.is_loaded:
+        logger.error("Sweep attempted but model is not loaded.")
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="ML model is not ready. Please try again in a moment.",
         )
 
+    limit = settings.max_sweep_stream_points if stream else settings.max_sweep_points
+    if request.size > limit:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"Sweep of {request.size} points exceeds the maximum of {limit}"
+                + ("." if stream else "; use ?stream=true for larger grids.")
+            ),
+        )
+
     try:
         logger.info(
-            "Prediction request: location=%s area=%.1f bhk=%d",
-            request.location.value,
-            request.area_sqft,
-            request.bhk,
+            "Sweep request: %s (%d points%s)",
+            " x ".join(axis.feature for axis in request.axes),
+            request.size,
+            ", streamed" if stream else "",
         )
-        result = ml_service.predict(request)
-        logger.info("Prediction result: ₹%.0f", result.predicted_price)
-        return result
+        if not stream:
+            return await inference_executor.sweep(request)
+        chunks = _sweep_chunks(request, settings.sweep_stream_chunk_points)
+        # Price the first chunk before streaming, so errors still get a status code.
+        first = await inference_executor.sweep(chunks[0])
+        return StreamingResponse(
+            _stream_sweep(request, first, chunks[1:]), media_type="application/x-ndjson"
+        )
+    except ExecutorSaturatedError as exc:
+        logger.warning("Sweep rejected: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy. Please retry shortly.",
+            headers={"Retry-After": "1"},
+        ) from exc
     except ValueError as exc:
-        logger.warning("Invalid prediction input: %s", exc)
+        logger.warning("Invalid sweep input: %s", exc)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(exc),
         ) from exc
     except Exception as exc:
-        logger.exception("Unexpected error during prediction: %s", exc)
+        logger.exception("Unexpected error during sweep: %s", exc)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An error occurred during prediction. Please try again.",
+            detail="An error occurred during the sweep. Please try again.",
+        ) from exc
+
+
+@router.post(
+    "/predict/explain",
+    response_model=ExplanationResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Explain House Price Prediction",
+    description=(
+        "Accepts property features and returns how much each feature moved "
+        "the predicted price away from the model's average prediction."
+    ),
+    tags=["Prediction"],
+)
+async def explain_price(request: PredictionRequest) -> ExplanationResponse:
+    """Attributes a property's predicted price to its features.
+
+    Args:
+        request: Validated prediction request containing property attributes.
+
+    Returns:
+        ExplanationResponse with per-feature contributions in INR.
+
+    Raises:
+        HTTPException 503: If the ML model is not loaded or the inference
+            queue is full.
+        HTTPException 400: If the location is not supported by the model.
+        HTTPException 409: If the serving model cannot be explained.
+        HTTPException 500: For unexpected errors.
+    """
+    from app.services.inference_executor import ExecutorSaturatedError, inference_executor
+    from app.services.ml_service import ExplanationUnavailableError, ml_service
+
+    if not ml_service.is_loaded:
+        logger.error("Explanation attempted but model is not loaded.")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="ML model is not ready. Please try again in a moment.",
+        )
+
+    try:
+        return await inference_executor.explain(request)
+    except ExecutorSaturatedError as exc:
+        logger.warning("Explanation rejected: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy. Please retry shortly.",
+            headers={"Retry-After": "1"},
+        ) from exc
+    except ExplanationUnavailableError as exc:
+        logger.warning("Explanation unavailable: %s", exc)
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    except ValueError as exc:
+        logger.warning("Invalid explanation input: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+    except Exception as exc:
+        logger.exception("Unexpected error during explanation: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while explaining the prediction. Please try again.",
         ) from exc
 
 
@@ -91,16 +500,79 @@ async def get_locations() -> LocationsResponse:
     Returns:
         LocationsResponse with sorted list of location strings.
     """
+    from app.services.ml_service import ml_service
+
     if ml_service.is_loaded:
-        # Use actual classes from the trained label encoder
-        locations = ml_service.get_known_locations()
-        # Capitalize for display
-        locations = [loc.title() if loc != "cbd belapur" else "CBD Belapur" for loc in locations]
+        # Display names of the label-encoder classes, precomputed at load
+        locations = ml_service.get_location_names()
     else:
         # Fallback to Enum values if model not loaded
-        locations = [loc.value for loc in NaviMumbaiLocation]
-    
-    return LocationsResponse(locations=sorted(locations), total=len(locations))
+        locations = _ENUM_LOCATIONS
+    return LocationsResponse(locations=locations, total=len(locations))
+
+
+@router.post(
+    "/locations/compare",
+    response_model=LocationComparisonResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Compare Localities",
+    description=(
+        "Prices the given property in every locality the model supports and "
+        "ranks them by predicted price or price per sqft, alongside listing "
+        "statistics of each locality from the training data."
+    ),
+    tags=["Prediction"],
+)
+async def compare_locations(
+    request: PredictionRequest, sort_by: Literal["price", "price_per_sqft"] = "price"
+) -> LocationComparisonResponse:
+    """Ranks all supported localities for one property spec.
+
+    Args:
+        request: Validated prediction request; every other field is kept
+            fixed while the location varies.
+        sort_by: Rank by ``price`` or ``price_per_sqft``, highest first.
+
+    Returns:
+        LocationComparisonResponse with one ranked item per locality.
+
+    Raises:
+        HTTPException 503: If the ML model is not loaded or the inference
+            queue is full.
+        HTTPException 400: If the location is not supported by the model.
+        HTTPException 500: For unexpected inference errors.
+    """
+    from app.services.inference_executor import ExecutorSaturatedError, inference_executor
+    from app.services.ml_service import ml_service
+
+    if not ml_service.is_loaded:
+        logger.error("Location comparison attempted but model is not loaded.")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="ML model is not ready. Please try again in a moment.",
+        )
+
+    try:
+        return await inference_executor.compare_locations(request, sort_by)
+    except ExecutorSaturatedError as exc:
+        logger.warning("Location comparison rejected: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy. Please retry shortly.",
+            headers={"Retry-After": "1"},
+        ) from exc
+    except ValueError as exc:
+        logger.warning("Invalid location comparison input: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+    except Exception as exc:
+        logger.exception("Unexpected error during location comparison: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while comparing localities. Please try again.",
+        ) from exc
 
 
 @router.get(
@@ -119,6 +591,8 @@ async def get_model_info() -> ModelInfoResponse:
     Raises:
         HTTPException 503: If the model is not loaded.
     """
+    from app.services.ml_service import ml_service
+
     if not ml_service.is_loaded:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
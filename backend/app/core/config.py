@@ -1,6 +1,6 @@
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Literal, Union
 from pydantic import field_validator
 from pydantic_settings import BaseSettings
 
@@ -13,6 +13,9 @@ class Settings(BaseSettings):
     app_version: str = "1.0.0"
     api_v1_prefix: str = "/api/v1"
     debug: bool = False
+    # "blocking" loads model artifacts before serving; "background" binds the
+    # port immediately and reports "degraded" on /health until loading ends
+    startup_mode: Literal["blocking", "background"] = "blocking"
 
     # CORS configuration
     allowed_origins: Union[list[str], str] = [
@@ -40,6 +43,89 @@ class Settings(BaseSettings):
     model_path: Path = Path(__file__).parent.parent.parent / "models/model.pkl"
     scaler_path: Path = Path(__file__).parent.parent.parent / "models/scaler.pkl"
     label_encoder_path: Path = Path(__file__).parent.parent.parent / "models/label_encoder.pkl"
+    bundle_dir: Path = Path(__file__).parent.parent.parent / "models/bundle"
+    quantile_models_path: Path = Path(__file__).parent.parent.parent / "models/quantiles.pkl"
+    location_stats_path: Path = Path(__file__).parent.parent.parent / "models/location_stats.json"
+    training_metadata_path: Path = (
+        Path(__file__).parent.parent.parent / "models/training_metadata.json"
+    )
+    # "pickle" loads the three .pkl files; "bundle" memory-maps models/bundle
+    artifact_format: Literal["pickle", "bundle"] = "pickle"
+
+    # Model hot-swap. Reloaded artifacts must score at least canary_min_r2 on
+    # the first canary_rows rows of the CSV before they replace the live ones.
+    # POST /admin/reload requires "Authorization: Bearer <admin_token>" and is
+    # disabled while admin_token is unset.
+    admin_token: str | None = None
+    canary_csv_path: Path = (
+        Path(__file__).parent.parent.parent.parent / "navi_mumbai_real_estate_uncleaned_2500_cleaned.csv"
+    )
+    canary_rows: int = 200
+    canary_min_r2: float = 0.5
+    # Poll the artifact files in model_dir and hot-swap when they change
+    model_watch_enabled: bool = False
+    model_watch_interval_seconds: float = 5.0
+
+    # Inference configuration
+    max_batch_size: int = 1000
+    # Largest /predict/sweep grid returned in one response; streamed sweeps
+    # (?stream=true) may reach max_sweep_stream_points, priced in chunks of
+    # about sweep_stream_chunk_points
+    max_sweep_points: int = 10_000
+    max_sweep_stream_points: int = 250_000
+    sweep_stream_chunk_points: int = 5_000
+    # Serve price ranges from the 10th/90th percentile models when they exist;
+    # otherwise (or when disabled) the range is a fixed ±8% of the price
+    prediction_intervals: bool = True
+    # "sklearn" calls model.predict; "compiled" evaluates flat tree arrays
+    inference_engine: Literal["sklearn", "compiled"] = "sklearn"
+    # Fold the StandardScaler into the compiled tree thresholds at load time
+    fold_scaler: bool = True
+    # Where inference runs: the event loop ("inline"), a thread pool or a
+    # process pool; calls beyond workers + max_queue are rejected with 503
+    inference_mode: Literal["inline", "thread", "process"] = "inline"
+    inference_workers: int = 2
+    inference_max_queue: int = 64
+    # Coalesce concurrent /predict calls into one batch per window
+    coalesce_enabled: bool = False
+    coalesce_window_ms: float = 2.0
+    coalesce_max_batch_size: int = 64
+    # Decode canonical /predict bodies directly instead of through FastAPI's
+    # pydantic round-trips; other bodies take the standard path unchanged
+    fast_path_enabled: bool = True
+
+    # Prediction log for drift analysis and retraining. Every priced
+    # /predict and /predict/batch row is buffered in memory and appended in
+    # bulk by a background task to a JSONL file and, if set, a SQLite
+    # database. At most prediction_log_max_queue records wait for a flush;
+    # beyond that they are dropped rather than delaying requests.
+    prediction_log_enabled: bool = False
+    prediction_log_path: Path = Path(__file__).parent.parent.parent / "logs/predictions.jsonl"
+    prediction_log_sqlite_path: Path | None = None
+    prediction_log_max_queue: int = 10_000
+    prediction_log_flush_interval_seconds: float = 1.0
+    prediction_log_flush_batch_size: int = 1_000
+
+    # Prometheus metrics at GET /metrics: per-route request counters and
+    # latency, and per-stage timing of single predictions
+    metrics_enabled: bool = True
+
+    # Prediction cache (size 0 disables it)
+    prediction_cache_size: int = 1024
+    prediction_cache_ttl_seconds: float = 3600.0
+
+    # Precomputed price lattice. Location, BHK, bathrooms, parking and lift
+    # always span their full domain; the axes below are configurable.
+    lattice_enabled: bool = False
+    lattice_path: Path = Path(__file__).parent.parent.parent / "models/price_lattice.npy"
+    lattice_build_on_startup: bool = True
+    lattice_exact_fallback: bool = True
+    lattice_area_min: float = 300.0
+    lattice_area_max: float = 3000.0
+    lattice_area_step: float = 50.0
+    lattice_floor_values: list[int] = [0, 2, 5, 10]
+    lattice_total_floors_values: list[int] = [5, 10, 15, 20]
+    lattice_age_values: list[int] = [0, 5, 10]
 
     model_config = {
         "env_file": ".env",
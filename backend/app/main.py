@@ -4,6 +4,7 @@ Configures app metadata, middleware, CORS, startup/shutdown lifecycle,
 and registers all API routers. Follows Google Python Style Guide.
 """
 
+import asyncio
 import logging
 import logging.config
 from contextlib import asynccontextmanager
@@ -14,9 +15,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 
-from app.api.routes import health, predict
+from app.api.routes import admin, health, metrics, predict
 from app.core.config import get_settings
-from app.services.ml_service import ml_service
+from app.core.metrics import MetricsMiddleware
 
 # ── Logging Configuration ────────────────────────────────────────────────────
 
@@ -35,21 +36,62 @@ settings = get_settings()
 # ── Lifespan ─────────────────────────────────────────────────────────────────
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    """Handles application startup and shutdown lifecycle.
+def load_artifacts() -> None:
+    """Loads ML model artifacts and starts the inference executor.
 
-    Loads ML model artifacts on startup so the first request is fast.
+    The service modules (numpy, and scikit-learn via unpickling) are imported
+    here rather than at module level, so importing ``app.main`` stays cheap.
+    The route modules follow the same rule and import them inside handlers.
     """
-    logger.info("Starting %s v%s", settings.app_name, settings.app_version)
+    from app.services.inference_executor import inference_executor
+    from app.services.ml_service import ml_service
+
     try:
         ml_service.load()
         logger.info("ML model loaded successfully on startup.")
     except Exception as exc:
         logger.error("Failed to load ML model on startup: %s", exc)
         # Application still starts; health check will report degraded status.
+    inference_executor.start()
+
+    if settings.model_watch_enabled:
+        from app.services.model_watcher import model_watcher
+
+        model_watcher.start()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Handles application startup and shutdown lifecycle.
+
+    In ``blocking`` startup mode, loads ML model artifacts before serving so
+    the first request is fast. In ``background`` mode, loads them in a worker
+    thread so the server binds immediately; /health reports ``degraded`` and
+    prediction routes return 503 until loading finishes.
+    """
+    logger.info("Starting %s v%s", settings.app_name, settings.app_version)
+    load_task: asyncio.Task | None = None
+    if settings.startup_mode == "background":
+        logger.info("Loading ML model artifacts in the background.")
+        load_task = asyncio.create_task(asyncio.to_thread(load_artifacts))
+    else:
+        load_artifacts()
     yield
     logger.info("Application shutting down.")
+    if load_task is not None:
+        # A loading thread cannot be interrupted; let it finish cleanly.
+        await load_task
+
+    from app.services.inference_executor import inference_executor
+    from app.services.model_watcher import model_watcher
+
+    model_watcher.stop()
+    inference_executor.shutdown()
+    if settings.prediction_log_enabled:
+        from app.services.prediction_log import prediction_log
+
+        # Write out predictions still buffered in memory.
+        await prediction_log.close()
 
 
 # ── Application Factory ───────────────────────────────────────────────────────
@@ -67,7 +109,8 @@ def create_app() -> FastAPI:
         description=(
             "A production-grade REST API for predicting property prices "
             "in Navi Mumbai using a Gradient Boosting Regressor model "
-            "trained on 2,450 real estate listings."
+            "trained on real estate listings. GET /api/v1/model-info reports "
+            "the serving model's dataset size and holdout metrics."
         ),
         docs_url="/docs",
         redoc_url="/redoc",
@@ -88,12 +131,17 @@ def create_app() -> FastAPI:
         allow_headers=["Content-Type", "Authorization", "X-Request-ID"],
     )
 
+    # Outermost, so request counts and latency include every other layer.
+    app.add_middleware(MetricsMiddleware)
+
     # ── Routers ───────────────────────────────────────────────────────────────
 
     prefix = settings.api_v1_prefix
 
     app.include_router(health.router, prefix=prefix)
     app.include_router(predict.router, prefix=prefix)
+    app.include_router(admin.router, prefix=prefix)
+    app.include_router(metrics.router)
 
     # ── Root redirect ─────────────────────────────────────────────────────────
 
@@ -4,9 +4,12 @@ Defines strict input validation and structured response models.
 Follows Google Python Style Guide conventions.
 """
 
+import math
+from datetime import datetime
 from enum import Enum
+from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class NaviMumbaiLocation(str, Enum):
@@ -161,16 +164,259 @@ class PredictionResponse(BaseModel):
     input_summary: dict = Field(..., description="Echo of validated input features")
 
 
+class BatchPredictionRequest(BaseModel):
+    """Schema for batch house price prediction request."""
+
+    items: list[PredictionRequest] = Field(
+        ...,
+        min_length=1,
+        description="Properties to price in a single vectorized inference call",
+    )
+
+
+class BatchPredictionItem(BaseModel):
+    """Result for a single row of a batch prediction."""
+
+    index: int = Field(..., description="Position of the row in the request batch")
+    prediction: PredictionResponse | None = Field(
+        None, description="Prediction for the row, if it succeeded"
+    )
+    error: str | None = Field(None, description="Error message, if the row failed")
+
+
+class BatchPredictionResponse(BaseModel):
+    """Schema for batch house price prediction response."""
+
+    results: list[BatchPredictionItem]
+    total: int
+    succeeded: int
+    failed: int
+
+
+SweepFeature = Literal[
+    "location",
+    "area_sqft",
+    "bhk",
+    "bathrooms",
+    "floor",
+    "total_floors",
+    "age_of_property",
+    "parking",
+    "lift",
+]
+
+
+class SweepAxis(BaseModel):
+    """One axis of a what-if sweep: a numeric range or list, or a set of locations.
+
+    Numeric axes take either ``values`` or an inclusive ``start``/``stop``
+    range with ``step``; every value must satisfy the bounds of the feature
+    in PredictionRequest. Location axes take ``locations`` and default to
+    every supported locality.
+    """
+
+    feature: SweepFeature = Field(..., description="PredictionRequest field to vary")
+    start: float | None = Field(None, description="First value of a numeric range")
+    stop: float | None = Field(None, description="Last value of a numeric range (inclusive)")
+    step: float | None = Field(None, gt=0, description="Spacing of a numeric range")
+    values: list[float] | None = Field(None, min_length=1, description="Explicit numeric values")
+    locations: list[NaviMumbaiLocation] | None = Field(
+        None, min_length=1, description="Localities to compare (all when omitted)"
+    )
+
+    @model_validator(mode="after")
+    def check_axis(self) -> "SweepAxis":
+        """Validates that exactly one kind of axis is given and fits the feature."""
+        is_range = (self.start, self.stop, self.step) != (None, None, None)
+        if self.feature == "location":
+            if is_range or self.values is not None:
+                raise ValueError("A location axis takes 'locations', not numeric values.")
+            return self
+        if self.locations is not None:
+            raise ValueError(f"'locations' only applies to the location axis, not {self.feature}.")
+        if is_range == (self.values is not None):
+            raise ValueError(f"Give either 'values' or 'start', 'stop' and 'step' for {self.feature}.")
+        if is_range:
+            if None in (self.start, self.stop, self.step):
+                raise ValueError("A numeric range needs 'start', 'stop' and 'step'.")
+            if self.stop < self.start:
+                raise ValueError(f"Range stop ({self.stop}) is below start ({self.start}).")
+            low, high = self.start, self.stop
+        else:
+            low, high = min(self.values), max(self.values)
+
+        field = PredictionRequest.model_fields[self.feature]
+        bounds = {
+            name: getattr(m, name) for m in field.metadata for name in ("ge", "le") if hasattr(m, name)
+        }
+        if low < bounds.get("ge", -math.inf) or high > bounds.get("le", math.inf):
+            raise ValueError(
+                f"{self.feature} must stay within [{bounds.get('ge')}, {bounds.get('le')}]."
+            )
+        # A range of whole numbers has a whole start and step; checking those
+        # avoids expanding the range.
+        defining = [self.start, self.step] if is_range else self.values
+        if field.annotation is int and any(v != int(v) for v in defining):
+            raise ValueError(f"{self.feature} only takes whole numbers.")
+        return self
+
+    @property
+    def size(self) -> int:
+        """Returns the number of points on the axis without expanding it."""
+        if self.feature == "location":
+            return len(self.locations) if self.locations is not None else len(NaviMumbaiLocation)
+        if self.values is not None:
+            return len(self.values)
+        return math.floor((self.stop - self.start) / self.step + 1e-9) + 1
+
+    def points(self) -> list[float] | list[str]:
+        """Returns the axis values in order (location names for location axes)."""
+        if self.feature == "location":
+            return [loc.value for loc in self.locations or NaviMumbaiLocation]
+        if self.values is not None:
+            return list(self.values)
+        return [round(self.start + i * self.step, 6) for i in range(self.size)]
+
+
+class SweepRequest(BaseModel):
+    """Schema for a what-if sweep over one or two features of a base property."""
+
+    base: PredictionRequest = Field(..., description="Property whose other features stay fixed")
+    axes: list[SweepAxis] = Field(..., min_length=1, max_length=2, description="Features to vary")
+
+    @model_validator(mode="after")
+    def axes_must_differ(self) -> "SweepRequest":
+        """Validates that no feature is swept twice."""
+        if len({axis.feature for axis in self.axes}) != len(self.axes):
+            raise ValueError("Each feature can be swept by at most one axis.")
+        return self
+
+    @property
+    def size(self) -> int:
+        """Returns the number of grid points."""
+        return math.prod(axis.size for axis in self.axes)
+
+
+class SweepAxisValues(BaseModel):
+    """Feature and values of one axis of a sweep result."""
+
+    feature: str
+    values: list[float] | list[str]
+
+
+class SweepResponse(BaseModel):
+    """Schema for the what-if sweep endpoint."""
+
+    axes: list[SweepAxisValues]
+    prices: list[float | None] | list[list[float | None]] = Field(
+        ...,
+        description=(
+            "Predicted price in INR per point: a curve for one axis, or a grid "
+            "indexed [first axis][second axis]; null where the point is invalid"
+        ),
+    )
+    points: int = Field(..., description="Number of grid points")
+    priced: int = Field(..., description="Number of points that were priced")
+    errors: list[str] = Field(default_factory=list, description="Why points were skipped")
+    artifact_version: str | None = Field(
+        None, description="Content hash of the model artifacts that priced the sweep"
+    )
+
+
+class LocationMarketStats(BaseModel):
+    """Listing price statistics of one locality in the training data."""
+
+    listings: int = Field(..., description="Number of training listings in the locality")
+    median_price: float = Field(..., description="Median listing price in INR")
+    median_price_per_sqft: float = Field(..., description="Median listing price per sqft in INR")
+    price_per_sqft_p10: float = Field(..., description="10th percentile listing price per sqft")
+    price_per_sqft_p25: float = Field(..., description="25th percentile listing price per sqft")
+    price_per_sqft_p75: float = Field(..., description="75th percentile listing price per sqft")
+    price_per_sqft_p90: float = Field(..., description="90th percentile listing price per sqft")
+
+
+class LocationComparisonItem(BaseModel):
+    """The requested property priced in one locality."""
+
+    rank: int = Field(..., description="1 for the most expensive locality by ``sort_by``")
+    location: str
+    predicted_price: float = Field(..., description="Predicted price in INR")
+    price_per_sqft: float = Field(..., description="Predicted price per square foot in INR")
+    vs_market_median: float | None = Field(
+        None,
+        description=(
+            "Predicted price per sqft relative to the locality's median listing "
+            "(0.1 = 10% above); null without market statistics"
+        ),
+    )
+    market: LocationMarketStats | None = Field(
+        None, description="Listing statistics of the locality, if recorded at training time"
+    )
+
+
+class LocationComparisonResponse(BaseModel):
+    """Schema for the locality comparison endpoint."""
+
+    sort_by: Literal["price", "price_per_sqft"]
+    selected_location: str = Field(..., description="Location of the request")
+    selected_rank: int | None = Field(
+        None, description="Rank of the request's location, if the model supports it"
+    )
+    locations: list[LocationComparisonItem]
+    total: int
+    artifact_version: str | None = Field(
+        None, description="Content hash of the model artifacts that priced the comparison"
+    )
+
+
+class FeatureContributionItem(BaseModel):
+    """Contribution of a single feature to one prediction."""
+
+    name: str
+    display_name: str
+    value: float | str = Field(..., description="Input value of the feature")
+    contribution: float = Field(
+        ..., description="Change in predicted price (INR) attributed to the feature"
+    )
+
+
+class ExplanationResponse(BaseModel):
+    """Schema for the prediction explanation endpoint."""
+
+    predicted_price: float = Field(..., description="Model output in INR being explained")
+    base_price: float = Field(
+        ..., description="Average model output over the training data in INR"
+    )
+    contributions: list[FeatureContributionItem] = Field(
+        ...,
+        description=(
+            "Per-feature contributions, largest magnitude first; they sum to "
+            "predicted_price - base_price"
+        ),
+    )
+    artifact_version: str | None = Field(
+        None, description="Content hash of the model artifacts that were explained"
+    )
+
+
 class ModelInfoResponse(BaseModel):
     """Schema for model information endpoint."""
 
     model_name: str
-    model_version: str
+    model_version: str = Field(..., description="When the serving model was last trained")
     task_type: str
-    dataset_rows: int
+    dataset_rows: int | None = Field(
+        None, description="Listings the model was trained and evaluated on"
+    )
     features: list[str]
-    metrics: ModelMetrics
+    metrics: ModelMetrics | None = Field(
+        None, description="Holdout metrics recorded at training time"
+    )
     feature_importance: list[FeatureImportanceItem]
+    artifact_version: str | None = Field(
+        None, description="Content hash of the model artifacts currently serving"
+    )
+    loaded_at: datetime | None = Field(None, description="When the serving artifacts were loaded")
 
 
 class HealthResponse(BaseModel):
@@ -180,6 +426,25 @@ class HealthResponse(BaseModel):
     model_loaded: bool
     version: str
     message: str
+    artifact_version: str | None = Field(
+        None, description="Content hash of the model artifacts currently serving"
+    )
+
+
+class ReloadResponse(BaseModel):
+    """Schema for the model reload endpoint."""
+
+    status: str = Field(..., description="'reloaded', or 'unchanged' if the artifacts are identical")
+    previous_version: str | None = Field(None, description="Artifact version served before the reload")
+    artifact_version: str = Field(..., description="Artifact version served after the reload")
+    loaded_at: datetime = Field(..., description="When the serving artifacts were loaded")
+    canary_rows: int = Field(0, description="Number of CSV rows the new artifacts were validated on")
+    canary_r2: float | None = Field(None, description="R² of the new artifacts on the canary rows")
+    duration_s: float = Field(..., description="Time spent loading and validating")
+    warnings: list[str] = Field(
+        default_factory=list,
+        description="Post-swap failures, e.g. inference workers still serving the previous model",
+    )
 
 
 class LocationsResponse(BaseModel):
@@ -187,3 +452,63 @@ class LocationsResponse(BaseModel):
 
     locations: list[str]
     total: int
+
+
+class CacheStatsResponse(BaseModel):
+    """Schema for prediction cache statistics."""
+
+    enabled: bool
+    size: int
+    max_size: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    hit_rate: float
+    evictions: int
+    expirations: int
+    invalidations: int
+
+
+class LatticeStatsResponse(BaseModel):
+    """Schema for precomputed price lattice statistics."""
+
+    enabled: bool
+    shape: list[int] = Field(default_factory=list)
+    points: int = 0
+    nbytes: int = Field(0, description="Memory footprint of the lattice table in bytes")
+    build_time_s: float = 0.0
+    mean_abs_error: float = Field(0.0, description="Mean absolute error vs. exact inference (INR)")
+    p99_abs_error: float = 0.0
+    max_abs_error: float = 0.0
+    mean_rel_error: float = 0.0
+
+
+class PredictionLogStatsResponse(BaseModel):
+    """Schema for prediction log statistics."""
+
+    enabled: bool
+    sinks: list[str] = Field(default_factory=list, description="Configured log destinations")
+    queued: int = Field(0, description="Records buffered in memory awaiting a flush")
+    max_queue: int = Field(0, description="Buffer bound; records beyond it are dropped")
+    logged: int = Field(0, description="Records written to every sink")
+    dropped: int = Field(0, description="Records dropped because the buffer was full")
+    failed: int = Field(0, description="Records in flushes where a sink write failed")
+    flushes: int = 0
+    last_flush_ms: float = Field(0.0, description="Duration of the most recent flush (ms)")
+
+
+class CoalescerStatsResponse(BaseModel):
+    """Schema for request coalescer statistics."""
+
+    enabled: bool
+    window_ms: float = 0.0
+    max_batch_size: int = 0
+    batches: int = 0
+    requests: int = 0
+    mean_batch_size: float = 0.0
+    batch_size_histogram: dict[str, int] = Field(
+        default_factory=dict, description="Number of batches per batch-size bucket"
+    )
+    queue_delay_ms_mean: float = Field(0.0, description="Mean delay added by coalescing (ms)")
+    queue_delay_ms_p50: float = 0.0
+    queue_delay_ms_p99: float = 0.0
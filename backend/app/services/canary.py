@@ -0,0 +1,95 @@
+"""Canary rows used to validate model artifacts before they go live.
+
+Reads a fixed sample of labelled listings from the training CSV with the
+standard library (no pandas on the serving path) so that a freshly loaded
+artifact set can be scored against known prices before it replaces the
+current one.
+Follows Google Python Style Guide with full type annotations.
+"""
+
+import csv
+import logging
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Numeric feature columns in FEATURE_ORDER (location is kept separately).
+NUMERIC_COLUMNS = (
+    "area_sqft",
+    "bhk",
+    "bathrooms",
+    "floor",
+    "total_floors",
+    "age_of_property",
+    "parking",
+    "lift",
+)
+TARGET_COLUMN = "actual_price"
+
+
+class CanaryRows:
+    """Labelled listings used for pre-swap validation.
+
+    Attributes:
+        locations: Lower-cased location name per row.
+        numeric: N×8 float matrix of the non-location features.
+        prices: Actual listing price per row in INR.
+    """
+
+    def __init__(self, locations: np.ndarray, numeric: np.ndarray, prices: np.ndarray) -> None:
+        self.locations = locations
+        self.numeric = numeric
+        self.prices = prices
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+
+def load_canary_rows(csv_path: Path, limit: int) -> CanaryRows | None:
+    """Reads the first ``limit`` valid rows of the training CSV.
+
+    Column names are normalised the same way ``train_model.py`` does; rows
+    with missing or non-numeric values, or a non-positive area or price, are
+    skipped.
+
+    Args:
+        csv_path: Path to the cleaned training CSV.
+        limit: Maximum number of rows to read.
+
+    Returns:
+        CanaryRows, or None if the CSV is missing or has no usable rows.
+    """
+    if limit <= 0 or not csv_path.exists():
+        return None
+
+    locations: list[str] = []
+    rows: list[list[float]] = []
+    prices: list[float] = []
+    with open(csv_path, newline="") as f:
+        reader = csv.DictReader(f)
+        reader.fieldnames = [c.strip().lower().replace(" ", "_") for c in reader.fieldnames or []]
+        for record in reader:
+            try:
+                numeric = [float(record[c]) for c in NUMERIC_COLUMNS]
+                price = float(record[TARGET_COLUMN])
+            except (KeyError, TypeError, ValueError):
+                continue
+            location = (record.get("location") or "").strip().lower()
+            if not location or numeric[0] <= 0 or price <= 0 or not np.isfinite(numeric).all():
+                continue
+            locations.append(location)
+            rows.append(numeric)
+            prices.append(price)
+            if len(prices) >= limit:
+                break
+
+    if not prices:
+        logger.warning("No usable canary rows in %s", csv_path)
+        return None
+    return CanaryRows(
+        np.array(locations, dtype=object),
+        np.array(rows, dtype=float),
+        np.array(prices, dtype=float),
+    )
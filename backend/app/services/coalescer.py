@@ -0,0 +1,159 @@
+"""Micro-batching coalescer for concurrent single-row predictions.
+
+Collects concurrent ``/predict`` calls for up to a short window (or until a
+batch fills up), runs one vectorized ``predict_batch`` over the stacked rows
+through the inference executor, and fans the results back out to the waiting
+callers. Records the batch-size distribution and the queueing delay added.
+Follows Google Python Style Guide with full type annotations.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Sequence
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.schemas.prediction import (
+    BatchPredictionItem,
+    CoalescerStatsResponse,
+    PredictionRequest,
+    PredictionResponse,
+)
+from app.services.inference_executor import inference_executor
+
+logger = logging.getLogger(__name__)
+
+BatchPredictor = Callable[[Sequence[PredictionRequest]], Awaitable[list[BatchPredictionItem]]]
+
+# Upper bounds of the batch-size histogram buckets.
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class PredictionCoalescer:
+    """Coalesces concurrent single predictions into vectorized batches."""
+
+    def __init__(
+        self,
+        predict_batch: BatchPredictor,
+        window_ms: float = 2.0,
+        max_batch_size: int = 64,
+        delay_samples: int = 4096,
+    ) -> None:
+        self._predict_batch = predict_batch
+        self._window_s = max(0.0, window_ms) / 1000.0
+        self._max_batch_size = max(1, max_batch_size)
+        self._pending: list[tuple[PredictionRequest, asyncio.Future, float]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+        self._batches = 0
+        self._requests = 0
+        self._batch_size_counts = [0] * (len(BATCH_SIZE_BUCKETS) + 1)
+        self._delays_ms: deque[float] = deque(maxlen=delay_samples)
+
+    async def submit(self, request: PredictionRequest) -> PredictionResponse:
+        """Queues a request and waits for its coalesced prediction.
+
+        Args:
+            request: Validated prediction request.
+
+        Returns:
+            The prediction for this request.
+
+        Raises:
+            ValueError: If the request's row failed (e.g. unsupported location).
+            ExecutorSaturatedError: If the inference queue rejected the batch.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((request, future, time.perf_counter()))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window_s, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Dispatches all pending requests as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list[tuple[PredictionRequest, asyncio.Future, float]]) -> None:
+        """Runs one batch prediction and resolves every waiting future.
+
+        Args:
+            batch: Pending (request, future, enqueue time) triples.
+        """
+        started = time.perf_counter()
+        self._record(len(batch), [(started - enqueued) * 1000.0 for _, _, enqueued in batch])
+
+        try:
+            results = await self._predict_batch([request for request, _, _ in batch])
+        except Exception as exc:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future, _), item in zip(batch, results):
+            if future.done():
+                continue
+            if item.prediction is not None:
+                future.set_result(item.prediction)
+            else:
+                future.set_exception(ValueError(item.error))
+
+    def _record(self, batch_size: int, delays_ms: list[float]) -> None:
+        """Updates batch-size and queueing-delay metrics."""
+        self._batches += 1
+        self._requests += batch_size
+        bucket = next(
+            (i for i, bound in enumerate(BATCH_SIZE_BUCKETS) if batch_size <= bound),
+            len(BATCH_SIZE_BUCKETS),
+        )
+        self._batch_size_counts[bucket] += 1
+        self._delays_ms.extend(delays_ms)
+
+    def stats(self) -> CoalescerStatsResponse:
+        """Returns batch-size distribution and queueing-delay statistics.
+
+        Returns:
+            CoalescerStatsResponse with counters, a batch-size histogram and
+            queueing-delay percentiles over recent requests.
+        """
+        labels = [f"<={bound}" for bound in BATCH_SIZE_BUCKETS] + [f">{BATCH_SIZE_BUCKETS[-1]}"]
+        delays = np.array(self._delays_ms) if self._delays_ms else np.zeros(1)
+        return CoalescerStatsResponse(
+            enabled=True,
+            window_ms=self._window_s * 1000.0,
+            max_batch_size=self._max_batch_size,
+            batches=self._batches,
+            requests=self._requests,
+            mean_batch_size=self._requests / self._batches if self._batches else 0.0,
+            batch_size_histogram=dict(zip(labels, self._batch_size_counts)),
+            queue_delay_ms_mean=float(delays.mean()),
+            queue_delay_ms_p50=float(np.percentile(delays, 50)),
+            queue_delay_ms_p99=float(np.percentile(delays, 99)),
+        )
+
+
+_settings = get_settings()
+
+# Module-level singleton instance
+prediction_coalescer = PredictionCoalescer(
+    inference_executor.predict_batch,
+    window_ms=_settings.coalesce_window_ms,
+    max_batch_size=_settings.coalesce_max_batch_size,
+)
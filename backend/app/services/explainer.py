@@ -0,0 +1,338 @@
+"""Per-prediction feature attribution for compiled tree ensembles.
+
+Computes path-dependent TreeSHAP values: the contribution of each feature to
+the difference between a prediction and the model's average prediction, with
+features absent from a coalition marginalized along the tree paths weighted
+by the training samples that reached each branch. The contributions of a row
+sum exactly to its prediction minus ``expected_value``.
+
+The leaf-wise formulation makes this a table lookup. For a leaf with path
+features ``U``, only two things vary between rows: for each ``j`` in ``U``,
+whether the row satisfies every split on ``j`` along the path (one bit). The
+Shapley values of the leaf depend on nothing else, so they are precomputed
+once per tree structure for all ``2 ** |U|`` bit patterns. Explaining a row
+then costs one interval test per (leaf, path feature) and one gather, all
+vectorized over leaves — the same kind of work as a prediction, on a few
+times more elements.
+Follows Google Python Style Guide with full type annotations.
+"""
+
+import math
+from typing import Any
+
+import numpy as np
+
+from app.services.tree_engine import CompiledEnsemble
+
+# Upper bound on the precomputed table; 200 trees of depth 5 need ~8 MiB.
+MAX_TABLE_BYTES = 256 * 2**20
+
+
+class PathExplainer:
+    """Path-dependent TreeSHAP for one output of a CompiledEnsemble.
+
+    Every leaf of the explained trees is described by up to ``n_slots``
+    slots, one per distinct feature split on along its path: a row satisfies
+    the path's splits on that feature iff ``low < x[feature] <= high``. The
+    satisfied slots of a leaf form a bit pattern that indexes the leaf's
+    precomputed contributions, which are then summed per feature.
+
+    Attributes:
+        expected_value: Average prediction over the training samples, i.e.
+            the prediction with every feature marginalized.
+        n_features: Number of input features expected.
+        input_dtype: Dtype inputs are cast to, matching the ensemble's
+            split comparisons.
+    """
+
+    def __init__(self, ensemble: CompiledEnsemble, output: int = 0) -> None:
+        """Precomputes the attribution table for the trees of ``output``.
+
+        Args:
+            ensemble: Compiled ensemble with node covers.
+            output: Output whose trees are explained.
+
+        Raises:
+            ValueError: If the ensemble has no node covers or the table would
+                exceed ``MAX_TABLE_BYTES``.
+        """
+        if ensemble.cover is None:
+            raise ValueError("Feature attribution needs the training cover of every node.")
+        self.n_features = ensemble.n_features
+        self.input_dtype = ensemble.input_dtype
+
+        tree_bounds = np.append(ensemble.output_starts, ensemble.n_trees)
+        node_bounds = np.append(ensemble.roots, ensemble.n_nodes)
+        start = int(node_bounds[tree_bounds[output]])
+        stop = int(node_bounds[tree_bounds[output + 1]])
+        feature = ensemble.feature[start:stop]
+        threshold = ensemble.threshold[start:stop]
+        left = ensemble.left[start:stop].astype(np.int64) - start
+        cover = ensemble.cover[start:stop]
+        value = ensemble.value[start:stop]
+
+        nodes = np.arange(stop - start)
+        internal = left != nodes
+        parent = np.full(len(nodes), -1)
+        parent[left[internal]] = nodes[internal]
+        parent[left[internal] + 1] = nodes[internal]
+        leaves = nodes[~internal]
+
+        slot_feature, low, high, zero_fraction, used = _leaf_paths(
+            leaves, parent, left, feature, threshold, cover, ensemble.max_depth
+        )
+        n_leaves, n_slots = slot_feature.shape
+        n_patterns = 2**n_slots
+        table_bytes = n_leaves * n_patterns * n_slots * 8
+        if table_bytes > MAX_TABLE_BYTES:
+            raise ValueError(
+                f"Attribution table of {table_bytes / 2**20:.0f} MiB exceeds the "
+                f"{MAX_TABLE_BYTES / 2**20:.0f} MiB limit; use shallower trees."
+            )
+
+        leaf_value = value[leaves]
+        self.expected_value = float(
+            ensemble.base_scores[output] + (leaf_value * zero_fraction.prod(axis=1)).sum()
+        )
+        # Laid out (leaf, slot, pattern), so a lookup index is base + pattern.
+        self._table = _shapley_table(leaf_value, zero_fraction).transpose(0, 2, 1).ravel()
+
+        # Per slot, the leaves' features and intervals; unused slots keep an
+        # unbounded interval, so they are always satisfied.
+        self._slot_feature = np.ascontiguousarray(slot_feature.T)
+        self._slot_low = np.ascontiguousarray(low.T)[:, :, None]
+        self._slot_high = np.ascontiguousarray(high.T)[:, :, None]
+        self._n_slots = n_slots
+        self._pattern_dtype = np.uint8 if n_slots <= 8 else np.uint16
+
+        # Used (leaf, slot) entries grouped by feature, for summing the
+        # looked-up contributions per feature.
+        entry_leaf, entry_slot = np.nonzero(used)
+        entry_feature = slot_feature[entry_leaf, entry_slot]
+        by_feature = np.argsort(entry_feature, kind="stable")
+        self._lookup_leaf = entry_leaf[by_feature]
+        self._lookup_base = ((entry_leaf * n_slots + entry_slot) * n_patterns)[by_feature][:, None]
+        self._feature_starts = np.flatnonzero(np.diff(entry_feature[by_feature], prepend=-1))
+        self._split_features = entry_feature[by_feature][self._feature_starts]
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the memory held by the precomputed arrays."""
+        return sum(
+            a.nbytes
+            for a in (
+                self._table,
+                self._slot_feature,
+                self._slot_low,
+                self._slot_high,
+                self._lookup_leaf,
+                self._lookup_base,
+            )
+        )
+
+    def explain(self, X: np.ndarray) -> np.ndarray:
+        """Returns the contribution of every feature for every row of ``X``.
+
+        Args:
+            X: 2-D array of shape (n_rows, n_features), in the same space as
+                the explained ensemble's inputs.
+
+        Returns:
+            Array of shape (n_rows, n_features) whose rows sum to the
+            prediction minus ``expected_value``.
+
+        Raises:
+            ValueError: If ``X`` has the wrong number of features.
+        """
+        X = np.asarray(X, dtype=self.input_dtype)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(
+                f"Expected input of shape (n_rows, {self.n_features}), got {X.shape}."
+            )
+        # Leaves and entries run along axis 0 and rows along axis 1, so the
+        # per-feature reduceat sums contiguous blocks.
+        X_by_feature = X.T
+        pattern = np.zeros((self._slot_feature.shape[1], len(X)), dtype=self._pattern_dtype)
+        for slot in range(self._n_slots):
+            x = X_by_feature.take(self._slot_feature[slot], axis=0)
+            satisfied = (x > self._slot_low[slot]) & (x <= self._slot_high[slot])
+            pattern |= satisfied.astype(self._pattern_dtype) << slot
+        index = self._lookup_base + pattern.take(self._lookup_leaf, axis=0)
+        contributions = np.zeros((self.n_features, len(X)))
+        if len(self._feature_starts):
+            contributions[self._split_features] = np.add.reduceat(
+                self._table.take(index), self._feature_starts, axis=0
+            )
+        return contributions.T
+
+
+def _leaf_paths(
+    leaves: np.ndarray,
+    parent: np.ndarray,
+    left: np.ndarray,
+    feature: np.ndarray,
+    threshold: np.ndarray,
+    cover: np.ndarray,
+    max_depth: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Collapses every root-to-leaf path into one interval per distinct feature.
+
+    Args:
+        leaves: Local index of every leaf.
+        parent: Local parent index per node (-1 for roots).
+        left: Local left-child index per node.
+        feature: Split feature per node.
+        threshold: Split threshold per node.
+        cover: Training cover per node.
+        max_depth: Maximum path length.
+
+    Returns:
+        Tuple of (slot_feature, low, high, zero_fraction, used), each of
+        shape (n_leaves, n_slots). ``zero_fraction`` is the share of
+        training cover that follows the path's splits on the slot feature;
+        ``used`` marks the slots a path actually has.
+    """
+    n_leaves = len(leaves)
+    slot_feature = np.zeros((n_leaves, max(max_depth, 1)), dtype=np.int64)
+    used = np.zeros(slot_feature.shape, dtype=bool)
+    low = np.full(slot_feature.shape, -np.inf, dtype=threshold.dtype)
+    high = np.full(slot_feature.shape, np.inf, dtype=threshold.dtype)
+    zero_fraction = np.ones(slot_feature.shape)
+    n_used = np.zeros(n_leaves, dtype=np.int64)
+
+    node = leaves.copy()
+    for _ in range(max_depth):
+        rows = np.flatnonzero(parent[node] >= 0)
+        if not len(rows):
+            break
+        child = node[rows]
+        split = parent[child]
+        f = feature[split]
+        match = used[rows] & (slot_feature[rows] == f[:, None])
+        existing = match.any(axis=1)
+        slot = np.where(existing, match.argmax(axis=1), n_used[rows])
+        n_used[rows] += ~existing
+
+        went_left = child == left[split]
+        t = threshold[split]
+        slot_feature[rows, slot] = f
+        used[rows, slot] = True
+        high[rows, slot] = np.where(went_left, np.minimum(high[rows, slot], t), high[rows, slot])
+        low[rows, slot] = np.where(went_left, low[rows, slot], np.maximum(low[rows, slot], t))
+        zero_fraction[rows, slot] *= cover[child] / cover[split]
+        node[rows] = split
+
+    n_slots = max(int(n_used.max(initial=0)), 1)
+    keep = slice(0, n_slots)
+    return slot_feature[:, keep], low[:, keep], high[:, keep], zero_fraction[:, keep], used[:, keep]
+
+
+def _shapley_table(leaf_value: np.ndarray, zero_fraction: np.ndarray) -> np.ndarray:
+    """Computes every leaf's Shapley values for every pattern of satisfied slots.
+
+    For leaf value ``v``, zero fractions ``z`` and satisfied bits ``o``, the
+    leaf's term of the path-dependent value function is
+    ``v * prod_j (o_j if j in S else z_j)``, whose Shapley value for slot
+    ``i`` over ``d`` slots is
+
+        v * sum_{S ⊆ slots \\ {i}} |S|! (d - |S| - 1)! / d!
+              * prod_{j in S} o_j * prod_{j not in S ∪ {i}} z_j * (o_i - z_i)
+
+    Unused slots have ``z = o = 1``, which makes them null players that
+    leave the other slots' values unchanged.
+
+    Args:
+        leaf_value: Value per leaf.
+        zero_fraction: Zero fraction per leaf and slot.
+
+    Returns:
+        Array of shape (n_leaves, 2**n_slots, n_slots).
+    """
+    n_slots = zero_fraction.shape[1]
+    subsets = np.arange(2**n_slots)
+    bits = (subsets[:, None] >> np.arange(n_slots)) & 1
+    size = bits.sum(axis=1)
+    weight = np.array(
+        [
+            math.factorial(s) * math.factorial(n_slots - s - 1) / math.factorial(n_slots)
+            if s < n_slots
+            else 0.0
+            for s in size
+        ]
+    )
+
+    # absent[S, i, j]: slot j keeps its zero fraction in the terms of slot i.
+    absent = (bits[:, None, :] == 0) & ~np.eye(n_slots, dtype=bool)[None]
+    absent_product = np.ones((len(leaf_value), len(subsets), n_slots))
+    for j in range(n_slots):
+        absent_product *= np.where(absent[None, :, :, j], zero_fraction[:, None, None, j], 1.0)
+    coalition_terms = absent_product * (weight[:, None] * (bits == 0))[None]
+
+    # A coalition S contributes under pattern p iff all of S is satisfied.
+    is_subset = ((subsets[None, :] & ~subsets[:, None]) == 0).astype(float)
+    summed = is_subset @ coalition_terms
+    return leaf_value[:, None, None] * summed * (bits[None] - zero_fraction[:, None, :])
+
+
+def gain_importance(ensemble: CompiledEnsemble, output: int = 0) -> np.ndarray:
+    """Computes normalized impurity-decrease importance from the compiled trees.
+
+    Matches ``GradientBoostingRegressor.feature_importances_`` for squared-
+    error trees: each split's decrease in weighted squared error, summed per
+    feature and tree, divided by the tree's root cover, averaged over trees
+    and normalized to sum to 1.
+
+    Args:
+        ensemble: Compiled ensemble with node covers.
+        output: Output whose trees are scored.
+
+    Returns:
+        Importance per feature.
+
+    Raises:
+        ValueError: If the ensemble has no node covers.
+    """
+    if ensemble.cover is None:
+        raise ValueError("Gain importance needs the training cover of every node.")
+    tree_bounds = np.append(ensemble.output_starts, ensemble.n_trees)
+    first, last = tree_bounds[output], tree_bounds[output + 1]
+    node_bounds = np.append(ensemble.roots, ensemble.n_nodes)
+    nodes = np.arange(node_bounds[first], node_bounds[last])
+    internal = nodes[ensemble.left[nodes] != nodes]
+    if not len(internal):
+        return np.zeros(ensemble.n_features)
+
+    tree_of_node = np.searchsorted(ensemble.roots, internal, side="right") - 1
+    left = ensemble.left[internal]
+    cover, value = ensemble.cover, ensemble.value
+    gain = (
+        cover[left] * value[left] ** 2
+        + cover[left + 1] * value[left + 1] ** 2
+        - cover[internal] * value[internal] ** 2
+    )
+    per_tree = np.zeros((ensemble.n_trees, ensemble.n_features))
+    np.add.at(per_tree, (tree_of_node, ensemble.feature[internal]), gain / cover[ensemble.roots[tree_of_node]])
+    # sklearn averages over trees that split at least once.
+    split_trees = np.unique(tree_of_node)
+    importance = per_tree[split_trees].mean(axis=0)
+    total = importance.sum()
+    return importance / total if total > 0 else importance
+
+
+def histogram_gain_importance(model: Any) -> np.ndarray:
+    """Computes normalized split-gain importance of a HistGradientBoostingRegressor.
+
+    Args:
+        model: Fitted sklearn HistGradientBoostingRegressor.
+
+    Returns:
+        Importance per feature, summing to 1 (all zeros if nothing was split).
+    """
+    totals = np.zeros(model.n_features_in_)
+    for stage in model._predictors:
+        for predictor in stage:
+            nodes = predictor.nodes
+            internal = ~nodes["is_leaf"].astype(bool)
+            np.add.at(totals, nodes["feature_idx"][internal], nodes["gain"][internal])
+    total = totals.sum()
+    return totals / total if total > 0 else totals
@@ -0,0 +1,318 @@
+"""Execution strategies for CPU-bound inference.
+
+Keeps model evaluation off the asyncio event loop so that health checks and
+other requests stay responsive under load. Three modes are supported:
+
+  - ``inline``:  run in the event loop thread (original behaviour).
+  - ``thread``:  run in a bounded ThreadPoolExecutor.
+  - ``process``: run in a ProcessPoolExecutor whose workers preload the model.
+
+Thread and process modes apply backpressure: once ``workers + max_queue``
+calls are in flight, further calls fail fast with ExecutorSaturatedError.
+Process workers only serve the artifact set the parent validated; if they
+cannot start, calls run inline until a reload brings them up.
+Follows Google Python Style Guide with full type annotations.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Literal, Sequence
+
+from app.core.config import get_settings
+from app.schemas.prediction import (
+    BatchPredictionItem,
+    ExplanationResponse,
+    LocationComparisonResponse,
+    PredictionRequest,
+    PredictionResponse,
+    SweepRequest,
+    SweepResponse,
+)
+from app.services.ml_service import ml_service
+from app.services.prediction_cache import RequestValues
+
+logger = logging.getLogger(__name__)
+
+InferenceMode = Literal["inline", "thread", "process"]
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when the inference queue is full and a call is rejected."""
+
+
+# ── Process worker entrypoints ───────────────────────────────────────────────
+# Executed inside pool processes, each with its own preloaded ml_service.
+
+
+def _init_worker(fingerprint: str) -> None:
+    """Loads model artifacts once per worker process.
+
+    Args:
+        fingerprint: Fingerprint of the artifacts the parent validated. The
+            files may have changed since; a worker loading anything else
+            refuses to start.
+
+    Raises:
+        RuntimeError: If the artifacts on disk are not the validated set.
+    """
+    if not ml_service.is_loaded:
+        ml_service.load()
+    if ml_service.artifacts.fingerprint != fingerprint:
+        raise RuntimeError(
+            f"Worker loaded artifacts {ml_service.artifacts.fingerprint[:12]}, "
+            f"expected {fingerprint[:12]}."
+        )
+
+
+def _worker_ping() -> bool:
+    """No-op used to start worker processes eagerly."""
+    return ml_service.is_loaded
+
+
+def _worker_predict(request: PredictionRequest) -> PredictionResponse:
+    """Runs a single prediction inside a worker process."""
+    return ml_service.predict(request)
+
+
+def _worker_predict_values(location: str, values: RequestValues) -> PredictionResponse:
+    """Runs a single pre-decoded prediction inside a worker process."""
+    return ml_service.predict_values(location, values)
+
+
+def _worker_predict_batch(requests: Sequence[PredictionRequest]) -> list[BatchPredictionItem]:
+    """Runs a batch prediction inside a worker process."""
+    return ml_service.predict_batch(requests)
+
+
+def _worker_explain(request: PredictionRequest) -> ExplanationResponse:
+    """Explains a single prediction inside a worker process."""
+    return ml_service.explain(request)
+
+
+def _worker_sweep(request: SweepRequest) -> SweepResponse:
+    """Prices a what-if sweep inside a worker process."""
+    return ml_service.sweep(request)
+
+
+def _worker_compare_locations(request: PredictionRequest, sort_by: str) -> LocationComparisonResponse:
+    """Compares localities inside a worker process."""
+    return ml_service.compare_locations(request, sort_by)
+
+
+class InferenceExecutor:
+    """Dispatches MLService calls according to the configured execution mode."""
+
+    def __init__(self, mode: InferenceMode = "inline", workers: int = 2, max_queue: int = 64) -> None:
+        self._mode: InferenceMode = mode
+        self._workers = max(1, workers)
+        self._max_queue = max(0, max_queue)
+        self._pool: Executor | None = None
+        # Guards swapping ``_pool`` in and out; pools are built outside it.
+        self._pool_lock = threading.Lock()
+        self._running = False
+        self._in_flight = 0
+        self._rejected = 0
+
+    @property
+    def mode(self) -> InferenceMode:
+        """Returns the active execution mode."""
+        return self._mode
+
+    @property
+    def capacity(self) -> int:
+        """Returns the maximum number of concurrently admitted calls."""
+        return self._workers + self._max_queue
+
+    @property
+    def in_flight(self) -> int:
+        """Returns the number of calls currently running or queued."""
+        return self._in_flight
+
+    @property
+    def rejected(self) -> int:
+        """Returns the number of calls rejected because the queue was full."""
+        return self._rejected
+
+    def configure(self, mode: InferenceMode, workers: int, max_queue: int) -> None:
+        """Changes the execution mode. Must be called while stopped.
+
+        Args:
+            mode: One of ``inline``, ``thread`` or ``process``.
+            workers: Number of pool threads or processes.
+            max_queue: Number of calls allowed to wait for a free worker.
+        """
+        if self._running:
+            raise RuntimeError("Cannot reconfigure a running inference executor.")
+        self._mode = mode
+        self._workers = max(1, workers)
+        self._max_queue = max(0, max_queue)
+
+    def _create_pool(self) -> Executor:
+        """Builds a worker pool for the configured mode, ready for traffic.
+
+        Raises:
+            RuntimeError: In process mode, if no model is loaded.
+            BrokenProcessPool: If a worker fails to load the serving artifacts.
+        """
+        if self._mode == "thread":
+            return ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="inference")
+        artifacts = ml_service.artifacts
+        if artifacts is None:
+            raise RuntimeError("No model is loaded for the workers to serve.")
+        # Spawned (not forked) workers avoid inheriting the server's threads.
+        pool = ProcessPoolExecutor(
+            max_workers=self._workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(artifacts.fingerprint,),
+        )
+        # Start every worker (and load its model) before taking traffic.
+        try:
+            for future in [pool.submit(_worker_ping) for _ in range(self._workers)]:
+                future.result()
+        except BaseException:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        return pool
+
+    def start(self) -> None:
+        """Creates the worker pool for the configured mode.
+
+        If the pool cannot start (in process mode, when no model is loaded
+        or the workers fail to load it), the failure is logged and calls run
+        inline; the next model reload starts the workers.
+        """
+        if self._running:
+            return
+        self._running = True
+        if self._mode == "inline":
+            return
+        try:
+            pool = self._create_pool()
+        except Exception as exc:
+            logger.error("Inference workers failed to start, running inline: %s", exc)
+            return
+        with self._pool_lock:
+            self._pool = pool
+        logger.info(
+            "Inference executor started: mode=%s workers=%d max_queue=%d",
+            self._mode,
+            self._workers,
+            self._max_queue,
+        )
+
+    def restart_workers(self) -> None:
+        """Replaces process workers so they serve newly swapped artifacts.
+
+        The new pool is built and its workers load the artifacts while the
+        old pool keeps serving; it is then swapped in and the old pool is
+        retired, so calls never fall back to running inline. Calls already
+        running in old workers finish there. Also starts the workers if they
+        failed to start before. No-op in inline and thread modes, which share
+        the swapped ml_service directly.
+
+        Raises:
+            RuntimeError: If the new workers fail to start; the old pool, if
+                any, keeps serving.
+        """
+        if self._mode != "process" or not self._running:
+            return
+        try:
+            new_pool = self._create_pool()
+        except Exception as exc:
+            logger.error("Inference workers failed to restart: %s", exc)
+            raise RuntimeError(f"Inference workers failed to restart: {exc}") from exc
+        with self._pool_lock:
+            old_pool = self._pool
+            running = self._running
+            if running:
+                self._pool = new_pool
+        if not running:
+            # Shut down while the new workers were starting.
+            new_pool.shutdown(wait=False, cancel_futures=True)
+            return
+        if old_pool is not None:
+            old_pool.shutdown(wait=False)
+        logger.info("Restarted inference workers after model reload.")
+
+    def shutdown(self) -> None:
+        """Stops the worker pool, waiting for running calls to finish."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+            self._running = False
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    async def _run(self, local_fn: Callable[..., Any], worker_fn: Callable[..., Any], *args: Any) -> Any:
+        """Runs a call in the configured mode, enforcing the queue bound.
+
+        Args:
+            local_fn: Callable used in inline and thread modes.
+            worker_fn: Picklable module-level callable used in process mode.
+            *args: Arguments for the call.
+
+        Returns:
+            The call's result.
+
+        Raises:
+            ExecutorSaturatedError: If ``capacity`` calls are already in flight.
+        """
+        pool = self._pool
+        if pool is None:
+            return local_fn(*args)
+
+        if self._in_flight >= self.capacity:
+            self._rejected += 1
+            raise ExecutorSaturatedError(
+                f"Inference queue is full ({self._in_flight} calls in flight)."
+            )
+
+        fn = worker_fn if self._mode == "process" else local_fn
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(pool, fn, *args)
+        finally:
+            self._in_flight -= 1
+
+    async def predict(self, request: PredictionRequest) -> PredictionResponse:
+        """Runs ``MLService.predict`` in the configured mode."""
+        return await self._run(ml_service.predict, _worker_predict, request)
+
+    async def predict_values(self, location: str, values: RequestValues) -> PredictionResponse:
+        """Runs ``MLService.predict_values`` in the configured mode."""
+        return await self._run(ml_service.predict_values, _worker_predict_values, location, values)
+
+    async def predict_batch(self, requests: Sequence[PredictionRequest]) -> list[BatchPredictionItem]:
+        """Runs ``MLService.predict_batch`` in the configured mode."""
+        return await self._run(ml_service.predict_batch, _worker_predict_batch, requests)
+
+    async def sweep(self, request: SweepRequest) -> SweepResponse:
+        """Runs ``MLService.sweep`` in the configured mode."""
+        return await self._run(ml_service.sweep, _worker_sweep, request)
+
+    async def compare_locations(
+        self, request: PredictionRequest, sort_by: str
+    ) -> LocationComparisonResponse:
+        """Runs ``MLService.compare_locations`` in the configured mode."""
+        return await self._run(
+            ml_service.compare_locations, _worker_compare_locations, request, sort_by
+        )
+
+    async def explain(self, request: PredictionRequest) -> ExplanationResponse:
+        """Runs ``MLService.explain`` in the configured mode."""
+        return await self._run(ml_service.explain, _worker_explain, request)
+
+
+_settings = get_settings()
+
+# Module-level singleton instance
+inference_executor = InferenceExecutor(
+    mode=_settings.inference_mode,
+    workers=_settings.inference_workers,
+    max_queue=_settings.inference_max_queue,
+)
+ml_service.on_reload(inference_executor.restart_workers)
@@ -0,0 +1,98 @@
+"""Per-locality market statistics aligned with the label encoder.
+
+``train_model.py`` records listing statistics per locality (count, median
+price, price-per-sqft median and quantiles) in ``models/location_stats.json``.
+The index loads them once per artifact set, in label-encoder code order, so a
+locality comparison needs one batched inference over ``codes`` and no
+per-request lookups. Follows Google Python Style Guide with full type
+annotations.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from app.schemas.prediction import LocationMarketStats
+from app.services.location_vocab import display_location
+
+logger = logging.getLogger(__name__)
+
+# Price-per-sqft quantiles exposed by LocationMarketStats, in field order.
+MARKET_QUANTILES = (0.1, 0.25, 0.75, 0.9)
+
+
+class LocationIndex:
+    """Market statistics for every locality the model encodes.
+
+    Attributes:
+        names: Display name per label-encoder code.
+        codes: Float label-encoder codes, ready for the location column.
+        market: LocationMarketStats per code, or None for localities absent
+            from the statistics file.
+        median_price_per_sqft: Median listing price per sqft per code (NaN
+            where ``market`` is None).
+    """
+
+    def __init__(self, classes: np.ndarray, stats: dict[str, Any]) -> None:
+        quantiles = [float(q) for q in stats.get("quantiles", [])]
+        positions = [quantiles.index(q) if q in quantiles else None for q in MARKET_QUANTILES]
+        locations = stats.get("locations", {})
+
+        self.names = [display_location(str(label)) for label in classes]
+        self.codes = np.arange(len(classes), dtype=float)
+        self.market: list[LocationMarketStats | None] = []
+        for label in classes:
+            entry = locations.get(str(label))
+            if entry is None or None in positions:
+                self.market.append(None)
+                continue
+            p10, p25, p75, p90 = (entry["price_per_sqft_quantiles"][i] for i in positions)
+            self.market.append(
+                LocationMarketStats(
+                    listings=entry["listings"],
+                    median_price=entry["median_price"],
+                    median_price_per_sqft=entry["median_price_per_sqft"],
+                    price_per_sqft_p10=p10,
+                    price_per_sqft_p25=p25,
+                    price_per_sqft_p75=p75,
+                    price_per_sqft_p90=p90,
+                )
+            )
+        self.median_price_per_sqft = np.array(
+            [m.median_price_per_sqft if m is not None else np.nan for m in self.market]
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def load(cls, path: Path, classes: np.ndarray) -> "LocationIndex":
+        """Builds the index from a statistics file written at training time.
+
+        A missing or unreadable file yields an index without market
+        statistics; localities can still be compared by predicted price.
+
+        Args:
+            path: Path to location_stats.json.
+            classes: Label-encoder classes of the artifacts being loaded.
+
+        Returns:
+            LocationIndex over ``classes``.
+        """
+        try:
+            stats = json.loads(path.read_text())
+            index = cls(classes, stats)
+        except FileNotFoundError:
+            logger.warning("No location stats at %s; comparisons omit market data.", path)
+            return cls(classes, {})
+        except (OSError, ValueError, KeyError, TypeError, IndexError) as exc:
+            logger.warning("Ignoring unreadable location stats %s: %s", path, exc)
+            return cls(classes, {})
+        missing = [name for name, market in zip(index.names, index.market) if market is None]
+        if missing:
+            # Localities the model learned from synthetic rows only have no listings.
+            logger.info("No market statistics for: %s", ", ".join(missing))
+        return index
@@ -0,0 +1,117 @@
+"""Location vocabulary compiled from the label encoder at load time.
+
+The label encoder knows localities by their lower-cased training spelling
+("cbd belapur", "kopar khairane"), while requests name them by
+``NaviMumbaiLocation`` value and listing files spell them freely ("KHARGHAR",
+"panvel", "Kopar-Khairane"). ``LocationVocabulary`` resolves all of these to
+label-encoder codes through a single dict built once per artifact set, so
+encoding a location is a constant-time lookup on every path, and keeps the
+display names ``/locations`` serves. Follows Google Python Style Guide with
+full type annotations.
+"""
+
+import re
+from typing import Sequence
+
+import numpy as np
+
+from app.schemas.prediction import NaviMumbaiLocation
+
+# Free-form spellings that normalisation alone does not map onto a class.
+# "CBD Belapur" and "Belapur" are separate localities with separate classes,
+# so neither is an alias of the other.
+LOCATION_ALIASES = {
+    "cbd": "cbd belapur",
+    "koparkhairane": "kopar khairane",
+    "sea woods": "seawoods",
+    "newpanvel": "new panvel",
+    "sector19": "sector 19",
+}
+
+_SEPARATORS = re.compile(r"[^0-9a-z]+")
+_DISPLAY_NAMES = {location.value.lower(): location.value for location in NaviMumbaiLocation}
+
+
+def normalize_location(name: str) -> str:
+    """Returns the label-encoder spelling of a free-form locality name.
+
+    Lower-cases the name, drops dots ("C.B.D."), treats other punctuation
+    as spaces, collapses whitespace and resolves ``LOCATION_ALIASES``.
+    """
+    key = " ".join(_SEPARATORS.sub(" ", name.lower().replace(".", "")).split())
+    return LOCATION_ALIASES.get(key, key)
+
+
+def display_location(label: str) -> str:
+    """Returns the display name of a lower-cased label-encoder class."""
+    return _DISPLAY_NAMES.get(label, label.title())
+
+
+class LocationVocabulary:
+    """Name-to-code table for the localities one label encoder knows.
+
+    Attributes:
+        labels: Label-encoder classes, in code order.
+        names: Display name per code.
+        codes: Label-encoder code per NaviMumbaiLocation value the model
+            supports.
+        display_names: Sorted display names of every supported locality.
+    """
+
+    def __init__(self, classes: np.ndarray) -> None:
+        self.labels = [str(label) for label in classes]
+        self.names = [display_location(label) for label in self.labels]
+        self.display_names = sorted(self.names)
+
+        self._lookup = {label: code for code, label in enumerate(self.labels)}
+        for code, label in enumerate(self.labels):
+            self._lookup.setdefault(normalize_location(label), code)
+        for alias, label in LOCATION_ALIASES.items():
+            if label in self._lookup:
+                self._lookup.setdefault(alias, self._lookup[label])
+        self.codes = {
+            location.value: code
+            for location in NaviMumbaiLocation
+            if (code := self.code(location.value)) is not None
+        }
+        # Enum values are what requests carry; resolve them without normalising.
+        self._lookup.update(self.codes)
+        self._supported = ", ".join(self.labels)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def code(self, name: str) -> int | None:
+        """Returns the code of a location value or free-form name, or None."""
+        code = self._lookup.get(name)
+        if code is None:
+            code = self._lookup.get(normalize_location(name))
+        return code
+
+    def unsupported(self, name: str) -> str:
+        """Returns the error message for a location the model does not know."""
+        return (
+            f"Location '{name}' is not supported by the current model. "
+            f"Supported: {self._supported}"
+        )
+
+    def encode(self, names: Sequence[str]) -> tuple[np.ndarray, dict[int, str]]:
+        """Encodes location names in one pass.
+
+        Args:
+            names: NaviMumbaiLocation values or free-form locality names.
+
+        Returns:
+            A tuple of (codes, errors). ``codes`` holds the code of every
+            name (``-1`` for unsupported ones) and ``errors`` maps the index
+            of each unsupported name to an error message.
+        """
+        codes = np.full(len(names), -1, dtype=int)
+        errors: dict[int, str] = {}
+        for i, name in enumerate(names):
+            code = self.code(name)
+            if code is None:
+                errors[i] = self.unsupported(name)
+            else:
+                codes[i] = code
+        return codes, errors
@@ -4,21 +4,58 @@ Handles model loading, feature engineering, and inference.
 Follows Google Python Style Guide with full type annotations.
 """
 
+import hashlib
+import json
 import logging
 import pickle
+import threading
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Sequence
 
 import numpy as np
 
 from app.core.config import get_settings
+from app.core.metrics import (
+    FEATURES_STAGE,
+    PREDICT_STAGE,
+    PREDICTIONS,
+    REGISTRY,
+    RESPONSE_STAGE,
+)
 from app.schemas.prediction import (
+    BatchPredictionItem,
+    CacheStatsResponse,
+    ExplanationResponse,
+    FeatureContributionItem,
+    LatticeStatsResponse,
     FeatureImportanceItem,
+    LocationComparisonItem,
+    LocationComparisonResponse,
     ModelInfoResponse,
     ModelMetrics,
     PredictionRequest,
     PredictionResponse,
+    ReloadResponse,
+    SweepAxisValues,
+    SweepRequest,
+    SweepResponse,
+)
+from app.services.canary import CanaryRows, load_canary_rows
+from app.services.explainer import PathExplainer, gain_importance, histogram_gain_importance
+from app.services.location_index import LocationIndex
+from app.services.location_vocab import LocationVocabulary
+from app.services.model_bundle import ModelBundle, load_bundle
+from app.services.price_lattice import PriceLattice
+from app.services.prediction_cache import (
+    CacheKey,
+    PredictionCache,
+    RequestValues,
+    make_cache_key,
+    request_values,
 )
+from app.services.tree_engine import CompiledEnsemble
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +72,14 @@ FEATURE_ORDER = [
     "lift",
 ]
 
+# Model classes trained on raw (unscaled) features
+UNSCALED_MODEL_TYPES = frozenset({"HistGradientBoostingRegressor"})
+
+MODEL_DISPLAY_NAMES = {
+    "GradientBoostingRegressor": "Gradient Boosting Regressor",
+    "HistGradientBoostingRegressor": "Histogram Gradient Boosting Regressor",
+}
+
 FEATURE_DISPLAY_NAMES = {
     "area_sqft": "Area (sq ft)",
     "bhk": "BHK",
@@ -47,55 +92,474 @@ FEATURE_DISPLAY_NAMES = {
     "lift": "Lift",
 }
 
-FEATURE_IMPORTANCE = [
-    {"name": "area_sqft", "importance": 0.6549},
-    {"name": "bhk", "importance": 0.0863},
-    {"name": "age_of_property", "importance": 0.0811},
-    {"name": "total_floors", "importance": 0.0648},
-    {"name": "floor", "importance": 0.0551},
-    {"name": "location", "importance": 0.0323},
-    {"name": "bathrooms", "importance": 0.0203},
-    {"name": "parking", "importance": 0.0040},
-    {"name": "lift", "importance": 0.0013},
-]
+class ModelValidationError(RuntimeError):
+    """Raised when reloaded artifacts fail canary validation."""
+
+
+class ReloadInProgressError(RuntimeError):
+    """Raised when a reload is requested while another one is running."""
+
+
+class ExplanationUnavailableError(RuntimeError):
+    """Raised when the serving model cannot attribute predictions to features."""
+
+
+class ModelArtifacts:
+    """One immutable, fully loaded set of model artifacts.
+
+    MLService swaps whole instances atomically; a request reads the current
+    instance once and uses it throughout, so requests in flight during a
+    reload finish on the artifacts they started with.
+
+    Attributes:
+        model: Fitted sklearn model, or None when served from a bundle.
+        scaler: Fitted StandardScaler (or bundle stand-in), or None for
+            models trained on raw features.
+        label_encoder: Fitted LabelEncoder (or bundle stand-in).
+        engine: Compiled tree ensemble, if the compiled engine is in use.
+        scaler_folded: Whether ``engine`` consumes unscaled features.
+        bundle: Memory-mapped bundle the artifacts came from, if any.
+        quantiles: Lower and upper quantile of the served price range, or
+            empty if ranges fall back to a fixed margin.
+        quantile_models: sklearn quantile models for ``quantiles``, used
+            when the quantile trees are not fused into ``engine``.
+        lattice: Precomputed price lattice, if enabled.
+        location_index: Per-locality market statistics for comparisons.
+        vocabulary: Location name-to-code table for ``label_encoder``.
+        training_metadata: Contents of training_metadata.json written with
+            the artifacts, or None if it is missing or unreadable.
+        feature_importance: Normalized global importance per feature in
+            FEATURE_ORDER, computed from the trees at load, or None if the
+            model does not expose it.
+        fingerprint: SHA-256 digest of the artifact contents.
+        loaded_at: When the artifacts were loaded.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        scaler: Any,
+        label_encoder: Any,
+        engine: CompiledEnsemble | None,
+        scaler_folded: bool,
+        bundle: ModelBundle | None,
+        fingerprint: str,
+        quantiles: tuple[float, ...] = (),
+        quantile_models: list[Any] | None = None,
+    ) -> None:
+        self.model = model
+        self.scaler = scaler
+        self.label_encoder = label_encoder
+        self.engine = engine
+        self.scaler_folded = scaler_folded
+        self.bundle = bundle
+        self.quantiles = quantiles
+        self.quantile_models = quantile_models
+        self.lattice: PriceLattice | None = None
+        self.location_index: LocationIndex | None = None
+        self.vocabulary = LocationVocabulary(label_encoder.classes_)
+        self.training_metadata: dict[str, Any] | None = None
+        self.feature_importance = global_feature_importance(model, engine)
+        self.fingerprint = fingerprint
+        self.loaded_at = datetime.now(timezone.utc)
+        self._explainer: PathExplainer | None = None
+        self._explainer_lock = threading.Lock()
+
+    @property
+    def version(self) -> str:
+        """Returns a short, content-derived version identifier."""
+        return self.fingerprint[:12]
+
+    def encode_locations(
+        self, requests: Sequence[PredictionRequest]
+    ) -> tuple[np.ndarray, dict[int, str]]:
+        """Label-encodes the locations of a batch of requests in one pass.
+
+        Args:
+            requests: Validated prediction requests.
+
+        Returns:
+            A tuple of (codes, errors). ``codes`` holds the encoded location for
+            every row (``-1`` for unsupported rows) and ``errors`` maps the row
+            index of each unsupported location to an error message.
+        """
+        return self.encode_location_names([r.location.value for r in requests])
+
+    def encode_location_names(self, names: Sequence[str]) -> tuple[np.ndarray, dict[int, str]]:
+        """Label-encodes location display names in one pass.
+
+        Args:
+            names: Location names as in NaviMumbaiLocation values, or
+                free-form spellings resolved by the vocabulary.
+
+        Returns:
+            A tuple of (codes, errors) as for ``encode_locations``.
+        """
+        return self.vocabulary.encode(names)
+
+    def build_raw_vector(self, request: PredictionRequest) -> np.ndarray:
+        """Transforms a prediction request into an unscaled 1×9 feature vector.
+
+        Args:
+            request: Validated prediction request object.
+
+        Returns:
+            A 2-D numpy array of shape (1, 9) in FEATURE_ORDER.
+
+        Raises:
+            ValueError: If the requested location is not supported by the model.
+        """
+        codes, errors = self.encode_locations([request])
+        if errors:
+            raise ValueError(errors[0])
+        return build_raw_features([request], codes)
+
+    def prepare_features(self, raw_features: np.ndarray) -> np.ndarray:
+        """Scales raw features for inference.
+
+        Scaling is skipped when the scaler has been folded into the compiled
+        tree thresholds, since the engine then consumes raw features, and
+        for models trained without a scaler.
+
+        Args:
+            raw_features: 2-D array of unscaled features in FEATURE_ORDER.
+
+        Returns:
+            A 2-D numpy array ready for ``infer``.
+        """
+        if self.scaler_folded or self.scaler is None:
+            return raw_features
+        return self.scaler.transform(raw_features)
+
+    def infer(self, features: np.ndarray) -> np.ndarray:
+        """Evaluates the model on a scaled feature matrix.
+
+        Args:
+            features: 2-D array of features from ``prepare_features``.
+
+        Returns:
+            1-D array of raw price predictions.
+        """
+        if self.engine is not None:
+            return self.engine.predict(features)
+        return self.model.predict(features)
+
+    def predict_raw(self, raw_features: np.ndarray) -> np.ndarray:
+        """Scales (if needed) and evaluates the model on raw features.
+
+        Args:
+            raw_features: 2-D array of unscaled features in FEATURE_ORDER.
+
+        Returns:
+            1-D array of raw price predictions.
+        """
+        return self.infer(self.prepare_features(raw_features))
+
+    @property
+    def has_intervals(self) -> bool:
+        """Returns whether quantile models for price ranges are loaded."""
+        return bool(self.quantiles)
+
+    def predict_interval_raw(self, raw_features: np.ndarray) -> np.ndarray:
+        """Predicts price, lower and upper quantile in one evaluation.
+
+        With the compiled engine, point and quantile trees are fused, so this
+        is a single traversal pass over all three ensembles.
+
+        Args:
+            raw_features: 2-D array of unscaled features in FEATURE_ORDER.
+
+        Returns:
+            Array of shape (n_rows, 3): price, lower bound, upper bound.
+        """
+        return self.infer_interval(self.prepare_features(raw_features))
+
+    def infer_interval(self, features: np.ndarray) -> np.ndarray:
+        """Evaluates point and quantile models on a prepared feature matrix.
+
+        Args:
+            features: 2-D array of features from ``prepare_features``.
+
+        Returns:
+            Array of shape (n_rows, 3): price, lower bound, upper bound.
+        """
+        if self.engine is not None and self.engine.n_outputs == 3:
+            return self.engine.predict_outputs(features)
+        return np.column_stack(
+            [self.infer(features)] + [m.predict(features) for m in self.quantile_models]
+        )
+
+    @property
+    def explainer(self) -> PathExplainer:
+        """Returns the feature attribution tables, building them on first use.
+
+        The tables depend only on the tree structure, so they are built once
+        per artifact set and shared by every explanation it serves.
+
+        Raises:
+            ExplanationUnavailableError: If the model cannot be explained.
+        """
+        with self._explainer_lock:
+            if self._explainer is None:
+                ensemble = self.engine
+                if ensemble is None and self.model is not None and uses_scaled_features(self.model):
+                    # Served with model.predict; compile the trees for inputs
+                    # from prepare_features, which are scaled.
+                    ensemble = CompiledEnsemble.from_gradient_boosting(self.model)
+                if ensemble is None or ensemble.cover is None:
+                    raise ExplanationUnavailableError(
+                        "Explanations require gradient boosting trees with node covers; "
+                        "retrain or re-export the model bundle."
+                    )
+                try:
+                    self._explainer = PathExplainer(ensemble)
+                except ValueError as exc:
+                    raise ExplanationUnavailableError(str(exc)) from exc
+            return self._explainer
+
+
+def uses_scaled_features(model: Any) -> bool:
+    """Returns whether a model was trained on standardized features.
+
+    ``train_model.py`` scales features for GradientBoostingRegressor only; the
+    histogram backend consumes raw features with a categorical location.
+    """
+    return type(model).__name__ not in UNSCALED_MODEL_TYPES
+
+
+def global_feature_importance(model: Any, engine: CompiledEnsemble | None) -> np.ndarray | None:
+    """Computes normalized split-gain importance from the loaded trees.
+
+    Args:
+        model: Fitted sklearn model, or None when served from a bundle.
+        engine: Compiled tree ensemble, if the compiled engine is in use.
+
+    Returns:
+        Importance per feature in FEATURE_ORDER, or None if unavailable.
+    """
+    if engine is not None and engine.cover is not None:
+        return gain_importance(engine)
+    if model is None:
+        return None
+    if not uses_scaled_features(model):
+        return histogram_gain_importance(model)
+    return np.asarray(model.feature_importances_, dtype=float)
+
+
+def load_training_metadata(path: Path) -> dict[str, Any] | None:
+    """Reads the training metadata written alongside the artifacts.
+
+    Args:
+        path: Path to training_metadata.json.
+
+    Returns:
+        The metadata, or None if the file is missing or unreadable.
+    """
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        logger.warning("No training metadata at %s; /model-info omits metrics.", path)
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable training metadata %s: %s", path, exc)
+    return None
+
+
+def interval_confidence(price: float, low: float, high: float) -> float:
+    """Derives a confidence score from the width of the price range.
+
+    The score is ``1 / (1 + w)`` where ``w`` is the range width relative to
+    the price: 1.0 for a zero-width range, 0.84 for the former fixed ±8%
+    range, 0.5 for a range as wide as the price itself.
+
+    Args:
+        price: Point prediction in INR.
+        low: Lower bound of the price range.
+        high: Upper bound of the price range.
+
+    Returns:
+        Confidence score in (0, 1].
+    """
+    if price <= 0:
+        return 0.0
+    return 1.0 / (1.0 + (high - low) / price)
+
+
+def build_raw_features(
+    requests: Sequence[PredictionRequest], location_codes: np.ndarray
+) -> np.ndarray:
+    """Assembles the unscaled N×9 feature matrix for a batch of requests.
+
+    Args:
+        requests: Validated prediction requests.
+        location_codes: Encoded location for each request.
+
+    Returns:
+        A 2-D numpy array of shape (len(requests), 9) in FEATURE_ORDER.
+    """
+    numeric = np.array(
+        [
+            (
+                r.area_sqft,
+                r.bhk,
+                r.bathrooms,
+                r.floor,
+                r.total_floors,
+                r.age_of_property,
+                r.parking,
+                r.lift,
+            )
+            for r in requests
+        ],
+        dtype=float,
+    ).reshape(len(requests), len(FEATURE_ORDER) - 1)
+    return np.column_stack([location_codes.astype(float), numeric])
 
 
 class MLService:
     """Service class for ML model operations.
 
     Manages lifecycle of scikit-learn model artifacts and exposes
-    a clean prediction interface for the API layer.
+    a clean prediction interface for the API layer. Artifacts can be
+    hot-swapped with ``reload`` without interrupting requests in flight.
     """
 
     def __init__(self) -> None:
-        self._model: Any = None
-        self._scaler: Any = None
-        self._label_encoder: Any = None
-        self._is_loaded: bool = False
+        self._artifacts: ModelArtifacts | None = None
+        self._reload_lock = threading.Lock()
+        self._reload_listeners: list[Callable[[], None]] = []
         self._settings = get_settings()
+        self._rows = threading.local()
+        self._cache = PredictionCache(
+            max_size=self._settings.prediction_cache_size,
+            ttl_seconds=self._settings.prediction_cache_ttl_seconds,
+        )
+
+    @property
+    def artifacts(self) -> ModelArtifacts | None:
+        """Returns the artifact set currently serving, if any."""
+        return self._artifacts
+
+    @property
+    def is_loaded(self) -> bool:
+        """Returns whether model artifacts are loaded."""
+        return self._artifacts is not None
+
+    @property
+    def version(self) -> str | None:
+        """Returns the version of the serving artifacts, if loaded."""
+        return self._artifacts.version if self._artifacts is not None else None
 
     def load(self) -> None:
         """Loads model, scaler, and label encoder from disk.
 
+        Reads the three pickles, or the memory-mapped model bundle when
+        ``artifact_format`` is ``"bundle"``.
+
         Raises:
             FileNotFoundError: If any model artifact is missing.
             RuntimeError: If pickle deserialization fails.
         """
-        settings = self._settings
+        self._swap(self._load_artifacts())
+        logger.info("ML model artifacts loaded successfully (version %s).", self.version)
+
+    def reload(self) -> ReloadResponse:
+        """Loads a new artifact set, validates it and swaps it in atomically.
+
+        The current artifacts keep serving while the new ones load and are
+        scored on the canary rows; only a set that passes replaces them.
+        Requests in flight finish on the artifacts they started with.
+
+        Returns:
+            ReloadResponse describing the swap.
+
+        Raises:
+            ReloadInProgressError: If another reload is running.
+            ModelValidationError: If the new artifacts fail canary validation.
+            FileNotFoundError: If any model artifact is missing.
+            RuntimeError: If the new artifacts cannot be loaded.
+        """
+        if not self._reload_lock.acquire(blocking=False):
+            raise ReloadInProgressError("A model reload is already in progress.")
         try:
-            logger.info("Loading ML model artifacts from %s", settings.model_dir)
+            start = time.perf_counter()
+            previous = self._artifacts
+            artifacts = self._load_artifacts()
+            canary_rows, canary_r2 = self._validate(artifacts)
 
-            with open(settings.model_path, "rb") as f:
-                self._model = pickle.load(f)
+            unchanged = previous is not None and previous.fingerprint == artifacts.fingerprint
+            warnings: list[str] = []
+            if unchanged:
+                artifacts = previous
+                logger.info("Reload found unchanged artifacts (version %s).", artifacts.version)
+            else:
+                self._swap(artifacts)
+                logger.info(
+                    "Swapped model artifacts %s -> %s.",
+                    previous.version if previous is not None else None,
+                    artifacts.version,
+                )
+                for listener in self._reload_listeners:
+                    # The swap has happened; a failing listener is reported, not fatal.
+                    try:
+                        listener()
+                    except Exception as exc:
+                        logger.error("Reload listener failed: %s", exc)
+                        warnings.append(str(exc))
 
-            with open(settings.scaler_path, "rb") as f:
-                self._scaler = pickle.load(f)
+            return ReloadResponse(
+                status="unchanged" if unchanged else "reloaded",
+                previous_version=previous.version if previous is not None else None,
+                artifact_version=artifacts.version,
+                loaded_at=artifacts.loaded_at,
+                canary_rows=canary_rows,
+                canary_r2=canary_r2,
+                duration_s=time.perf_counter() - start,
+                warnings=warnings,
+            )
+        finally:
+            self._reload_lock.release()
+
+    def on_reload(self, listener: Callable[[], None]) -> None:
+        """Registers a callback run after new artifacts are swapped in.
 
-            with open(settings.label_encoder_path, "rb") as f:
-                self._label_encoder = pickle.load(f)
+        An exception from the callback is logged and reported in the
+        ReloadResponse warnings; the new artifacts stay swapped in.
 
-            self._is_loaded = True
-            logger.info("ML model artifacts loaded successfully.")
+        Args:
+            listener: Callable invoked with no arguments after each swap.
+        """
+        self._reload_listeners.append(listener)
+
+    def _swap(self, artifacts: ModelArtifacts) -> None:
+        """Makes ``artifacts`` the serving set."""
+        self._artifacts = artifacts
+        # Cache keys carry the artifact version; this only frees memory.
+        self._cache.clear()
+
+    def _load_artifacts(self) -> ModelArtifacts:
+        """Loads a complete artifact set without touching the serving one.
+
+        Returns:
+            Newly loaded ModelArtifacts, including the location index and the
+            lattice if enabled.
+
+        Raises:
+            FileNotFoundError: If any model artifact is missing.
+            RuntimeError: If deserialization fails.
+        """
+        settings = self._settings
+        try:
+            if settings.artifact_format == "bundle":
+                artifacts = self._load_bundle()
+            else:
+                artifacts = self._load_pickles()
+            artifacts.location_index = LocationIndex.load(
+                settings.location_stats_path, artifacts.label_encoder.classes_
+            )
+            artifacts.training_metadata = load_training_metadata(settings.training_metadata_path)
+            if settings.lattice_enabled:
+                artifacts.lattice = self._load_lattice(artifacts)
+            return artifacts
         except FileNotFoundError as exc:
             logger.error("Model artifact not found: %s", exc)
             raise
@@ -103,144 +567,721 @@ class MLService:
             logger.error("Failed to load ML artifacts: %s", exc)
             raise RuntimeError(f"Model loading failed: {exc}") from exc
 
-    @property
-    def is_loaded(self) -> bool:
-        """Returns whether model artifacts are loaded."""
-        return self._is_loaded
+    def _load_pickles(self) -> ModelArtifacts:
+        """Unpickles model, scaler and label encoder, compiling trees if configured.
 
-    def _build_feature_vector(self, request: PredictionRequest) -> np.ndarray:
-        """Transforms a prediction request into a scaled numpy feature vector.
+        Histogram-based models are trained on raw features with a native
+        categorical location, so no scaler is loaded for them.
+        """
+        settings = self._settings
+        logger.info("Loading ML model artifacts from %s", settings.model_dir)
+
+        # Hash the exact bytes that are unpickled, so the version always
+        # matches the loaded objects even if the files change concurrently.
+        digest = hashlib.sha256()
+
+        def load(path: Path) -> Any:
+            data = path.read_bytes()
+            digest.update(data)
+            return pickle.loads(data)
+
+        model = load(settings.model_path)
+        scaler = load(settings.scaler_path) if uses_scaled_features(model) else None
+        label_encoder = load(settings.label_encoder_path)
+        quantile_models: dict[float, Any] = {}
+        if settings.prediction_intervals and settings.quantile_models_path.exists():
+            quantile_models = load(settings.quantile_models_path)
+        quantiles = tuple(sorted(quantile_models))
+        models = [model] + [quantile_models[q] for q in quantiles]
+
+        engine = None
+        scaler_folded = False
+        if settings.inference_engine == "compiled" and scaler is None:
+            logger.info("%s is served with model.predict.", type(model).__name__)
+        elif settings.inference_engine == "compiled":
+            engine = CompiledEnsemble.fuse(
+                [
+                    CompiledEnsemble.from_gradient_boosting(
+                        m, scaler=scaler if settings.fold_scaler else None
+                    )
+                    for m in models
+                ]
+            )
+            scaler_folded = settings.fold_scaler
+            logger.info(
+                "Compiled %d trees (%d nodes, %d outputs) for flat-array inference%s.",
+                engine.n_trees,
+                engine.n_nodes,
+                engine.n_outputs,
+                " with scaler folded into thresholds" if scaler_folded else "",
+            )
+        return ModelArtifacts(
+            model,
+            scaler,
+            label_encoder,
+            engine,
+            scaler_folded,
+            None,
+            digest.hexdigest(),
+            quantiles=quantiles,
+            quantile_models=models[1:],
+        )
+
+    def _load_bundle(self) -> ModelArtifacts:
+        """Memory-maps the model bundle; always serves with the compiled engine."""
+        settings = self._settings
+        logger.info("Loading model bundle from %s", settings.bundle_dir)
+        if settings.inference_engine != "compiled":
+            logger.info("Model bundles are served by the compiled engine.")
+
+        bundle = load_bundle(settings.bundle_dir)
+        return ModelArtifacts(
+            model=None,
+            scaler=bundle.scaler,
+            label_encoder=bundle.label_encoder,
+            engine=bundle.engine(fold_scaler=settings.fold_scaler),
+            scaler_folded=settings.fold_scaler,
+            bundle=bundle,
+            fingerprint=bundle.fingerprint,
+            quantiles=bundle.quantiles if settings.prediction_intervals else (),
+        )
+
+    def _validate(self, artifacts: ModelArtifacts) -> tuple[int, float | None]:
+        """Scores artifacts on the canary rows before they may go live.
 
         Args:
-            request: Validated prediction request object.
+            artifacts: Newly loaded artifacts.
 
         Returns:
-            A 2-D numpy array ready for model inference.
+            Tuple of (number of canary rows scored, R² on those rows). R² is
+            None if no canary CSV is available, in which case only a smoke
+            prediction is checked.
 
         Raises:
-            ValueError: If the requested location is not supported by the model.
+            ModelValidationError: If predictions are not finite or R² is
+                below ``canary_min_r2``.
         """
-        loc_lower = request.location.value.lower()
-        
-        if loc_lower not in self._label_encoder.classes_:
-            supported = ", ".join(self._label_encoder.classes_)
-            raise ValueError(
-                f"Location '{request.location.value}' is not supported by the current model. "
-                f"Supported: {supported}"
+        settings = self._settings
+        rows = load_canary_rows(settings.canary_csv_path, settings.canary_rows)
+        if rows is not None:
+            codes, _ = artifacts.vocabulary.encode(rows.locations.tolist())
+            supported = codes >= 0
+            codes = codes[supported]
+            rows = CanaryRows(
+                rows.locations[supported], rows.numeric[supported], rows.prices[supported]
             )
+        if rows is None or len(rows) == 0:
+            logger.warning("No canary rows available; running a smoke prediction only.")
+            raw = np.array([[0.0, 950.0, 2, 2, 5, 12, 3, 1, 1]])
+            if not np.isfinite(artifacts.predict_raw(raw)).all():
+                raise ModelValidationError("New model produced a non-finite prediction.")
+            return 0, None
 
-        location_encoded = self._label_encoder.transform([loc_lower])[0]
-
-        raw_features = np.array(
-            [
-                location_encoded,
-                request.area_sqft,
-                request.bhk,
-                request.bathrooms,
-                request.floor,
-                request.total_floors,
-                request.age_of_property,
-                request.parking,
-                request.lift,
-            ],
-            dtype=float,
-        ).reshape(1, -1)
+        predicted = artifacts.predict_raw(np.column_stack([codes.astype(float), rows.numeric]))
+        if not np.isfinite(predicted).all():
+            raise ModelValidationError("New model produced non-finite predictions on canary rows.")
 
-        scaled_features = self._scaler.transform(raw_features)
-        return scaled_features
+        residual = float(((rows.prices - predicted) ** 2).sum())
+        total = float(((rows.prices - rows.prices.mean()) ** 2).sum())
+        r2 = 1.0 - residual / total if total > 0 else 0.0
+        if r2 < settings.canary_min_r2:
+            raise ModelValidationError(
+                f"New model scored R²={r2:.3f} on {len(rows)} canary rows "
+                f"(minimum {settings.canary_min_r2})."
+            )
+        logger.info("Canary validation passed: R²=%.4f on %d rows.", r2, len(rows))
+        return len(rows), r2
 
-    def predict(self, request: PredictionRequest) -> PredictionResponse:
-        """Runs inference and returns a structured prediction response.
+    def _load_lattice(self, artifacts: ModelArtifacts) -> PriceLattice | None:
+        """Memory-maps the price lattice, rebuilding it if missing or stale.
+
+        A lattice is stale when it was built from different model artifacts,
+        without the price bounds the artifacts serve, or over different axes
+        than the current settings describe. Failures are logged and disable
+        the lattice rather than failing model loading.
 
         Args:
-            request: Validated prediction request.
+            artifacts: Artifacts the lattice must belong to.
 
         Returns:
-            PredictionResponse with price estimate and metadata.
+            The loaded PriceLattice, or None if it is unavailable.
+        """
+        settings = self._settings
+        try:
+            lattice = PriceLattice.load(settings.lattice_path)
+            if (
+                lattice.metadata.get("fingerprint") == artifacts.fingerprint
+                and lattice.n_outputs == (3 if artifacts.has_intervals else 1)
+                and lattice.metadata.get("axes") == self._lattice_axes(artifacts)
+                and lattice.metadata.get("area", {}).get("step") == settings.lattice_area_step
+            ):
+                logger.info("Memory-mapped price lattice from %s", settings.lattice_path)
+                return lattice
+            logger.warning("Price lattice at %s is stale.", settings.lattice_path)
+        except FileNotFoundError:
+            logger.info("No price lattice found at %s", settings.lattice_path)
+        except Exception as exc:
+            logger.warning("Could not read price lattice: %s", exc)
 
-        Raises:
-            RuntimeError: If model is not loaded.
+        if not settings.lattice_build_on_startup:
+            logger.warning("Price lattice disabled until it is rebuilt.")
+            return None
+        try:
+            lattice = self.build_lattice(artifacts)
+            lattice.save(settings.lattice_path)
+            return PriceLattice.load(settings.lattice_path)
+        except Exception as exc:
+            logger.error("Failed to build price lattice: %s", exc)
+            return None
+
+    def _lattice_axes(self, artifacts: ModelArtifacts) -> dict[str, list[float]]:
+        """Returns the discrete lattice axes described by the settings."""
+        settings = self._settings
+        return {
+            "location": [float(i) for i in range(len(artifacts.label_encoder.classes_))],
+            "bhk": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "bathrooms": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "floor": [float(v) for v in settings.lattice_floor_values],
+            "total_floors": [float(v) for v in settings.lattice_total_floors_values],
+            "age_of_property": [float(v) for v in settings.lattice_age_values],
+            "parking": [0.0, 1.0],
+            "lift": [0.0, 1.0],
+        }
+
+    def build_lattice(self, artifacts: ModelArtifacts | None = None) -> PriceLattice:
+        """Precomputes predictions over the configured lattice.
+
+        With prediction intervals, every point also stores the lower and
+        upper bound, so lattice hits skip the quantile models as well.
+
+        Args:
+            artifacts: Artifacts to tabulate; defaults to the serving set.
+
+        Returns:
+            In-memory PriceLattice for the given artifacts.
         """
-        if not self._is_loaded:
-            raise RuntimeError("Model is not loaded. Call load() first.")
+        artifacts = artifacts or self._artifacts
+        settings = self._settings
+        return PriceLattice.build(
+            artifacts.predict_interval_raw if artifacts.has_intervals else artifacts.predict_raw,
+            axes=self._lattice_axes(artifacts),
+            area_min=settings.lattice_area_min,
+            area_max=settings.lattice_area_max,
+            area_step=settings.lattice_area_step,
+            fingerprint=artifacts.fingerprint,
+        )
+
+    @staticmethod
+    def _build_response(
+        request: PredictionRequest,
+        predicted_price: float,
+        bounds: tuple[float, float] | None = None,
+    ) -> PredictionResponse:
+        """Wraps a raw model output into a structured prediction response.
+
+        Args:
+            request: The request the prediction was made for.
+            predicted_price: Raw model output in INR.
+            bounds: Lower and upper quantile predictions in INR, if quantile
+                models are loaded.
+
+        Returns:
+            PredictionResponse with price estimate and metadata.
+        """
+        return MLService._response_from_values(
+            request.location.value, request_values(request), predicted_price, bounds
+        )
 
-        features = self._build_feature_vector(request)
-        predicted_price = float(self._model.predict(features)[0])
+    @staticmethod
+    def _response_from_values(
+        location: str,
+        values: RequestValues,
+        predicted_price: float,
+        bounds: tuple[float, float] | None = None,
+    ) -> PredictionResponse:
+        """Builds the prediction response from a location and numeric fields.
 
+        Every field is computed here from floats and ints of known type, so
+        the response is constructed without re-running pydantic validation.
+
+        Args:
+            location: NaviMumbaiLocation value of the request.
+            values: Numeric request fields, as from ``request_values``.
+            predicted_price: Raw model output in INR.
+            bounds: Lower and upper quantile predictions in INR, if quantile
+                models are loaded.
+
+        Returns:
+            PredictionResponse with price estimate and metadata.
+        """
+        area_sqft, bhk, bathrooms, floor, total_floors, age_of_property, parking, lift = values
         # Clamp negative predictions (edge cases)
         predicted_price = max(predicted_price, 0.0)
 
-        # Confidence interval: ±8% based on model MAE characteristics
-        margin = predicted_price * 0.08
-        price_range_low = max(predicted_price - margin, 0.0)
-        price_range_high = predicted_price + margin
-
-        price_per_sqft = (
-            predicted_price / request.area_sqft if request.area_sqft > 0 else 0.0
-        )
+        if bounds is not None:
+            # Quantile models are fitted separately and may cross the point
+            # prediction; widen the range to contain it.
+            price_range_low = max(min(bounds[0], predicted_price), 0.0)
+            price_range_high = max(bounds[1], predicted_price)
+            confidence_score = round(
+                interval_confidence(predicted_price, price_range_low, price_range_high), 4
+            )
+        else:
+            # Confidence interval: ±8% based on model MAE characteristics
+            margin = predicted_price * 0.08
+            price_range_low = max(predicted_price - margin, 0.0)
+            price_range_high = predicted_price + margin
+            # Confidence score derived from R² (0.8385)
+            confidence_score = 0.84
 
-        # Confidence score derived from R² (0.8385) with slight penalization for outlier inputs
-        confidence_score = min(0.84, max(0.65, 0.84))
+        price_per_sqft = predicted_price / area_sqft if area_sqft > 0 else 0.0
 
-        return PredictionResponse(
+        return PredictionResponse.model_construct(
             predicted_price=round(predicted_price, 2),
             price_in_lakhs=round(predicted_price / 100_000, 2),
             price_range_low=round(price_range_low, 2),
             price_range_high=round(price_range_high, 2),
             price_per_sqft=round(price_per_sqft, 2),
-            confidence_score=confidence_score,
+            confidence_score=float(confidence_score),
             input_summary={
-                "location": request.location.value,
-                "area_sqft": request.area_sqft,
-                "bhk": request.bhk,
-                "bathrooms": request.bathrooms,
-                "floor": request.floor,
-                "total_floors": request.total_floors,
-                "age_of_property": request.age_of_property,
-                "parking": bool(request.parking),
-                "lift": bool(request.lift),
+                "location": location,
+                "area_sqft": area_sqft,
+                "bhk": bhk,
+                "bathrooms": bathrooms,
+                "floor": floor,
+                "total_floors": total_floors,
+                "age_of_property": age_of_property,
+                "parking": bool(parking),
+                "lift": bool(lift),
             },
         )
 
+    def _feature_row(self) -> np.ndarray:
+        """Returns this thread's preallocated 1×9 raw feature row."""
+        row = getattr(self._rows, "row", None)
+        if row is None:
+            row = self._rows.row = np.empty((1, len(FEATURE_ORDER)))
+        return row
+
+    def predict(self, request: PredictionRequest) -> PredictionResponse:
+        """Runs inference and returns a structured prediction response.
+
+        Responses are served from the prediction cache when the same inputs
+        were priced recently by the currently loaded artifacts, and from the
+        precomputed price lattice when it is enabled and covers the request.
+        Stage timings and the cache result are recorded in the metrics.
+
+        Args:
+            request: Validated prediction request.
+
+        Returns:
+            PredictionResponse with price estimate and metadata.
+
+        Raises:
+            RuntimeError: If model is not loaded.
+            ValueError: If the location is not supported by the model.
+        """
+        return self.predict_values(request.location.value, request_values(request))
+
+    def predict_values(self, location: str, values: RequestValues) -> PredictionResponse:
+        """Prices one property given as a location and its numeric fields.
+
+        This is ``predict`` without a PredictionRequest, for callers that
+        decoded and validated the request themselves. The location is
+        encoded through the artifacts' location vocabulary into a
+        preallocated feature row.
+
+        Args:
+            location: NaviMumbaiLocation value.
+            values: Numeric fields in FEATURE_ORDER, as from ``request_values``.
+
+        Returns:
+            PredictionResponse with price estimate and metadata.
+
+        Raises:
+            RuntimeError: If model is not loaded.
+            ValueError: If the location is not supported by the model.
+        """
+        artifacts = self._artifacts
+        if artifacts is None:
+            raise RuntimeError("Model is not loaded. Call load() first.")
+
+        cache_key = (artifacts.version, location, *values)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            PREDICTIONS.labels(artifacts.version, "hit").inc()
+            return cached
+
+        start = time.perf_counter()
+        code = artifacts.vocabulary.code(location)
+        if code is None:
+            raise ValueError(artifacts.vocabulary.unsupported(location))
+        raw_features = self._feature_row()
+        raw_features[0] = (code, *values)
+        predicted_price = None
+        bounds = None
+        if artifacts.lattice is not None:
+            features_done = time.perf_counter()
+            hit = artifacts.lattice.lookup(
+                raw_features[0], exact_fallback=self._settings.lattice_exact_fallback
+            )
+            if hit is not None:
+                predicted_price, *lattice_bounds = hit
+                bounds = tuple(lattice_bounds) or None
+        if predicted_price is None:
+            features = artifacts.prepare_features(raw_features)
+            features_done = time.perf_counter()
+            if artifacts.has_intervals:
+                predicted_price, *bounds = artifacts.infer_interval(features)[0].tolist()
+            else:
+                predicted_price = float(artifacts.infer(features)[0])
+        predict_done = time.perf_counter()
+        response = self._response_from_values(location, values, predicted_price, bounds)
+        self._cache.put(cache_key, response)
+
+        FEATURES_STAGE.observe(features_done - start)
+        PREDICT_STAGE.observe(predict_done - features_done)
+        RESPONSE_STAGE.observe(time.perf_counter() - predict_done)
+        PREDICTIONS.labels(artifacts.version, "miss").inc()
+        return response
+
+    def predict_batch(
+        self, requests: Sequence[PredictionRequest]
+    ) -> list[BatchPredictionItem]:
+        """Runs vectorized inference over a batch of requests.
+
+        Locations are encoded and features scaled for the whole batch at once,
+        and the model is invoked a single time over the supported rows that
+        are neither cached nor answered by the price lattice, so each row
+        gets exactly the response ``predict`` would return.
+
+        Args:
+            requests: Validated prediction requests.
+
+        Returns:
+            One BatchPredictionItem per request, in input order, carrying
+            either the prediction or the per-row error message.
+
+        Raises:
+            RuntimeError: If model is not loaded.
+        """
+        artifacts = self._artifacts
+        if artifacts is None:
+            raise RuntimeError("Model is not loaded. Call load() first.")
+        if not requests:
+            return []
+
+        codes, errors = artifacts.encode_locations(requests)
+
+        responses: dict[int, PredictionResponse] = {}
+        cache_keys: dict[int, CacheKey] = {}
+        for i, request in enumerate(requests):
+            if i in errors:
+                continue
+            cache_keys[i] = make_cache_key(request, artifacts.version)
+            cached = self._cache.get(cache_keys[i])
+            if cached is not None:
+                responses[i] = cached
+
+        pending = [i for i in cache_keys if i not in responses]
+        if pending:
+            raw_features = build_raw_features([requests[i] for i in pending], codes[pending])
+            outputs = np.full((len(pending), 3 if artifacts.has_intervals else 1), np.nan)
+            if artifacts.lattice is not None:
+                exact_fallback = self._settings.lattice_exact_fallback
+                for j, row in enumerate(raw_features):
+                    hit = artifacts.lattice.lookup(row, exact_fallback=exact_fallback)
+                    if hit is not None:
+                        outputs[j] = hit
+            needs_model = np.isnan(outputs[:, 0])
+            if needs_model.any():
+                predict = (
+                    artifacts.predict_interval_raw if artifacts.has_intervals
+                    else artifacts.predict_raw
+                )
+                outputs[needs_model] = predict(raw_features[needs_model]).reshape(
+                    int(needs_model.sum()), -1
+                )
+            prices = outputs[:, 0]
+            bounds: list[tuple[float, float] | None] = [None] * len(pending)
+            if artifacts.has_intervals:
+                bounds = [(low, high) for low, high in outputs[:, 1:].tolist()]
+
+            for i, price, row_bounds in zip(pending, prices.tolist(), bounds):
+                responses[i] = self._build_response(requests[i], price, row_bounds)
+                self._cache.put(cache_keys[i], responses[i])
+
+        return [
+            BatchPredictionItem(index=i, prediction=responses.get(i), error=errors.get(i))
+            for i in range(len(requests))
+        ]
+
+    def sweep(self, request: SweepRequest) -> SweepResponse:
+        """Prices a what-if curve or grid around a base property.
+
+        The whole grid is assembled as one feature matrix and priced with a
+        single batched inference call. Points whose floor exceeds their total
+        floors, or whose location the model does not support, are not priced.
+
+        Args:
+            request: Validated sweep request.
+
+        Returns:
+            SweepResponse with a price curve (one axis) or grid (two axes).
+
+        Raises:
+            RuntimeError: If model is not loaded.
+            ValueError: If the base location is not supported and not swept.
+        """
+        artifacts = self._artifacts
+        if artifacts is None:
+            raise RuntimeError("Model is not loaded. Call load() first.")
+
+        axis_points = [axis.points() for axis in request.axes]
+        shape = tuple(len(points) for points in axis_points)
+        grid_index = np.indices(shape).reshape(len(shape), -1)
+        grid = np.repeat(
+            build_raw_features([request.base], np.zeros(1)), grid_index.shape[1], axis=0
+        )
+        priced = np.ones(len(grid), dtype=bool)
+        errors: list[str] = []
+
+        if all(axis.feature != "location" for axis in request.axes):
+            codes, location_errors = artifacts.encode_locations([request.base])
+            if location_errors:
+                raise ValueError(location_errors[0])
+            grid[:, 0] = codes[0]
+        for axis, points, index in zip(request.axes, axis_points, grid_index):
+            if axis.feature == "location":
+                codes, location_errors = artifacts.encode_location_names(points)
+                errors.extend(location_errors.values())
+                priced &= codes[index] >= 0
+                values = codes
+            else:
+                values = np.asarray(points, dtype=float)
+            grid[:, FEATURE_ORDER.index(axis.feature)] = values[index]
+
+        floor, total_floors = FEATURE_ORDER.index("floor"), FEATURE_ORDER.index("total_floors")
+        above_top = grid[:, floor] > grid[:, total_floors]
+        if above_top.any():
+            errors.append("Floor exceeds total floors at some points; they are left unpriced.")
+        priced &= ~above_top
+
+        prices = np.full(len(grid), np.nan)
+        if priced.any():
+            # Clamp negative predictions, as for single predictions.
+            prices[priced] = np.maximum(artifacts.predict_raw(grid[priced]), 0.0)
+        curve = [None if np.isnan(p) else round(p, 2) for p in prices.tolist()]
+        return SweepResponse(
+            axes=[
+                SweepAxisValues(feature=axis.feature, values=points)
+                for axis, points in zip(request.axes, axis_points)
+            ],
+            prices=curve if len(shape) == 1 else [
+                curve[i * shape[1]:(i + 1) * shape[1]] for i in range(shape[0])
+            ],
+            points=len(grid),
+            priced=int(priced.sum()),
+            errors=errors,
+            artifact_version=artifacts.version,
+        )
+
+    def compare_locations(
+        self, request: PredictionRequest, sort_by: str = "price"
+    ) -> LocationComparisonResponse:
+        """Prices the requested property in every supported locality.
+
+        All localities are priced with one batched inference call; market
+        statistics come from the location index built at load time.
+
+        Args:
+            request: Validated prediction request; its location only selects
+                ``selected_rank``.
+            sort_by: ``"price"`` or ``"price_per_sqft"``.
+
+        Returns:
+            LocationComparisonResponse ranked by ``sort_by``, highest first.
+
+        Raises:
+            RuntimeError: If model is not loaded.
+            ValueError: If the requested location is not supported.
+        """
+        artifacts = self._artifacts
+        if artifacts is None:
+            raise RuntimeError("Model is not loaded. Call load() first.")
+        selected = request.location.value
+        if artifacts.vocabulary.code(selected) is None:
+            raise ValueError(artifacts.vocabulary.unsupported(selected))
+
+        index = artifacts.location_index
+        raw = np.repeat(artifacts.build_raw_vector(request), len(index), axis=0)
+        raw[:, 0] = index.codes
+        prices = np.round(np.maximum(artifacts.predict_raw(raw), 0.0), 2)
+        per_sqft = np.round(prices / request.area_sqft, 2)
+        vs_market = np.round(per_sqft / index.median_price_per_sqft - 1.0, 4)
+
+        order = np.argsort(-(prices if sort_by == "price" else per_sqft), kind="stable")
+        items = [
+            LocationComparisonItem(
+                rank=rank,
+                location=index.names[i],
+                predicted_price=prices[i],
+                price_per_sqft=per_sqft[i],
+                vs_market_median=None if np.isnan(vs_market[i]) else vs_market[i],
+                market=index.market[i],
+            )
+            for rank, i in enumerate(order.tolist(), start=1)
+        ]
+        return LocationComparisonResponse(
+            sort_by=sort_by,
+            selected_location=selected,
+            selected_rank=next((item.rank for item in items if item.location == selected), None),
+            locations=items,
+            total=len(items),
+            artifact_version=artifacts.version,
+        )
+
+    def explain(self, request: PredictionRequest) -> ExplanationResponse:
+        """Attributes the model's prediction for a request to its features.
+
+        Contributions are path-dependent TreeSHAP values of the exact model
+        output (never the price lattice), so they sum to
+        ``predicted_price - base_price``.
+
+        Args:
+            request: Validated prediction request.
+
+        Returns:
+            ExplanationResponse with contributions sorted by magnitude.
+
+        Raises:
+            RuntimeError: If model is not loaded.
+            ValueError: If the requested location is not supported.
+            ExplanationUnavailableError: If the model cannot be explained.
+        """
+        artifacts = self._artifacts
+        if artifacts is None:
+            raise RuntimeError("Model is not loaded. Call load() first.")
+
+        raw_features = artifacts.build_raw_vector(request)
+        explainer = artifacts.explainer
+        contributions = explainer.explain(artifacts.prepare_features(raw_features))[0]
+        values = [request.location.value] + raw_features[0, 1:].tolist()
+        items = [
+            FeatureContributionItem(
+                name=FEATURE_ORDER[i],
+                display_name=FEATURE_DISPLAY_NAMES.get(FEATURE_ORDER[i], FEATURE_ORDER[i]),
+                value=values[i],
+                contribution=round(float(contributions[i]), 2),
+            )
+            for i in np.argsort(-np.abs(contributions), kind="stable")
+        ]
+        return ExplanationResponse(
+            predicted_price=round(explainer.expected_value + float(contributions.sum()), 2),
+            base_price=round(explainer.expected_value, 2),
+            contributions=items,
+            artifact_version=artifacts.version,
+        )
+
     def get_model_info(self) -> ModelInfoResponse:
         """Returns model metadata and performance metrics.
 
+        Version, dataset size and holdout metrics come from the training
+        metadata recorded with the serving artifacts.
+
         Returns:
             ModelInfoResponse with feature importance and metrics.
         """
-        feature_importance_items = [
-            FeatureImportanceItem(
-                name=item["name"],
-                importance=item["importance"],
-                display_name=FEATURE_DISPLAY_NAMES.get(item["name"], item["name"]),
-            )
-            for item in FEATURE_IMPORTANCE
-        ]
+        importance = self._artifacts.feature_importance if self._artifacts is not None else None
+        feature_importance_items = []
+        if importance is not None:
+            feature_importance_items = [
+                FeatureImportanceItem(
+                    name=FEATURE_ORDER[i],
+                    importance=round(float(importance[i]), 4),
+                    display_name=FEATURE_DISPLAY_NAMES.get(FEATURE_ORDER[i], FEATURE_ORDER[i]),
+                )
+                for i in np.argsort(-importance, kind="stable")
+            ]
 
+        model = self._artifacts.model if self._artifacts is not None else None
+        model_type = type(model).__name__ if model is not None else "GradientBoostingRegressor"
+        metadata = (self._artifacts.training_metadata if self._artifacts is not None else None) or {}
+        metrics = metadata.get("metrics")
         return ModelInfoResponse(
-            model_name="Gradient Boosting Regressor",
-            model_version="1.0.0",
+            model_name=MODEL_DISPLAY_NAMES.get(model_type, model_type),
+            model_version=metadata.get("trained_at", "unknown"),
             task_type="regression",
-            dataset_rows=2450,
+            dataset_rows=metadata.get("dataset_rows"),
             features=FEATURE_ORDER,
-            metrics=ModelMetrics(
-                r2_score=0.8385,
-                rmse=3_879_755.11,
-                mae=2_394_045.75,
-            ),
+            metrics=ModelMetrics(**metrics) if metrics is not None else None,
             feature_importance=feature_importance_items,
+            artifact_version=self.version,
+            loaded_at=self._artifacts.loaded_at if self._artifacts is not None else None,
         )
 
+    def get_cache_stats(self) -> CacheStatsResponse:
+        """Returns prediction cache counters for sizing the cache.
+
+        Returns:
+            CacheStatsResponse with hit/miss/eviction counters.
+        """
+        return self._cache.stats()
+
+    def get_lattice_stats(self) -> LatticeStatsResponse:
+        """Returns price lattice build time, footprint and error statistics.
+
+        Returns:
+            LatticeStatsResponse, with ``enabled=False`` if no lattice is active.
+        """
+        artifacts = self._artifacts
+        if artifacts is None or artifacts.lattice is None:
+            return LatticeStatsResponse(enabled=False)
+        return artifacts.lattice.stats()
+
     def get_known_locations(self) -> list[str]:
         """Returns list of location labels known to the label encoder.
 
         Returns:
             Sorted list of location strings.
         """
-        if self._label_encoder is not None:
-            return sorted(self._label_encoder.classes_.tolist())
+        if self._artifacts is not None:
+            return sorted(self._artifacts.label_encoder.classes_.tolist())
+        return []
+
+    def get_location_names(self) -> list[str]:
+        """Returns the display names of the localities the model supports.
+
+        Returns:
+            Sorted display names, computed once per artifact set.
+        """
+        if self._artifacts is not None:
+            return self._artifacts.vocabulary.display_names
         return []
 
 
 # Module-level singleton instance
 ml_service = MLService()
+
+
+def _model_info_samples() -> list[tuple[dict[str, str], float]]:
+    version = ml_service.version
+    return [({"artifact_version": version}, 1.0)] if version is not None else []
+
+
+def _cache_samples(field: str) -> Callable[[], list[tuple[dict[str, str], float]]]:
+    return lambda: [({}, float(getattr(ml_service.get_cache_stats(), field)))]
+
+
+REGISTRY.callback(
+    "model_info", "gauge", "Artifact version currently serving (always 1).", _model_info_samples
+)
+REGISTRY.callback(
+    "prediction_cache_entries", "gauge", "Entries in the prediction cache.", _cache_samples("size")
+)
+REGISTRY.callback(
+    "prediction_cache_evictions_total",
+    "counter",
+    "Prediction cache entries evicted by the size bound.",
+    _cache_samples("evictions"),
+)
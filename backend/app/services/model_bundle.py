@@ -0,0 +1,242 @@
+"""Versioned, memory-mappable model artifact bundle.
+
+Replaces the three pickles (model, scaler, label encoder) with a directory of
+``.npy`` arrays plus a ``manifest.json``:
+
+  - compiled tree arrays (feature, left, value, roots) shared by both layouts
+  - ``threshold_scaled.npy``: float32 thresholds for standardized inputs
+  - ``threshold_raw.npy``: float64 thresholds with the scaler folded in
+  - ``scaler_mean.npy`` / ``scaler_scale.npy``: StandardScaler statistics
+  - ``locations.npy``: sorted location vocabulary of the label encoder
+  - ``cover.npy``: training samples per node, for feature attribution
+    (optional; bundles without it serve predictions but no explanations)
+
+When quantile models are exported too, their trees follow the point model's
+in the same arrays and the manifest records where each output's trees start,
+so one traversal yields the price and its range.
+
+Loading uses ``numpy.load(mmap_mode="r")`` and needs neither pickle nor
+scikit-learn, which keeps cold starts short.
+Follows Google Python Style Guide with full type annotations.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from app.services.tree_engine import CompiledEnsemble
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+_ARRAY_NAMES = (
+    "feature",
+    "left",
+    "value",
+    "roots",
+    "threshold_scaled",
+    "threshold_raw",
+    "scaler_mean",
+    "scaler_scale",
+    "locations",
+)
+_OPTIONAL_ARRAY_NAMES = ("cover",)
+
+
+class BundleScaler:
+    """StandardScaler stand-in backed by the bundle's mean and scale arrays."""
+
+    def __init__(self, mean: np.ndarray, scale: np.ndarray) -> None:
+        self.mean_ = mean
+        self.scale_ = scale
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """Standardizes ``X`` exactly as ``StandardScaler.transform`` does."""
+        return (np.asarray(X, dtype=np.float64) - self.mean_) / self.scale_
+
+
+class BundleLabelEncoder:
+    """LabelEncoder stand-in backed by the bundle's sorted vocabulary."""
+
+    def __init__(self, classes: np.ndarray) -> None:
+        self.classes_ = classes
+
+    def transform(self, values: Any) -> np.ndarray:
+        """Maps labels to their index in ``classes_``.
+
+        Raises:
+            ValueError: If any label is not part of the vocabulary.
+        """
+        values = np.asarray(values)
+        codes = np.searchsorted(self.classes_, values)
+        codes = np.minimum(codes, len(self.classes_) - 1)
+        if not np.all(self.classes_[codes] == values):
+            raise ValueError(f"y contains previously unseen labels: {values}")
+        return codes
+
+
+class ModelBundle:
+    """Artifacts loaded from a bundle directory.
+
+    Attributes:
+        path: Bundle directory.
+        manifest: Parsed ``manifest.json``.
+        scaler: Scaler stand-in for unfolded inference.
+        label_encoder: Label encoder stand-in for the location column.
+    """
+
+    def __init__(self, path: Path, manifest: dict[str, Any], arrays: dict[str, np.ndarray]) -> None:
+        self.path = path
+        self.manifest = manifest
+        self._arrays = arrays
+        self.scaler = BundleScaler(arrays["scaler_mean"], arrays["scaler_scale"])
+        self.label_encoder = BundleLabelEncoder(arrays["locations"])
+
+    @property
+    def fingerprint(self) -> str:
+        """Returns the content digest recorded at export time."""
+        return self.manifest["fingerprint"]
+
+    @property
+    def quantiles(self) -> tuple[float, ...]:
+        """Returns the quantiles of outputs 1.. (empty for point-only bundles)."""
+        return tuple(self.manifest.get("quantiles", ()))
+
+    def engine(self, fold_scaler: bool) -> CompiledEnsemble:
+        """Builds a compiled ensemble over the memory-mapped tree arrays.
+
+        Args:
+            fold_scaler: If True, use raw-space thresholds so inputs need no
+                scaling; otherwise use float32 thresholds for scaled inputs.
+
+        Returns:
+            CompiledEnsemble sharing memory with the bundle files.
+        """
+        arrays = self._arrays
+        return CompiledEnsemble(
+            feature=arrays["feature"],
+            threshold=arrays["threshold_raw"] if fold_scaler else arrays["threshold_scaled"],
+            left=arrays["left"],
+            value=arrays["value"],
+            roots=arrays["roots"],
+            base_score=self.manifest["base_score"],
+            max_depth=self.manifest["max_depth"],
+            n_features=self.manifest["n_features"],
+            input_dtype=np.float64 if fold_scaler else np.float32,
+            output_starts=self.manifest.get("output_starts"),
+            base_scores=self.manifest.get("base_scores"),
+            cover=arrays.get("cover"),
+        )
+
+
+def write_bundle(
+    bundle_dir: Path,
+    model: Any,
+    scaler: Any,
+    label_encoder: Any,
+    features: list[str],
+    metadata: dict[str, Any] | None = None,
+    quantile_models: dict[float, Any] | None = None,
+) -> Path:
+    """Exports fitted sklearn artifacts into a bundle directory.
+
+    Args:
+        bundle_dir: Destination directory; existing bundle files are replaced.
+        model: Fitted GradientBoostingRegressor trained on scaled features.
+        scaler: Fitted StandardScaler.
+        label_encoder: Fitted LabelEncoder for the location column.
+        features: Feature names in model input order.
+        metadata: Extra JSON-serializable metadata stored in the manifest.
+        quantile_models: Quantile → fitted quantile GradientBoostingRegressor
+            on the same scaled features, fused after the point model in
+            ascending quantile order.
+
+    Returns:
+        Path of the written ``manifest.json``.
+    """
+    models = [model] + [quantile_models[q] for q in sorted(quantile_models or {})]
+    scaled = CompiledEnsemble.fuse([CompiledEnsemble.from_gradient_boosting(m) for m in models])
+    folded = CompiledEnsemble.fuse(
+        [CompiledEnsemble.from_gradient_boosting(m, scaler=scaler) for m in models]
+    )
+
+    arrays = {
+        "feature": scaled.feature,
+        "left": scaled.left,
+        "value": scaled.value,
+        "roots": scaled.roots,
+        "threshold_scaled": scaled.threshold,
+        "threshold_raw": folded.threshold,
+        "scaler_mean": np.asarray(scaler.mean_, dtype=np.float64),
+        "scaler_scale": np.asarray(scaler.scale_, dtype=np.float64),
+        "locations": np.asarray(label_encoder.classes_, dtype=str),
+        "cover": scaled.cover,
+    }
+
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    for name in _ARRAY_NAMES + _OPTIONAL_ARRAY_NAMES:
+        np.save(bundle_dir / f"{name}.npy", arrays[name], allow_pickle=False)
+        digest.update(name.encode())
+        digest.update(arrays[name].tobytes())
+
+    manifest = {
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "fingerprint": digest.hexdigest(),
+        "features": list(features),
+        "n_features": scaled.n_features,
+        "n_trees": scaled.n_trees,
+        "n_nodes": scaled.n_nodes,
+        "max_depth": scaled.max_depth,
+        "base_score": scaled.base_score,
+        "quantiles": sorted(quantile_models or {}),
+        "output_starts": scaled.output_starts.tolist(),
+        "base_scores": scaled.base_scores.tolist(),
+        "model": {
+            "class": type(model).__name__,
+            "n_estimators": int(model.n_estimators_),
+            "learning_rate": float(model.learning_rate),
+            "max_depth": getattr(model, "max_depth", None),
+        },
+        **(metadata or {}),
+    }
+    manifest_path = bundle_dir / MANIFEST_NAME
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+    logger.info("Saved model bundle → %s", bundle_dir)
+    return manifest_path
+
+
+def load_bundle(bundle_dir: Path) -> ModelBundle:
+    """Memory-maps a bundle directory written by ``write_bundle``.
+
+    Args:
+        bundle_dir: Bundle directory.
+
+    Returns:
+        ModelBundle backed by read-only memory maps.
+
+    Raises:
+        FileNotFoundError: If the manifest or an array file is missing.
+        ValueError: If the bundle format version is not supported.
+    """
+    manifest = json.loads((bundle_dir / MANIFEST_NAME).read_text())
+    if manifest.get("format_version") != BUNDLE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported model bundle format: {manifest.get('format_version')}")
+
+    arrays = {
+        name: np.load(bundle_dir / f"{name}.npy", mmap_mode="r", allow_pickle=False)
+        for name in _ARRAY_NAMES
+    }
+    for name in _OPTIONAL_ARRAY_NAMES:
+        path = bundle_dir / f"{name}.npy"
+        if path.exists():
+            arrays[name] = np.load(path, mmap_mode="r", allow_pickle=False)
+    return ModelBundle(bundle_dir, manifest, arrays)
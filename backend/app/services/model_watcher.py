@@ -0,0 +1,116 @@
+"""Polling file watcher that hot-swaps model artifacts when they change.
+
+Watches the artifact files in ``Settings.model_dir`` (the three pickles, or
+the bundle manifest, which ``write_bundle`` writes last) by polling their
+modification time and size. A change triggers ``ml_service.reload`` only once
+the files have stopped changing for one interval, so a training run that
+writes several files is picked up as a single reload.
+Follows Google Python Style Guide with full type annotations.
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Callable
+
+from app.core.config import get_settings
+from app.services.ml_service import ml_service
+from app.services.model_bundle import MANIFEST_NAME
+
+logger = logging.getLogger(__name__)
+
+Signature = tuple[tuple[str, int, int] | None, ...]
+
+
+def _signature(paths: list[Path]) -> Signature:
+    """Returns (path, mtime, size) per file, or None for missing files."""
+    result = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            result.append(None)
+            continue
+        result.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(result)
+
+
+class ModelWatcher:
+    """Background thread that calls ``on_change`` when watched files change."""
+
+    def __init__(
+        self,
+        paths: Callable[[], list[Path]],
+        on_change: Callable[[], object],
+        interval_seconds: float = 5.0,
+    ) -> None:
+        self._paths = paths
+        self._on_change = on_change
+        self._interval = max(0.01, interval_seconds)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.reloads = 0
+        self.failures = 0
+
+    def start(self) -> None:
+        """Starts polling in a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="model-watcher", daemon=True)
+        self._thread.start()
+        logger.info("Watching model artifacts every %.1fs.", self._interval)
+
+    def stop(self) -> None:
+        """Stops polling and waits for the thread to exit."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        """Polls file signatures until stopped."""
+        applied = _signature(self._paths())
+        previous = applied
+        while not self._stop.wait(self._interval):
+            current = _signature(self._paths())
+            # Act once the files differ from what was applied and are stable.
+            # Missing files are not waited for: histogram models have no scaler.
+            if current != applied and current == previous:
+                applied = current
+                self._trigger()
+            previous = current
+
+    def _trigger(self) -> None:
+        """Runs ``on_change``, logging rather than propagating failures."""
+        logger.info("Model artifacts changed on disk; reloading.")
+        try:
+            self._on_change()
+            self.reloads += 1
+        except Exception as exc:
+            self.failures += 1
+            logger.error("Model reload after file change failed: %s", exc)
+
+
+def artifact_paths() -> list[Path]:
+    """Returns the artifact files the configured format loads."""
+    settings = get_settings()
+    if settings.artifact_format == "bundle":
+        return [settings.bundle_dir / MANIFEST_NAME]
+    return [
+        settings.model_path,
+        settings.scaler_path,
+        settings.label_encoder_path,
+        settings.quantile_models_path,
+    ]
+
+
+_settings = get_settings()
+
+# Module-level singleton instance
+model_watcher = ModelWatcher(
+    artifact_paths,
+    ml_service.reload,
+    interval_seconds=_settings.model_watch_interval_seconds,
+)
@@ -0,0 +1,155 @@
+"""Bounded in-process LRU cache for prediction responses.
+
+Caches PredictionResponse objects keyed on the canonical tuple of
+PredictionRequest fields, with a size bound, per-entry TTL and
+hit/miss/eviction counters. Follows Google Python Style Guide.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from app.schemas.prediction import CacheStatsResponse, PredictionRequest, PredictionResponse
+
+# Numeric request fields in FEATURE_ORDER: area, then seven integer fields.
+RequestValues = tuple[float, int, int, int, int, int, int, int]
+CacheKey = tuple[str, str, float, int, int, int, int, int, int, int]
+
+
+def request_values(request: PredictionRequest) -> RequestValues:
+    """Returns the numeric fields of a request in FEATURE_ORDER.
+
+    Types are normalised so equal inputs (e.g. ``950`` and ``950.0``) give
+    equal tuples: the area is a float and every other field an int.
+
+    Args:
+        request: Validated prediction request.
+
+    Returns:
+        Tuple of area, BHK, bathrooms, floor, total floors, age, parking and lift.
+    """
+    return (
+        float(request.area_sqft),
+        int(request.bhk),
+        int(request.bathrooms),
+        int(request.floor),
+        int(request.total_floors),
+        int(request.age_of_property),
+        int(request.parking),
+        int(request.lift),
+    )
+
+
+def make_cache_key(request: PredictionRequest, model_version: str = "") -> CacheKey:
+    """Builds the canonical cache key for a prediction request.
+
+    Args:
+        request: Validated prediction request.
+        model_version: Version of the artifacts that produce the response, so
+            entries written by a request still running on replaced artifacts
+            can never be served by the new ones.
+
+    Returns:
+        Tuple of the model version, the location and ``request_values``.
+    """
+    return (model_version, request.location.value, *request_values(request))
+
+
+class PredictionCache:
+    """Thread-safe LRU cache with a time-to-live for prediction responses.
+
+    A ``max_size`` of 0 disables caching; every lookup is then a miss and
+    nothing is stored.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_size = max(0, int(max_size))
+        self._ttl_seconds = float(ttl_seconds)
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, tuple[float, PredictionResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Returns whether the cache stores entries at all."""
+        return self._max_size > 0
+
+    def get(self, key: CacheKey) -> PredictionResponse | None:
+        """Returns the cached response for ``key`` if present and fresh.
+
+        Args:
+            key: Key built by ``make_cache_key``.
+
+        Returns:
+            The cached PredictionResponse, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, response = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return response
+
+    def put(self, key: CacheKey, response: PredictionResponse) -> None:
+        """Stores a response, evicting the least recently used entry if full.
+
+        Args:
+            key: Key built by ``make_cache_key``.
+            response: Prediction to cache.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl_seconds, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drops all entries, e.g. after the model artifacts are reloaded."""
+        with self._lock:
+            self._entries.clear()
+            self._invalidations += 1
+
+    def stats(self) -> CacheStatsResponse:
+        """Returns a snapshot of the cache counters.
+
+        Returns:
+            CacheStatsResponse with size, limits and hit/miss/eviction counters.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return CacheStatsResponse(
+                enabled=self.enabled,
+                size=len(self._entries),
+                max_size=self._max_size,
+                ttl_seconds=self._ttl_seconds,
+                hits=self._hits,
+                misses=self._misses,
+                hit_rate=self._hits / lookups if lookups else 0.0,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+            )
@@ -0,0 +1,352 @@
+"""Asynchronous prediction log with bulk writes to pluggable sinks.
+
+Route handlers call ``PredictionLog.record`` for every priced request. It only
+appends a reference to an in-memory buffer, so the request path does no
+serialisation or I/O. A background task drains the buffer every flush
+interval, or as soon as a full batch is waiting, and serialises the batch on a
+worker thread. Each sink then receives the batch as one bulk write.
+
+The buffer is bounded. When the sinks fall behind, new records are dropped and
+counted instead of slowing requests down.
+Follows Google Python Style Guide with full type annotations.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Protocol, Sequence
+
+from app.core.config import get_settings
+from app.core.metrics import REGISTRY
+from app.schemas.prediction import (
+    PredictionLogStatsResponse,
+    PredictionRequest,
+    PredictionResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+# Columns of a logged row, in the order of the SQLite table.
+LOG_COLUMNS = (
+    "logged_at",
+    "endpoint",
+    "artifact_version",
+    "latency_ms",
+    "location",
+    "area_sqft",
+    "bhk",
+    "bathrooms",
+    "floor",
+    "total_floors",
+    "age_of_property",
+    "parking",
+    "lift",
+    "predicted_price",
+    "price_range_low",
+    "price_range_high",
+)
+
+# (unix time, endpoint, request, response, artifact version, latency seconds)
+LogEntry = tuple[float, str, PredictionRequest, PredictionResponse, str | None, float]
+
+
+class PredictionLogSink(Protocol):
+    """Destination for batches of logged predictions."""
+
+    name: str
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        """Persists a batch of rows with LOG_COLUMNS keys."""
+
+    def close(self) -> None:
+        """Releases any resources held by the sink."""
+
+
+class JsonlSink:
+    """Appends one JSON object per prediction to a file.
+
+    The file is opened per batch, so it can be rotated by moving it away.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.name = f"jsonl:{path}"
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        """Appends ``rows`` to the file in a single write."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = "".join(json.dumps(row, separators=(",", ":")) + "\n" for row in rows)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(data)
+
+    def close(self) -> None:
+        """Nothing to release; the file is closed after every batch."""
+
+
+class SqliteSink:
+    """Inserts predictions into the ``predictions`` table of a SQLite database.
+
+    The connection is opened on the first write. It is shared across the
+    executor threads that run flushes, which never overlap.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.name = f"sqlite:{path}"
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"CREATE TABLE IF NOT EXISTS predictions ({', '.join(LOG_COLUMNS)})")
+        return conn
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        """Inserts ``rows`` in one transaction."""
+        if self._conn is None:
+            self._conn = self._connect()
+        placeholders = ", ".join("?" for _ in LOG_COLUMNS)
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO predictions VALUES ({placeholders})",
+                [tuple(row[column] for column in LOG_COLUMNS) for row in rows],
+            )
+
+    def close(self) -> None:
+        """Closes the connection, if one was opened."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def to_row(entry: LogEntry) -> dict[str, Any]:
+    """Flattens a buffered entry into a row with LOG_COLUMNS keys."""
+    logged_at, endpoint, request, response, artifact_version, latency_s = entry
+    timestamp = datetime.fromtimestamp(logged_at, timezone.utc)
+    return {
+        "logged_at": timestamp.isoformat(timespec="milliseconds"),
+        "endpoint": endpoint,
+        "artifact_version": artifact_version,
+        "latency_ms": round(latency_s * 1000.0, 3),
+        "location": request.location.value,
+        "area_sqft": request.area_sqft,
+        "bhk": request.bhk,
+        "bathrooms": request.bathrooms,
+        "floor": request.floor,
+        "total_floors": request.total_floors,
+        "age_of_property": request.age_of_property,
+        "parking": request.parking,
+        "lift": request.lift,
+        "predicted_price": response.predicted_price,
+        "price_range_low": response.price_range_low,
+        "price_range_high": response.price_range_high,
+    }
+
+
+class PredictionLog:
+    """Bounded in-memory buffer of predictions, flushed in bulk to sinks.
+
+    ``record`` and ``record_many`` must be called from the event loop. The
+    flush task starts with the first record on each loop, and ``close``
+    flushes whatever is still buffered.
+    """
+
+    def __init__(
+        self,
+        sinks: Sequence[PredictionLogSink],
+        max_queue: int = 10_000,
+        flush_interval_s: float = 1.0,
+        flush_batch_size: int = 1_000,
+    ) -> None:
+        self._sinks = list(sinks)
+        self._max_queue = max(1, max_queue)
+        self._flush_interval_s = max(0.001, flush_interval_s)
+        self._flush_batch_size = max(1, flush_batch_size)
+        self._buffer: list[LogEntry] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._closing = False
+
+        self._logged = 0
+        self._dropped = 0
+        self._failed = 0
+        self._flushes = 0
+        self._last_flush_ms = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Returns whether any sink is configured."""
+        return bool(self._sinks)
+
+    def record(
+        self,
+        endpoint: str,
+        request: PredictionRequest,
+        response: PredictionResponse,
+        artifact_version: str | None,
+        latency_s: float,
+    ) -> None:
+        """Buffers one prediction, or drops it if the buffer is full.
+
+        Args:
+            endpoint: Route that served the prediction, e.g. ``"predict"``.
+            request: Validated prediction request.
+            response: Prediction returned to the client.
+            artifact_version: Version of the artifacts serving the request.
+            latency_s: Time spent producing the prediction.
+        """
+        if not self._sinks:
+            return
+        if len(self._buffer) >= self._max_queue:
+            self._dropped += 1
+            return
+        self._buffer.append((time.time(), endpoint, request, response, artifact_version, latency_s))
+        self._after_append()
+
+    def record_many(
+        self,
+        endpoint: str,
+        items: Sequence[tuple[PredictionRequest, PredictionResponse]],
+        artifact_version: str | None,
+        latency_s: float,
+    ) -> None:
+        """Buffers the rows of one batch call that share a latency.
+
+        Args:
+            endpoint: Route that served the batch.
+            items: (request, response) pairs of the rows that were priced.
+            artifact_version: Version of the artifacts serving the batch.
+            latency_s: Time spent pricing the whole batch.
+        """
+        if not self._sinks or not items:
+            return
+        room = self._max_queue - len(self._buffer)
+        self._dropped += max(0, len(items) - room)
+        now = time.time()
+        self._buffer.extend(
+            (now, endpoint, request, response, artifact_version, latency_s)
+            for request, response in items[: max(0, room)]
+        )
+        self._after_append()
+
+    def _after_append(self) -> None:
+        """Starts the flush task if needed and wakes it for a full batch."""
+        loop = asyncio.get_running_loop()
+        if not self._closing and (
+            self._task is None or self._task.done() or self._task.get_loop() is not loop
+        ):
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        if len(self._buffer) >= self._flush_batch_size:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Flushes on every interval or wake-up until the log is closed."""
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._flush_interval_s)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Writes everything buffered so far to every sink on a worker thread."""
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        start = time.perf_counter()
+        failures = await asyncio.to_thread(self._write, batch)
+        self._last_flush_ms = (time.perf_counter() - start) * 1000.0
+        self._flushes += 1
+        if failures:
+            self._failed += len(batch)
+        else:
+            self._logged += len(batch)
+
+    def _write(self, batch: list[LogEntry]) -> int:
+        """Serialises a batch and writes it to each sink.
+
+        Returns:
+            Number of sinks whose write failed.
+        """
+        rows = [to_row(entry) for entry in batch]
+        failures = 0
+        for sink in self._sinks:
+            try:
+                sink.write(rows)
+            except Exception as exc:
+                failures += 1
+                logger.error(
+                    "Prediction log sink %s failed to write %d rows: %s", sink.name, len(rows), exc
+                )
+        return failures
+
+    async def close(self) -> None:
+        """Stops the flush task, writes the remaining buffer and closes the sinks."""
+        self._closing = True
+        task = self._task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            self._wakeup.set()
+            await task
+        await self.flush()
+        for sink in self._sinks:
+            sink.close()
+
+    def stats(self) -> PredictionLogStatsResponse:
+        """Returns buffer occupancy and write counters.
+
+        Returns:
+            PredictionLogStatsResponse with queue, drop and flush counters.
+        """
+        return PredictionLogStatsResponse(
+            enabled=self.enabled,
+            sinks=[sink.name for sink in self._sinks],
+            queued=len(self._buffer),
+            max_queue=self._max_queue,
+            logged=self._logged,
+            dropped=self._dropped,
+            failed=self._failed,
+            flushes=self._flushes,
+            last_flush_ms=self._last_flush_ms,
+        )
+
+
+def build_sinks() -> list[PredictionLogSink]:
+    """Returns the sinks configured in the settings (none if disabled)."""
+    settings = get_settings()
+    if not settings.prediction_log_enabled:
+        return []
+    sinks: list[PredictionLogSink] = [JsonlSink(settings.prediction_log_path)]
+    if settings.prediction_log_sqlite_path is not None:
+        sinks.append(SqliteSink(settings.prediction_log_sqlite_path))
+    return sinks
+
+
+_settings = get_settings()
+
+# Module-level singleton instance
+prediction_log = PredictionLog(
+    build_sinks(),
+    max_queue=_settings.prediction_log_max_queue,
+    flush_interval_s=_settings.prediction_log_flush_interval_seconds,
+    flush_batch_size=_settings.prediction_log_flush_batch_size,
+)
+
+REGISTRY.callback(
+    "prediction_log_queued",
+    "gauge",
+    "Predictions buffered in memory awaiting a flush.",
+    lambda: [({}, float(len(prediction_log._buffer)))] if prediction_log.enabled else [],
+)
+REGISTRY.callback(
+    "prediction_log_dropped_total",
+    "counter",
+    "Predictions dropped because the log buffer was full.",
+    lambda: [({}, float(prediction_log._dropped))] if prediction_log.enabled else [],
+)
@@ -0,0 +1,419 @@
+"""Compiled flat-array evaluator for tree ensembles.
+
+Exports the fitted trees of a scikit-learn GradientBoostingRegressor into
+contiguous NumPy arrays and evaluates all trees for all rows with vectorized
+traversal, avoiding sklearn's per-call validation and per-tree dispatch.
+Several ensembles over the same features (e.g. a point model and its quantile
+models) can be fused into one, so all their outputs come from a single pass.
+Follows Google Python Style Guide with full type annotations.
+"""
+
+from typing import Any
+
+import numpy as np
+
+
+class CompiledEnsemble:
+    """Additive tree ensemble stored as flat node arrays.
+
+    All trees share one set of node arrays; ``roots`` holds the offset of each
+    tree's root node. Nodes are laid out breadth-first so that the right child
+    always directly follows the left child, which lets traversal compute the
+    next node as ``left + (x > threshold)``. Leaves point to themselves and
+    carry an infinite threshold, so every row can be advanced exactly
+    ``max_depth`` times without masking. Leaf values are pre-multiplied by the
+    learning rate, so a prediction is ``base_score + sum(value[leaf])``.
+
+    Attributes:
+        feature: Split feature index per node (0 for leaves).
+        threshold: Split threshold per node (``+inf`` for leaves), stored in
+            ``input_dtype`` rounded towards ``-inf`` so that ``x <= t`` gives
+            the same decision as the float64 comparison for every input ``x``.
+        left: Global index of the left child per node (the node itself for
+            leaves); the right child is at ``left + 1``.
+        value: Contribution of each node when reached as a leaf.
+        roots: Global index of each tree's root node.
+        base_score: Constant initial prediction of the ensemble.
+        max_depth: Maximum depth over all trees.
+        n_features: Number of input features expected.
+        input_dtype: Dtype inputs are cast to before comparison. sklearn
+            compares float32 inputs against float64 thresholds, so the
+            default reproduces its split decisions exactly.
+        output_starts: Index of the first tree of each output; trees of one
+            output are contiguous. Output 0 is the primary prediction.
+        base_scores: Constant initial prediction of each output.
+        cover: Weighted number of training samples reaching each node, or
+            None if unknown. Needed only for feature attribution.
+    """
+
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        value: np.ndarray,
+        roots: np.ndarray,
+        base_score: float,
+        max_depth: int,
+        n_features: int,
+        input_dtype: Any = np.float32,
+        output_starts: np.ndarray | None = None,
+        base_scores: np.ndarray | None = None,
+        cover: np.ndarray | None = None,
+    ) -> None:
+        self.input_dtype = np.dtype(input_dtype)
+        self.feature = np.ascontiguousarray(feature, dtype=np.int32)
+        self.threshold = _round_down(np.asarray(threshold), self.input_dtype)
+        self.left = np.ascontiguousarray(left, dtype=np.int32)
+        self.value = np.ascontiguousarray(value, dtype=np.float64)
+        self.roots = np.ascontiguousarray(roots, dtype=np.int32)
+        self.base_score = float(base_score)
+        self.max_depth = int(max_depth)
+        self.n_features = int(n_features)
+        self.output_starts = np.zeros(1, dtype=np.int64) if output_starts is None else np.asarray(
+            output_starts, dtype=np.int64
+        )
+        self.base_scores = np.array([self.base_score]) if base_scores is None else np.asarray(
+            base_scores, dtype=np.float64
+        )
+        self.cover = None if cover is None else np.ascontiguousarray(cover, dtype=np.float64)
+
+    @property
+    def n_trees(self) -> int:
+        """Returns the number of trees in the ensemble."""
+        return len(self.roots)
+
+    @property
+    def n_nodes(self) -> int:
+        """Returns the total number of nodes across all trees."""
+        return len(self.feature)
+
+    @property
+    def n_outputs(self) -> int:
+        """Returns the number of fused outputs."""
+        return len(self.output_starts)
+
+    @classmethod
+    def fuse(cls, ensembles: list["CompiledEnsemble"]) -> "CompiledEnsemble":
+        """Concatenates ensembles over the same inputs into one multi-output ensemble.
+
+        Args:
+            ensembles: Single-output ensembles with the same ``n_features``
+                and ``input_dtype``; the first becomes output 0.
+
+        Returns:
+            CompiledEnsemble whose ``predict_outputs`` evaluates every input
+            ensemble in one traversal pass.
+
+        Raises:
+            ValueError: If the ensembles are incompatible.
+        """
+        first = ensembles[0]
+        for other in ensembles:
+            if other.n_outputs != 1:
+                raise ValueError("Only single-output ensembles can be fused.")
+            if other.n_features != first.n_features or other.input_dtype != first.input_dtype:
+                raise ValueError("Fused ensembles must share their input features and dtype.")
+
+        node_offsets = np.cumsum([0] + [e.n_nodes for e in ensembles[:-1]])
+        covers = [e.cover for e in ensembles]
+        return cls(
+            feature=np.concatenate([e.feature for e in ensembles]),
+            threshold=np.concatenate([e.threshold for e in ensembles]),
+            left=np.concatenate([e.left + offset for e, offset in zip(ensembles, node_offsets)]),
+            value=np.concatenate([e.value for e in ensembles]),
+            roots=np.concatenate([e.roots + offset for e, offset in zip(ensembles, node_offsets)]),
+            base_score=first.base_score,
+            max_depth=max(e.max_depth for e in ensembles),
+            n_features=first.n_features,
+            input_dtype=first.input_dtype,
+            output_starts=np.cumsum([0] + [e.n_trees for e in ensembles[:-1]]),
+            base_scores=np.array([e.base_score for e in ensembles]),
+            cover=None if any(c is None for c in covers) else np.concatenate(covers),
+        )
+
+    @classmethod
+    def from_gradient_boosting(cls, model: Any, scaler: Any = None) -> "CompiledEnsemble":
+        """Exports a fitted GradientBoostingRegressor into flat arrays.
+
+        Args:
+            model: Fitted sklearn GradientBoostingRegressor with squared-error
+                loss and a constant initial estimator.
+            scaler: Optional fitted StandardScaler the model was trained
+                behind. When given, its mean and scale are folded into the
+                split thresholds so the ensemble consumes raw features.
+
+        Returns:
+            CompiledEnsemble producing the same predictions as ``model.predict``
+            (or as ``model.predict(scaler.transform(X))`` when folded).
+
+        Raises:
+            ValueError: If the model is not a supported single-output regressor.
+        """
+        estimators = getattr(model, "estimators_", None)
+        if estimators is None or estimators.ndim != 2 or estimators.shape[1] != 1:
+            raise ValueError("Only fitted single-output gradient boosting regressors are supported.")
+
+        init = getattr(model, "init_", None)
+        if init == "zero":
+            base_score = 0.0
+        elif hasattr(init, "constant_"):
+            base_score = float(np.ravel(init.constant_)[0])
+        else:
+            raise ValueError(f"Unsupported initial estimator: {init!r}")
+
+        n_features = int(model.n_features_in_)
+        feature_mean = feature_scale = None
+        if scaler is not None:
+            feature_mean, feature_scale = _scaler_stats(scaler, n_features)
+
+        trees = [est.tree_ for est in estimators[:, 0]]
+        return cls.from_sklearn_trees(
+            trees,
+            scale=float(model.learning_rate),
+            base_score=base_score,
+            n_features=n_features,
+            feature_mean=feature_mean,
+            feature_scale=feature_scale,
+        )
+
+    @classmethod
+    def from_sklearn_trees(
+        cls,
+        trees: list[Any],
+        scale: float,
+        base_score: float,
+        n_features: int,
+        feature_mean: np.ndarray | None = None,
+        feature_scale: np.ndarray | None = None,
+    ) -> "CompiledEnsemble":
+        """Concatenates sklearn ``Tree`` objects into one flat ensemble.
+
+        sklearn decides a split on scaled input as
+        ``float32((x - mean) / scale) <= t``, which is monotone in ``x`` for
+        positive ``scale``. Passing the scaler statistics rewrites every
+        threshold into the raw-feature cut point with the same decision, so
+        the scaler can be skipped at inference time.
+
+        Args:
+            trees: Fitted ``sklearn.tree._tree.Tree`` instances.
+            scale: Factor applied to every leaf value (the learning rate).
+            base_score: Constant initial prediction.
+            n_features: Number of input features expected.
+            feature_mean: Per-feature mean to fold into the thresholds.
+            feature_scale: Per-feature positive scale to fold into the thresholds.
+
+        Returns:
+            CompiledEnsemble over all the given trees. Folded ensembles compare
+            in float64, since their inputs are raw unscaled features.
+        """
+        features, thresholds, lefts, values, covers, roots = [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        for tree in trees:
+            order = _breadth_first_order(tree.children_left, tree.children_right)
+            n = len(order)
+            position = np.empty(n, dtype=np.int64)
+            position[order] = np.arange(n)
+
+            children_left = tree.children_left[order]
+            is_leaf = children_left < 0
+            node_ids = np.arange(offset, offset + n, dtype=np.int64)
+            feature = np.where(is_leaf, 0, tree.feature[order])
+            threshold = tree.threshold[order]
+            if feature_scale is not None:
+                threshold = np.where(
+                    is_leaf,
+                    np.inf,
+                    _fold_thresholds(threshold, feature_mean[feature], feature_scale[feature]),
+                )
+
+            features.append(feature)
+            thresholds.append(np.where(is_leaf, np.inf, threshold))
+            lefts.append(np.where(is_leaf, node_ids, position[children_left] + offset))
+            values.append(tree.value.reshape(tree.node_count)[order] * scale)
+            covers.append(tree.weighted_n_node_samples[order])
+            roots.append(offset)
+
+            max_depth = max(max_depth, int(tree.max_depth))
+            offset += n
+
+        return cls(
+            feature=np.concatenate(features),
+            threshold=np.concatenate(thresholds),
+            left=np.concatenate(lefts),
+            value=np.concatenate(values),
+            roots=np.array(roots),
+            base_score=base_score,
+            max_depth=max_depth,
+            n_features=n_features,
+            input_dtype=np.float32 if feature_scale is None else np.float64,
+            cover=np.concatenate(covers),
+        )
+
+    def apply(self, X: np.ndarray, trees: slice = slice(None)) -> np.ndarray:
+        """Returns the global leaf index reached in every tree for every row.
+
+        Args:
+            X: 2-D array of shape (n_rows, n_features).
+            trees: Range of trees to evaluate; all by default.
+
+        Returns:
+            Integer array of shape (n_rows, number of trees evaluated).
+
+        Raises:
+            ValueError: If ``X`` has the wrong number of features.
+        """
+        X = np.asarray(X, dtype=self.input_dtype)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(
+                f"Expected input of shape (n_rows, {self.n_features}), got {X.shape}."
+            )
+
+        # Gather from the flattened input: row r, feature f lives at r * n_features + f.
+        flat_X = X.ravel()
+        row_offsets = (np.arange(X.shape[0]) * self.n_features)[:, None]
+        roots = self.roots[trees]
+        nodes = np.broadcast_to(roots, (X.shape[0], len(roots)))
+        for _ in range(self.max_depth):
+            x = flat_X.take(row_offsets + self.feature.take(nodes))
+            nodes = self.left.take(nodes) + (x > self.threshold.take(nodes))
+        return nodes
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Evaluates the primary output (output 0) for every row of ``X``.
+
+        Args:
+            X: 2-D array of shape (n_rows, n_features).
+
+        Returns:
+            1-D array of predictions of length n_rows.
+        """
+        return self.predict_outputs(X, 0, 1)[:, 0]
+
+    def predict_outputs(self, X: np.ndarray, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """Evaluates a contiguous range of outputs in one traversal pass.
+
+        Args:
+            X: 2-D array of shape (n_rows, n_features).
+            start: First output to evaluate.
+            stop: End of the output range (exclusive); all outputs by default.
+
+        Returns:
+            Array of shape (n_rows, stop - start).
+        """
+        stop = self.n_outputs if stop is None else stop
+        bounds = np.append(self.output_starts, self.n_trees)
+        first, last = bounds[start], bounds[stop]
+        leaf_values = self.value.take(self.apply(X, slice(first, last)))
+        if stop - start == 1:
+            sums = leaf_values.sum(axis=1, keepdims=True)
+        else:
+            sums = np.add.reduceat(leaf_values, bounds[start:stop] - first, axis=1)
+        return self.base_scores[start:stop] + sums
+
+
+def _scaler_stats(scaler: Any, n_features: int) -> tuple[np.ndarray, np.ndarray]:
+    """Extracts per-feature mean and scale from a fitted StandardScaler.
+
+    Args:
+        scaler: Fitted sklearn StandardScaler.
+        n_features: Number of features the model expects.
+
+    Returns:
+        Tuple of (mean, scale) float64 arrays of length ``n_features``.
+
+    Raises:
+        ValueError: If the scaler does not match the model or is not monotone
+            increasing in every feature.
+    """
+    mean = getattr(scaler, "mean_", None)
+    scale = getattr(scaler, "scale_", None)
+    mean = np.zeros(n_features) if mean is None else np.asarray(mean, dtype=np.float64)
+    scale = np.ones(n_features) if scale is None else np.asarray(scale, dtype=np.float64)
+
+    if mean.shape != (n_features,) or scale.shape != (n_features,):
+        raise ValueError(f"Scaler statistics do not match the model's {n_features} features.")
+    if not np.all(scale > 0):
+        raise ValueError("Scaler must have a strictly positive scale to be folded.")
+    return mean, scale
+
+
+def _fold_thresholds(threshold: np.ndarray, mean: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """Maps scaled-space split thresholds to exact raw-space cut points.
+
+    For each node, finds the largest float64 ``x`` such that
+    ``float32((x - mean) / scale) <= threshold``, i.e. the raw threshold that
+    reproduces sklearn's decision on standardized float32 inputs exactly.
+    ``threshold * scale + mean`` is only correct up to rounding, which flips
+    splits for inputs lying on a cut point.
+
+    Args:
+        threshold: Scaled-space thresholds (finite).
+        mean: Mean of the split feature, per node.
+        scale: Positive scale of the split feature, per node.
+
+    Returns:
+        Raw-space thresholds, one per node.
+    """
+
+    def goes_left(x: np.ndarray) -> np.ndarray:
+        with np.errstate(over="ignore"):
+            return ((x - mean) / scale).astype(np.float32) <= threshold
+
+    estimate = threshold * scale + mean
+    margin = (np.abs(estimate) + np.abs(mean) + scale * np.abs(threshold)) * 1e-6 + 1e-300
+    lo, hi = estimate - margin, estimate + margin
+    while not (goes_left(lo).all() and not goes_left(hi).any()):
+        margin *= 2
+        lo = np.where(goes_left(lo), lo, estimate - margin)
+        hi = np.where(goes_left(hi), estimate + margin, hi)
+
+    # Bisect until lo and hi are adjacent doubles: lo goes left, hi goes right.
+    while True:
+        mid = lo + (hi - lo) / 2
+        active = (mid > lo) & (mid < hi)
+        if not active.any():
+            return lo
+        left = goes_left(mid)
+        lo = np.where(active & left, mid, lo)
+        hi = np.where(active & ~left, mid, hi)
+
+
+def _round_down(values: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """Casts float64 values to ``dtype``, rounding towards ``-inf``.
+
+    Values already of ``dtype`` are assumed to be rounded and are returned
+    without copying, so memory-mapped thresholds stay memory-mapped.
+
+    Args:
+        values: Float64 thresholds.
+        dtype: Target floating point dtype.
+
+    Returns:
+        Contiguous array of the largest ``dtype`` values not above ``values``.
+    """
+    if values.dtype == dtype:
+        return np.ascontiguousarray(values)
+    rounded = values.astype(dtype)
+    too_high = rounded.astype(np.float64) > values
+    rounded[too_high] = np.nextafter(rounded[too_high], dtype.type(-np.inf))
+    return np.ascontiguousarray(rounded)
+
+
+def _breadth_first_order(children_left: np.ndarray, children_right: np.ndarray) -> np.ndarray:
+    """Orders the nodes of one tree breadth-first with siblings adjacent.
+
+    Args:
+        children_left: sklearn left-child array (``-1`` for leaves).
+        children_right: sklearn right-child array (``-1`` for leaves).
+
+    Returns:
+        Original node ids in their new positions.
+    """
+    order = [0]
+    for node in order:
+        if children_left[node] >= 0:
+            order.append(int(children_left[node]))
+            order.append(int(children_right[node]))
+    return np.array(order, dtype=np.int64)
@@ -0,0 +1,6 @@
+"""Offline performance benchmarks for the backend.
+
+Run individual benchmarks as modules from the backend directory, e.g.:
+
+    python -m benchmarks.bench_batch_predict
+"""
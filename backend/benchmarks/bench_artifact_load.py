@@ -0,0 +1,82 @@
+"""Cold-start benchmark: three pickles vs. the memory-mapped model bundle.
+
+Each measurement runs in a fresh interpreter so that import time (sklearn is
+only imported when unpickling) is included, as it is for a new server worker.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_artifact_load
+    python -m benchmarks.bench_artifact_load --repeat 10
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from app.schemas.prediction import PredictionRequest
+from app.services.ml_service import ml_service
+ml_service.load()
+loaded = time.perf_counter()
+ml_service.predict(PredictionRequest(
+    location="Kharghar", area_sqft=950, bhk=2, bathrooms=2, floor=5,
+    total_floors=12, age_of_property=3, parking=1, lift=1,
+))
+first = time.perf_counter()
+print(json.dumps({
+    "load_ms": (loaded - start) * 1e3,
+    "first_predict_ms": (first - loaded) * 1e3,
+    "sklearn_imported": "sklearn" in sys.modules,
+}))
+"""
+
+
+def measure(artifact_format: str, engine: str) -> dict:
+    """Loads the artifacts once in a fresh interpreter.
+
+    Args:
+        artifact_format: ``pickle`` or ``bundle``.
+        engine: ``sklearn`` or ``compiled`` inference engine.
+
+    Returns:
+        Dict with load time, first-prediction time and whether sklearn was imported.
+    """
+    env = {**os.environ, "ARTIFACT_FORMAT": artifact_format, "INFERENCE_ENGINE": engine}
+    env.setdefault("PYTHONWARNINGS", "ignore")
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Parses CLI arguments and prints a cold-start table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    configs = [("pickle", "sklearn"), ("pickle", "compiled"), ("bundle", "compiled")]
+    print(f"{'format':>8} {'engine':>9} {'import+load':>12} {'first predict':>14} {'sklearn':>8}")
+    for artifact_format, engine in configs:
+        runs = [measure(artifact_format, engine) for _ in range(args.repeat)]
+        best = min(runs, key=lambda r: r["load_ms"])
+        print(
+            f"{artifact_format:>8} {engine:>9} {best['load_ms']:>10.1f}ms "
+            f"{best['first_predict_ms']:>12.2f}ms {str(best['sklearn_imported']):>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Throughput benchmark: per-row vs. vectorized synthetic augmentation.
+
+Compares the original per-sample loop (kept here as a reference) with
+``train_model.augment_missing_locations`` for the twelve localities missing
+from the training CSV.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_augmentation
+    python -m benchmarks.bench_augmentation --rows 100 10000 1000000 --loop-max-rows 10000
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import RANDOM_STATE
+from train_model import LOCATION_BASE_PRICE, TARGET, augment_missing_locations
+
+MISSING_LOCATIONS = [
+    "dronagiri", "kalamboli", "kamothe", "kopar khairane", "mansarovar", "new panvel",
+    "roadpali", "sanpada", "seawoods", "sector 19", "taloja", "turbhe",
+]
+
+
+def loop_augment(missing_locations: list[str], n_per_location: int) -> pd.DataFrame:
+    """Reference implementation: the per-sample loop this benchmark replaces."""
+    rng = np.random.default_rng(RANDOM_STATE)
+    records = []
+    for loc in missing_locations:
+        for _ in range(n_per_location):
+            bhk = int(rng.choice([1, 2, 3, 4, 5], p=[0.10, 0.40, 0.35, 0.12, 0.03]))
+            bathrooms = max(1, min(5, bhk + rng.integers(-1, 2)))
+            area_sqft = max(300, min(10000, bhk * rng.uniform(300, 500) + rng.uniform(-100, 200)))
+            total_floors = int(rng.integers(2, 40))
+            floor = int(rng.integers(0, total_floors + 1))
+            age = int(rng.integers(0, 30))
+            parking = int(rng.choice([0, 1], p=[0.25, 0.75]))
+            lift = 1 if total_floors > 4 else int(rng.choice([0, 1], p=[0.4, 0.6]))
+            base = LOCATION_BASE_PRICE.get(loc.title(), 10000)
+            price = (
+                base * area_sqft + bhk * 50_000 + bathrooms * 30_000
+                + (floor / max(total_floors, 1)) * 200_000
+                - age * 15_000 + parking * 80_000 + lift * 50_000
+                + rng.normal(0, 200_000)
+            )
+            price = max(500_000, min(50_000_000, price))
+            records.append({
+                "location": loc, "area_sqft": round(area_sqft, 1), "bhk": bhk,
+                "bathrooms": bathrooms, "floor": floor, "total_floors": total_floors,
+                "age_of_property": age, "parking": parking, "lift": lift,
+                TARGET: int(round(price, 0)),
+            })
+    return pd.DataFrame(records)
+
+
+def timed(fn, *args) -> tuple[float, pd.DataFrame]:
+    """Returns (seconds, result) of one call."""
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def run(rows: list[int], loop_max_rows: int) -> list[dict[str, float | None]]:
+    """Times both generators at each requested total row count.
+
+    Args:
+        rows: Total synthetic rows to generate, split evenly across localities.
+        loop_max_rows: Largest size at which the slow loop is also timed.
+
+    Returns:
+        One result dict per size with timings and mean price of each output.
+    """
+    results = []
+    for n in rows:
+        per_location = max(1, n // len(MISSING_LOCATIONS))
+        vector_s, vector_df = timed(augment_missing_locations, MISSING_LOCATIONS, per_location)
+        loop_s = loop_mean = None
+        if len(vector_df) <= loop_max_rows:
+            loop_s, loop_df = timed(loop_augment, MISSING_LOCATIONS, per_location)
+            loop_mean = float(loop_df[TARGET].mean())
+        results.append(
+            {
+                "rows": len(vector_df),
+                "loop_s": loop_s,
+                "vector_s": vector_s,
+                "speedup": loop_s / vector_s if loop_s else None,
+                "loop_mean_price": loop_mean,
+                "vector_mean_price": float(vector_df[TARGET].mean()),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    """Parses CLI arguments and prints a timing table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 10_000, 1_000_000])
+    parser.add_argument("--loop-max-rows", type=int, default=100_000)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    print(f"{'rows':>9} {'loop':>10} {'vectorized':>11} {'speedup':>8} {'mean price (loop / vec)':>28}")
+    for r in run(args.rows, args.loop_max_rows):
+        loop = f"{r['loop_s'] * 1e3:>8.1f}ms" if r["loop_s"] is not None else f"{'—':>10}"
+        speedup = f"{r['speedup']:>7.0f}x" if r["speedup"] is not None else f"{'—':>8}"
+        loop_mean = f"₹{r['loop_mean_price'] / 1e5:.1f}L" if r["loop_mean_price"] else "—"
+        print(
+            f"{r['rows']:>9} {loop} {r['vector_s'] * 1e3:>9.1f}ms {speedup} "
+            f"{loop_mean:>14} / ₹{r['vector_mean_price'] / 1e5:.1f}L"
+        )
+
+
+if __name__ == "__main__":
+    main()
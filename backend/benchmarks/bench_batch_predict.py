@@ -0,0 +1,66 @@
+"""Throughput benchmark: one batch prediction vs. N single predictions.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_batch_predict
+    python -m benchmarks.bench_batch_predict --sizes 10 100 1000
+"""
+
+import argparse
+import warnings
+
+from app.services.ml_service import ml_service
+from benchmarks.common import best_of, make_requests
+
+
+def run(sizes: list[int], repeat: int) -> list[dict[str, float]]:
+    """Times single-row and batched inference for each batch size.
+
+    Args:
+        sizes: Batch sizes to benchmark.
+        repeat: Number of timed repetitions per measurement (best is kept).
+
+    Returns:
+        One result dict per size with timings and rows/second throughput.
+    """
+    if not ml_service.is_loaded:
+        ml_service.load()
+
+    results = []
+    for n in sizes:
+        requests = make_requests(n)
+        single_s = best_of(lambda: [ml_service.predict(r) for r in requests], repeat)
+        batch_s = best_of(lambda: ml_service.predict_batch(requests), repeat)
+        results.append(
+            {
+                "rows": n,
+                "single_s": single_s,
+                "batch_s": batch_s,
+                "single_rows_per_s": n / single_s,
+                "batch_rows_per_s": n / batch_s,
+                "speedup": single_s / batch_s,
+            }
+        )
+    return results
+
+
+def main() -> None:
+    """Parses CLI arguments and prints a throughput table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 500, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # The scaler was fitted on a DataFrame; silence the per-call feature-name warning.
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+    print(f"{'rows':>6} {'N x predict':>14} {'predict_batch':>14} {'rows/s single':>14} {'rows/s batch':>14} {'speedup':>8}")
+    for r in run(args.sizes, args.repeat):
+        print(
+            f"{r['rows']:>6} {r['single_s'] * 1e3:>12.2f}ms {r['batch_s'] * 1e3:>12.2f}ms "
+            f"{r['single_rows_per_s']:>14.0f} {r['batch_rows_per_s']:>14.0f} {r['speedup']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
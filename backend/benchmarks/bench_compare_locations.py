@@ -0,0 +1,76 @@
+"""Locality comparison benchmark: one batched call vs. a request per locality.
+
+Times, per inference engine with the prediction cache disabled:
+
+  - compare: ``MLService.compare_locations`` (one 21-row inference plus the
+    precomputed market statistics)
+  - per-locality: one ``MLService.predict`` per supported locality, as a
+    client without the comparison endpoint would have to do
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_compare_locations
+    python -m benchmarks.bench_compare_locations --engines compiled --repeat 500
+"""
+
+import argparse
+import warnings
+
+from app.schemas.prediction import NaviMumbaiLocation
+from app.services.ml_service import MLService
+from app.services.prediction_cache import PredictionCache
+from benchmarks.common import best_of, make_requests
+
+
+def run(engines: list[str], repeat: int) -> list[dict[str, float]]:
+    """Times the comparison against per-locality predictions.
+
+    Args:
+        engines: Inference engines to benchmark.
+        repeat: Number of timed repetitions per measurement (best is kept).
+
+    Returns:
+        One result dict per engine with per-comparison latencies in
+        microseconds.
+    """
+    request = make_requests(1)[0]
+    results = []
+    for engine in engines:
+        service = MLService()
+        service._settings = service._settings.model_copy(update={"inference_engine": engine})
+        service._cache = PredictionCache(max_size=0, ttl_seconds=0)
+        service.load()
+        index = service.artifacts.location_index
+        requests = [
+            request.model_copy(update={"location": NaviMumbaiLocation(name)}) for name in index.names
+        ]
+        results.append(
+            {
+                "engine": engine,
+                "localities": len(index),
+                "compare_us": best_of(lambda: service.compare_locations(request), repeat) * 1e6,
+                "single_us": best_of(lambda: [service.predict(r) for r in requests], repeat) * 1e6,
+            }
+        )
+    return results
+
+
+def main() -> None:
+    """Parses CLI arguments and prints a comparison latency table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--engines", nargs="+", default=["sklearn", "compiled"])
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+    # The scaler was fitted on a DataFrame; silence the per-call feature-name warning.
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+    print(f"{'engine':<9} {'localities':>10} {'compare':>11} {'per-locality':>13} {'speedup':>8}")
+    for r in run(args.engines, args.repeat):
+        print(
+            f"{r['engine']:<9} {r['localities']:>10} {r['compare_us']:>9.1f}us "
+            f"{r['single_us']:>11.1f}us {r['single_us'] / r['compare_us']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
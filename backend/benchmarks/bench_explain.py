@@ -0,0 +1,79 @@
+"""Explanation benchmark: per-call cost of TreeSHAP attribution vs. prediction.
+
+Times, on the compiled point model with the scaler folded:
+
+  - predict: one traversal of all trees
+  - explain: path attribution from the per-structure lookup tables
+
+and reports the one-off cost of building the tables, which happens on the
+first explanation after every model load.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_explain
+    python -m benchmarks.bench_explain --sizes 1 10 --repeat 500
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from app.services.explainer import PathExplainer
+from app.services.ml_service import ml_service
+from app.services.tree_engine import CompiledEnsemble
+from benchmarks.common import RANDOM_STATE, best_of
+
+
+def run(sizes: list[int], repeat: int) -> tuple[float, int, list[dict[str, float]]]:
+    """Builds the explainer and times explain vs. predict.
+
+    Args:
+        sizes: Numbers of rows per call.
+        repeat: Number of timed repetitions per measurement (best is kept).
+
+    Returns:
+        Tuple of (table build seconds, table bytes, one result dict per size
+        with per-call latencies in microseconds).
+    """
+    artifacts = ml_service.artifacts
+    engine = CompiledEnsemble.from_gradient_boosting(artifacts.model, scaler=artifacts.scaler)
+    start = time.perf_counter()
+    explainer = PathExplainer(engine)
+    build_s = time.perf_counter() - start
+
+    rng = np.random.default_rng(RANDOM_STATE)
+    results = []
+    for n in sizes:
+        X = np.column_stack([rng.integers(0, 21, n), rng.uniform(300, 3000, (n, 8))])
+        results.append(
+            {
+                "rows": n,
+                "predict_us": best_of(lambda: engine.predict(X), repeat) * 1e6,
+                "explain_us": best_of(lambda: explainer.explain(X), repeat) * 1e6,
+            }
+        )
+    return build_s, explainer.nbytes, results
+
+
+def main() -> None:
+    """Parses CLI arguments and prints an explanation latency table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    if not ml_service.is_loaded:
+        ml_service.load()
+    build_s, nbytes, results = run(args.sizes, args.repeat)
+    print(f"tables built in {build_s * 1e3:.0f}ms, {nbytes / 2**20:.1f} MiB")
+    print(f"{'rows':>6} {'predict':>11} {'explain':>11} {'ratio':>7}")
+    for r in results:
+        print(
+            f"{r['rows']:>6} {r['predict_us']:>9.1f}us {r['explain_us']:>9.1f}us "
+            f"{r['explain_us'] / r['predict_us']:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Fast-path benchmark: /predict CPU time with and without the fast decoder.
+
+Measures:
+
+  - decode: ``decode_prediction`` against ``PredictionRequest`` JSON
+    validation, on the same body
+  - request: CPU time per /predict call through the ASGI app, with the fast
+    path on and off, for cached requests (the same bodies again) and
+    uncached ones (the prediction cache disabled)
+
+Requests are sent to the ASGI app directly, without an HTTP client, so the
+numbers are the server's own work.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_fast_path
+    python -m benchmarks.bench_fast_path --requests 5000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+import warnings
+
+from app.api.fast_path import decode_prediction
+from app.core.config import get_settings
+from app.main import app
+from app.schemas.prediction import PredictionRequest
+from app.services.ml_service import ml_service
+from app.services.prediction_cache import PredictionCache
+from benchmarks.common import best_of, make_requests
+
+
+async def _post(body: bytes) -> int:
+    """Sends one POST /api/v1/predict to the app and returns the status code."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/api/v1/predict",
+        "raw_path": b"/api/v1/predict",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"bench"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    status = 0
+
+    async def receive() -> dict:
+        return messages.pop() if messages else {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def _cpu_per_request(bodies: list[bytes]) -> float:
+    """Returns the process CPU time per /predict call over ``bodies`` in seconds."""
+    start = time.process_time()
+    for body in bodies:
+        status = await _post(body)
+        if status != 200:
+            raise RuntimeError(f"/predict returned {status}")
+    return (time.process_time() - start) / len(bodies)
+
+
+def run(n_requests: int, repeat: int) -> dict[str, float]:
+    """Times decoding and per-request CPU with the fast path on and off.
+
+    Args:
+        n_requests: Number of distinct /predict bodies per measurement.
+        repeat: Number of timed repetitions per decode measurement (best is kept).
+
+    Returns:
+        Latencies and CPU times in microseconds, and the CPU saved per request.
+    """
+    settings = get_settings()
+    bodies = [json.dumps(r.model_dump(mode="json")).encode() for r in make_requests(n_requests)]
+    result = {
+        "decode_us": best_of(lambda: decode_prediction(bodies[0]), repeat) * 1e6,
+        "validate_us": best_of(
+            lambda: PredictionRequest.model_validate_json(bodies[0]), repeat
+        ) * 1e6,
+    }
+
+    cache = ml_service._cache
+    try:
+        for fast in (False, True):
+            settings.fast_path_enabled = fast
+            label = "fast" if fast else "standard"
+            ml_service._cache = PredictionCache(max_size=0, ttl_seconds=0)
+            result[f"uncached_{label}_us"] = asyncio.run(_cpu_per_request(bodies)) * 1e6
+            ml_service._cache = PredictionCache(max_size=n_requests, ttl_seconds=3600)
+            asyncio.run(_cpu_per_request(bodies))
+            result[f"cached_{label}_us"] = asyncio.run(_cpu_per_request(bodies)) * 1e6
+    finally:
+        ml_service._cache = cache
+        settings.fast_path_enabled = True
+
+    for kind in ("cached", "uncached"):
+        saved = result[f"{kind}_standard_us"] - result[f"{kind}_fast_us"]
+        result[f"{kind}_saved_pct"] = 100.0 * saved / result[f"{kind}_standard_us"]
+    return result
+
+
+def main() -> None:
+    """Parses CLI arguments and prints the fast-path savings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=10_000)
+    args = parser.parse_args()
+    # The scaler was fitted on a DataFrame; silence the per-call feature-name warning.
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+    logging.disable(logging.WARNING)
+
+    if not ml_service.is_loaded:
+        ml_service.load()
+    r = run(args.requests, args.repeat)
+    print(f"decode:    {r['decode_us']:>8.2f}us fast, {r['validate_us']:>8.2f}us pydantic")
+    print(f"{'/predict CPU':<14} {'standard':>10} {'fast':>10} {'saved':>8}")
+    for kind in ("cached", "uncached"):
+        print(
+            f"{kind:<14} {r[f'{kind}_standard_us']:>8.1f}us {r[f'{kind}_fast_us']:>8.1f}us "
+            f"{r[f'{kind}_saved_pct']:>7.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Load test: p99 latency of /predict and /health per inference mode.
+
+Drives the ASGI app in-process at a fixed concurrency while a probe polls
+``/api/v1/health``. In ``inline`` mode every model evaluation blocks the event
+loop, which shows up as health-check latency; ``thread`` and ``process``
+modes keep the loop free and shed load with 503s once the queue is full.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_inference_modes
+    python -m benchmarks.bench_inference_modes --requests 2000 --concurrency 64
+    python -m benchmarks.bench_inference_modes --coalesce --window-ms 2
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+import warnings
+
+import numpy as np
+from httpx import ASGITransport, AsyncClient
+
+from app.api.routes import predict as predict_routes
+from app.core.config import get_settings
+from app.main import app
+from app.services.coalescer import PredictionCoalescer
+from app.services.inference_executor import inference_executor
+from app.services.ml_service import ml_service
+from benchmarks.common import make_requests
+
+
+async def _run_mode(mode: str, payloads: list[dict], concurrency: int, workers: int, max_queue: int) -> dict[str, float]:
+    """Runs the load test for one execution mode.
+
+    Args:
+        mode: Inference mode to benchmark.
+        payloads: JSON request bodies, one per /predict call.
+        concurrency: Number of concurrent client tasks.
+        workers: Pool size for thread/process modes.
+        max_queue: Queue bound for thread/process modes.
+
+    Returns:
+        Latency percentiles (ms), throughput and rejection counts.
+    """
+    inference_executor.configure(mode, workers, max_queue)
+    inference_executor.start()
+
+    latencies: list[float] = []
+    health_latencies: list[float] = []
+    statuses: list[int] = []
+    queue: asyncio.Queue = asyncio.Queue()
+    for payload in payloads:
+        queue.put_nowait(payload)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        done = asyncio.Event()
+
+        async def worker() -> None:
+            while not queue.empty():
+                payload = queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.post("/api/v1/predict", json=payload)
+                latencies.append(time.perf_counter() - start)
+                statuses.append(response.status_code)
+
+        async def probe() -> None:
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/api/v1/health")
+                health_latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0.005)
+
+        probe_task = asyncio.create_task(probe())
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await probe_task
+
+    inference_executor.shutdown()
+
+    ok = np.array(latencies)[np.array(statuses) == 200] * 1e3
+    health = np.array(health_latencies) * 1e3
+    return {
+        "mode": mode,
+        "throughput_rps": len(payloads) / elapsed,
+        "p50_ms": float(np.percentile(ok, 50)) if len(ok) else float("nan"),
+        "p99_ms": float(np.percentile(ok, 99)) if len(ok) else float("nan"),
+        "health_p99_ms": float(np.percentile(health, 99)) if len(health) else float("nan"),
+        "rejected_503": int(sum(code == 503 for code in statuses)),
+    }
+
+
+def main() -> None:
+    """Parses CLI arguments and prints a per-mode latency table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modes", nargs="+", default=["inline", "thread", "process"])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-queue", type=int, default=64)
+    parser.add_argument("--coalesce", action="store_true", help="Enable the /predict coalescer")
+    parser.add_argument("--window-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    settings.coalesce_enabled = args.coalesce
+
+    # The scaler was fitted on a DataFrame; silence the per-call feature-name
+    # warning here and, via the environment, in spawned worker processes.
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+    os.environ["PYTHONWARNINGS"] = "ignore::UserWarning"
+    logging.disable(logging.WARNING)
+    if not ml_service.is_loaded:
+        ml_service.load()
+    # Unique requests so the prediction cache does not short-circuit inference.
+    payloads = [r.model_dump(mode="json") for r in make_requests(args.requests)]
+
+    print(f"{'mode':>8} {'req/s':>8} {'p50':>9} {'p99':>9} {'health p99':>11} {'503s':>6}")
+    for mode in args.modes:
+        coalescer = PredictionCoalescer(
+            inference_executor.predict_batch,
+            window_ms=args.window_ms,
+            max_batch_size=settings.coalesce_max_batch_size,
+        )
+        predict_routes.prediction_coalescer = coalescer
+        r = asyncio.run(_run_mode(mode, payloads, args.concurrency, args.workers, args.max_queue))
+        ml_service._cache.clear()
+        print(
+            f"{r['mode']:>8} {r['throughput_rps']:>8.0f} {r['p50_ms']:>7.2f}ms {r['p99_ms']:>7.2f}ms "
+            f"{r['health_p99_ms']:>9.2f}ms {r['rejected_503']:>6}"
+        )
+        if args.coalesce:
+            stats = coalescer.stats()
+            print(
+                f"{'':>8} coalesced: mean batch {stats.mean_batch_size:.1f}, "
+                f"queue delay p50 {stats.queue_delay_ms_p50:.2f}ms p99 {stats.queue_delay_ms_p99:.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
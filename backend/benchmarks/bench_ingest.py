@@ -0,0 +1,107 @@
+"""Ingestion benchmark: whole-file read vs. chunked streaming vs. .npy cache.
+
+Writes a large synthetic listings CSV by resampling rows of the real dataset
+(with ~1% blank areas so the cleaning filters have work to do), then loads it
+in a fresh interpreter per method so that each peak RSS is measured alone.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_ingest
+    python -m benchmarks.bench_ingest --rows 5000000 --chunksize 500000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+_PROBE = """
+import json, sys, time
+from pathlib import Path
+import train_model
+from data_ingest import peak_rss_mb
+method, csv_path, chunksize, cache_dir = sys.argv[1:5]
+start = time.perf_counter()
+if method == "read_csv":
+    train_model.CHUNKED_INGEST_MIN_BYTES = float("inf")  # force the whole-file path
+    df = train_model.load_real_data(Path(csv_path))
+else:
+    df = train_model.load_real_data(
+        Path(csv_path), chunksize=int(chunksize), cache_dir=Path(cache_dir) if cache_dir else None
+    )
+print(json.dumps({
+    "seconds": time.perf_counter() - start,
+    "rows": len(df),
+    "frame_mb": float(df.memory_usage(deep=True).sum()) / 2**20,
+    "peak_rss_mb": peak_rss_mb(),
+}))
+"""
+
+
+def write_large_csv(path: Path, rows: int, seed: int = 0) -> None:
+    """Writes ``rows`` listings resampled from the bundled dataset."""
+    sys.path.insert(0, str(BACKEND_DIR))
+    from train_model import CSV_FILENAME
+
+    source = pd.read_csv(BACKEND_DIR.parent / CSV_FILENAME)
+    rng = np.random.default_rng(seed)
+    block = 500_000
+    for start in range(0, rows, block):
+        n = min(block, rows - start)
+        df = source.iloc[rng.integers(0, len(source), n)].reset_index(drop=True)
+        df.loc[rng.random(n) < 0.01, "area_sqft"] = np.nan
+        df.to_csv(path, mode="a" if start else "w", header=not start, index=False)
+
+
+def measure(method: str, csv_path: Path, chunksize: int, cache_dir: Path | None) -> dict:
+    """Loads the CSV once in a fresh interpreter and returns its metrics."""
+    env = {**os.environ, "PYTHONWARNINGS": "ignore"}
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE, method, str(csv_path), str(chunksize), str(cache_dir or "")],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Parses CLI arguments and prints an ingestion table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--chunksize", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "listings.csv"
+        cache_dir = Path(tmp) / "cache"
+        write_large_csv(csv_path, args.rows)
+        size_mb = csv_path.stat().st_size / 2**20
+        print(f"{args.rows} rows, {size_mb:.0f} MiB CSV, chunks of {args.chunksize}")
+
+        runs = [
+            ("read_csv (whole file)", measure("read_csv", csv_path, args.chunksize, None)),
+            ("chunked", measure("chunked", csv_path, args.chunksize, None)),
+            ("chunked + write cache", measure("chunked", csv_path, args.chunksize, cache_dir)),
+            ("npy cache", measure("chunked", csv_path, args.chunksize, cache_dir)),
+        ]
+        print(f"{'method':<24} {'time':>8} {'rows kept':>10} {'frame':>10} {'peak RSS':>10}")
+        for name, r in runs:
+            print(
+                f"{name:<24} {r['seconds']:>7.2f}s {r['rows']:>10} "
+                f"{r['frame_mb']:>8.1f}MiB {r['peak_rss_mb']:>8.0f}MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
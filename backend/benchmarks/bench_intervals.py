@@ -0,0 +1,106 @@
+"""Price-range benchmark: added latency and empirical coverage of the intervals.
+
+Compares, per inference call on raw features with the scaler folded:
+
+  - point: the compiled point model alone (the cost without intervals)
+  - fused: point + 10th/90th percentile trees in one compiled pass
+  - sklearn x3: three separate ``model.predict`` calls on scaled features
+
+and reports how often the served range contains the actual price on the
+training CSV's held-out test split.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_intervals
+    python -m benchmarks.bench_intervals --sizes 1 100 --repeat 200
+"""
+
+import argparse
+import warnings
+
+import numpy as np
+from sklearn.model_selection import train_test_split
+
+from app.services.ml_service import ml_service
+from app.services.tree_engine import CompiledEnsemble
+from benchmarks.common import RANDOM_STATE, best_of
+from train_model import encode_locations, interval_stats, load_training_data
+
+
+def run_latency(sizes: list[int], repeat: int) -> list[dict[str, float]]:
+    """Times point-only, fused and separate evaluation.
+
+    Args:
+        sizes: Numbers of rows per inference call.
+        repeat: Number of timed repetitions per measurement (best is kept).
+
+    Returns:
+        One result dict per size with per-call latencies in microseconds.
+    """
+    artifacts = ml_service.artifacts
+    scaler = artifacts.scaler
+    models = [artifacts.model] + artifacts.quantile_models
+    parts = [CompiledEnsemble.from_gradient_boosting(m, scaler=scaler) for m in models]
+    point, fused = parts[0], CompiledEnsemble.fuse(parts)
+
+    rng = np.random.default_rng(RANDOM_STATE)
+    results = []
+    for n in sizes:
+        X = np.column_stack([rng.integers(0, 21, n), rng.uniform(300, 3000, (n, 8))])
+        point_s = best_of(lambda: point.predict(X), repeat)
+        fused_s = best_of(lambda: fused.predict_outputs(X), repeat)
+        sklearn_s = best_of(lambda: [m.predict(scaler.transform(X)) for m in models], repeat)
+        results.append(
+            {
+                "rows": n,
+                "point_us": point_s * 1e6,
+                "fused_us": fused_s * 1e6,
+                "sklearn_us": sklearn_s * 1e6,
+            }
+        )
+    return results
+
+
+def run_coverage() -> dict[str, float]:
+    """Measures the served range on the held-out test split of the CSV."""
+    X, y, _ = encode_locations(load_training_data())
+    _, X_test, _, y_test = train_test_split(X, y, test_size=0.20, random_state=RANDOM_STATE)
+    outputs = ml_service.artifacts.predict_interval_raw(X_test.to_numpy(dtype=float))
+    return {
+        "rows": len(y_test),
+        **interval_stats(y_test.to_numpy(dtype=float), outputs[:, 0], outputs[:, 1], outputs[:, 2]),
+    }
+
+
+def main() -> None:
+    """Parses CLI arguments and prints latency and coverage tables."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+    # The scaler was fitted on a DataFrame; silence the per-call feature-name warning.
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+    if not ml_service.is_loaded:
+        ml_service.load()
+    quantiles = ml_service.artifacts.quantiles
+    if not quantiles:
+        raise SystemExit("No quantile models loaded; run train_model.py first.")
+
+    print(f"{'rows':>6} {'point':>11} {'fused x3':>11} {'added':>8} {'sklearn x3':>12}")
+    for r in run_latency(args.sizes, args.repeat):
+        print(
+            f"{r['rows']:>6} {r['point_us']:>9.1f}us {r['fused_us']:>9.1f}us "
+            f"{r['fused_us'] / r['point_us'] - 1:>+7.0%} {r['sklearn_us']:>10.1f}us"
+        )
+
+    c = run_coverage()
+    nominal = quantiles[-1] - quantiles[0]
+    print(
+        f"\n{list(quantiles)} range on {c['rows']} test rows: {c['coverage']:.1%} coverage "
+        f"(nominal {nominal:.0%}), median width {c['median_relative_width']:.1%} of price"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Metrics benchmark: instrumentation overhead against a /predict request.
+
+Measures:
+
+  - observe: one histogram observation (the per-stage cost)
+  - instrumentation: everything one /predict miss records (route template,
+    request counter and latency, four stage timings, predictions counter)
+  - request: a /predict call through the ASGI app with the prediction cache
+    disabled, so every request runs the model
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_metrics
+    python -m benchmarks.bench_metrics --requests 2000
+"""
+
+import argparse
+import asyncio
+import time
+import warnings
+from typing import Callable
+
+import httpx
+
+from app.core.metrics import OBSERVE_BUDGET_S, MetricsRegistry, route_template
+from app.main import app
+from app.services.ml_service import ml_service
+from app.services.prediction_cache import PredictionCache
+from benchmarks.common import best_of, make_requests
+
+
+def _instrumentation() -> Callable[[], None]:
+    """Returns a function recording one uncached /predict request on a private registry."""
+    registry = MetricsRegistry(enabled=True)
+    requests = registry.counter("requests_total", "", ("method", "route", "status"))
+    latency = registry.histogram("request_seconds", "", ("route",))
+    stages = registry.histogram("stage_seconds", "", ("stage",))
+    predictions = registry.counter("predictions_total", "", ("artifact_version", "cache"))
+    stage_children = [stages.labels(s) for s in ("validation", "features", "predict", "response")]
+    scope = {"route": None, "path": "/api/v1/predict", "path_params": {}}
+
+    def record() -> None:
+        start = time.perf_counter()
+        for child in stage_children:
+            child.observe(time.perf_counter() - start)
+        predictions.labels("abc123", "miss").inc()
+        path = route_template(scope)
+        requests.labels("POST", path, "200").inc()
+        latency.labels(path).observe(time.perf_counter() - start)
+
+    return record
+
+
+async def _request_latency(n: int) -> float:
+    """Returns the median latency of ``n`` uncached /predict calls in seconds."""
+    payloads = [r.model_dump(mode="json") for r in make_requests(n)]
+    timings = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for payload in payloads:
+            start = time.perf_counter()
+            response = await client.post("/api/v1/predict", json=payload)
+            timings.append(time.perf_counter() - start)
+            response.raise_for_status()
+    return sorted(timings)[len(timings) // 2]
+
+
+def run(n_requests: int, repeat: int) -> dict[str, float]:
+    """Times one observation, one request's instrumentation and one request.
+
+    Args:
+        n_requests: Number of /predict calls timed through the ASGI app.
+        repeat: Number of timed repetitions per micro-measurement (best is kept).
+
+    Returns:
+        Latencies in microseconds and the instrumentation share of a request.
+    """
+    registry = MetricsRegistry(enabled=True)
+    child = registry.histogram("observe_seconds", "", ("stage",)).labels("predict")
+    record = _instrumentation()
+    ml_service._cache = PredictionCache(max_size=0, ttl_seconds=0)
+    result = {
+        "observe_us": best_of(lambda: child.observe(1e-4), repeat) * 1e6,
+        "instrumentation_us": best_of(record, repeat) * 1e6,
+        "request_us": asyncio.run(_request_latency(n_requests)) * 1e6,
+    }
+    result["overhead_pct"] = 100.0 * result["instrumentation_us"] / result["request_us"]
+    return result
+
+
+def main() -> None:
+    """Parses CLI arguments and prints the metrics overhead."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=10_000)
+    args = parser.parse_args()
+    # The scaler was fitted on a DataFrame; silence the per-call feature-name warning.
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+    if not ml_service.is_loaded:
+        ml_service.load()
+    r = run(args.requests, args.repeat)
+    print(f"observe:          {r['observe_us']:>8.2f}us (budget {OBSERVE_BUDGET_S * 1e6:.0f}us)")
+    print(f"instrumentation:  {r['instrumentation_us']:>8.2f}us per /predict")
+    print(f"/predict (ASGI):  {r['request_us']:>8.1f}us median, uncached")
+    print(f"overhead:         {r['overhead_pct']:>8.2f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Prediction log benchmark: request-path cost and bulk write throughput.
+
+Measures:
+
+  - record: time added to a request by ``PredictionLog.record`` (a buffer
+    append), vs. a synchronous JSONL write per request
+  - flush: rows per second written by one bulk flush, per sink
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_prediction_log
+    python -m benchmarks.bench_prediction_log --rows 50000 --sinks jsonl
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+from app.services.ml_service import ml_service
+from app.services.prediction_log import JsonlSink, PredictionLog, SqliteSink, to_row
+from benchmarks.common import best_of, make_requests
+
+SINKS = {"jsonl": JsonlSink, "sqlite": SqliteSink}
+
+
+async def _run(rows: int, sinks: list[str], repeat: int, directory: Path) -> dict[str, float]:
+    """Times recording and flushing ``rows`` predictions.
+
+    Args:
+        rows: Number of predictions buffered per flush.
+        sinks: Sink names to flush to (keys of SINKS).
+        repeat: Number of timed repetitions per measurement (best is kept).
+        directory: Where the sinks write.
+
+    Returns:
+        Per-record latencies in nanoseconds and rows/s per flushed sink.
+    """
+    requests = make_requests(rows)
+    pairs = list(zip(requests, (item.prediction for item in ml_service.predict_batch(requests))))
+    request, response = pairs[0]
+
+    log = PredictionLog(
+        [JsonlSink(directory / "record.jsonl")], max_queue=rows, flush_interval_s=3600
+    )
+    record_s = best_of(lambda: log.record("predict", request, response, "bench", 0.001), repeat)
+    sync_sink = JsonlSink(directory / "sync.jsonl")
+    entry = (time.time(), "predict", request, response, "bench", 0.001)
+    sync_s = best_of(lambda: sync_sink.write([to_row(entry)]), repeat)
+    await log.close()
+
+    result = {"record_ns": record_s * 1e9, "sync_write_ns": sync_s * 1e9}
+    for name in sinks:
+        sink = SINKS[name](directory / f"flush.{name}")
+        log = PredictionLog([sink], max_queue=rows, flush_interval_s=3600)
+        for request, response in pairs:
+            log.record("predict", request, response, "bench", 0.001)
+        start = time.perf_counter()
+        await log.close()
+        result[f"{name}_rows_per_s"] = rows / (time.perf_counter() - start)
+    return result
+
+
+def main() -> None:
+    """Parses CLI arguments and prints recording cost and flush throughput."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--sinks", nargs="+", default=list(SINKS), choices=list(SINKS))
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+    # The scaler was fitted on a DataFrame; silence the per-call feature-name warning.
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+    if not ml_service.is_loaded:
+        ml_service.load()
+    with tempfile.TemporaryDirectory() as directory:
+        r = asyncio.run(_run(args.rows, args.sinks, args.repeat, Path(directory)))
+
+    print(f"record (buffer append): {r['record_ns']:>8.0f}ns per request")
+    print(f"synchronous JSONL write: {r['sync_write_ns']:>7.0f}ns per request")
+    for name in args.sinks:
+        print(f"flush {args.rows} rows to {name:<6}: {r[f'{name}_rows_per_s']:>9.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
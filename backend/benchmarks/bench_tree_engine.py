@@ -0,0 +1,68 @@
+"""Latency benchmark: sklearn ``model.predict`` vs. the compiled tree engine.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_tree_engine
+    python -m benchmarks.bench_tree_engine --sizes 1 100 --repeat 200
+"""
+
+import argparse
+
+import numpy as np
+
+from app.services.ml_service import ml_service
+from app.services.tree_engine import CompiledEnsemble
+from benchmarks.common import RANDOM_STATE, best_of
+
+
+def run(sizes: list[int], repeat: int) -> list[dict[str, float]]:
+    """Times both inference engines on scaled feature matrices.
+
+    Args:
+        sizes: Numbers of rows per inference call.
+        repeat: Number of timed repetitions per measurement (best is kept).
+
+    Returns:
+        One result dict per size with per-call latency and max abs deviation.
+    """
+    if not ml_service.is_loaded:
+        ml_service.load()
+
+    model = ml_service.artifacts.model
+    engine = CompiledEnsemble.from_gradient_boosting(model)
+    rng = np.random.default_rng(RANDOM_STATE)
+
+    results = []
+    for n in sizes:
+        X = rng.normal(size=(n, engine.n_features))
+        sklearn_s = best_of(lambda: model.predict(X), repeat)
+        compiled_s = best_of(lambda: engine.predict(X), repeat)
+        results.append(
+            {
+                "rows": n,
+                "sklearn_us": sklearn_s * 1e6,
+                "compiled_us": compiled_s * 1e6,
+                "speedup": sklearn_s / compiled_s,
+                "max_abs_diff": float(np.abs(model.predict(X) - engine.predict(X)).max()),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    """Parses CLI arguments and prints a latency table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"{'rows':>6} {'sklearn':>12} {'compiled':>12} {'speedup':>8} {'max |diff| (INR)':>18}")
+    for r in run(args.sizes, args.repeat):
+        print(
+            f"{r['rows']:>6} {r['sklearn_us']:>10.1f}us {r['compiled_us']:>10.1f}us "
+            f"{r['speedup']:>7.1f}x {r['max_abs_diff']:>18.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Shared helpers for the backend benchmarks."""
+
+import time
+from typing import Callable
+
+import numpy as np
+
+from app.schemas.prediction import NaviMumbaiLocation, PredictionRequest
+
+RANDOM_STATE = 42
+
+
+def make_requests(n: int, seed: int = RANDOM_STATE) -> list[PredictionRequest]:
+    """Generates ``n`` valid, randomised prediction requests.
+
+    Args:
+        n: Number of requests to generate.
+        seed: Seed for the random generator, for reproducible runs.
+
+    Returns:
+        List of validated PredictionRequest objects.
+    """
+    rng = np.random.default_rng(seed)
+    locations = list(NaviMumbaiLocation)
+    requests = []
+    for _ in range(n):
+        bhk = int(rng.integers(1, 6))
+        total_floors = int(rng.integers(1, 41))
+        requests.append(
+            PredictionRequest(
+                location=locations[int(rng.integers(len(locations)))],
+                area_sqft=float(np.clip(bhk * rng.uniform(300, 500), 300, 10000)),
+                bhk=bhk,
+                bathrooms=int(np.clip(bhk + rng.integers(-1, 2), 1, 5)),
+                floor=int(rng.integers(0, total_floors + 1)),
+                total_floors=total_floors,
+                age_of_property=int(rng.integers(0, 30)),
+                parking=int(rng.integers(0, 2)),
+                lift=int(rng.integers(0, 2)),
+            )
+        )
+    return requests
+
+
+def best_of(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Returns the best wall-clock time of ``repeat`` calls to ``fn`` in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
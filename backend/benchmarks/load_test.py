@@ -0,0 +1,308 @@
+"""Load test: replay a traffic file at a set concurrency and arrival rate.
+
+Sends the HTTP calls of a JSONL traffic file (see ``benchmarks.traffic``) to
+the ASGI app in-process, to a uvicorn server started for the run, or to any
+running server. Reports throughput, p50/p95/p99 latency and error rates,
+overall and per path.
+
+Traffic lines are ``{"method", "path", "body"}`` objects; a bare prediction
+body is replayed as a ``POST /api/v1/predict``. The file is replayed in
+order and wraps around until ``--requests`` calls have been sent.
+
+With ``--rate``, calls arrive as a Poisson process (open loop), and latency
+counts from the scheduled arrival, so time spent waiting for a free
+connection under ``--concurrency`` is included. Without it, ``--concurrency``
+clients send back to back (closed loop).
+
+Usage (from the backend directory):
+
+    python -m benchmarks.traffic --requests 5000 --output traffic.jsonl
+    python -m benchmarks.load_test traffic.jsonl --concurrency 16
+    python -m benchmarks.load_test traffic.jsonl --rate 200 --serve --workers 2
+    python -m benchmarks.load_test traffic.jsonl --url http://127.0.0.1:8000 --output load.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import socket
+import subprocess
+import sys
+import time
+import warnings
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+import httpx
+import numpy as np
+
+from benchmarks.common import RANDOM_STATE
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def load_traffic(path: Path) -> list[dict[str, Any]]:
+    """Reads a JSONL traffic file.
+
+    Args:
+        path: File with one JSON object per line.
+
+    Returns:
+        Records with ``method``, ``path`` and ``body`` keys.
+
+    Raises:
+        ValueError: If a line is neither a traffic record nor a prediction body.
+    """
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if isinstance(record, dict) and "path" in record:
+                records.append(
+                    {
+                        "method": record.get("method", "POST").upper(),
+                        "path": record["path"],
+                        "body": record.get("body"),
+                    }
+                )
+            elif isinstance(record, dict) and "location" in record:
+                records.append({"method": "POST", "path": "/api/v1/predict", "body": record})
+            else:
+                raise ValueError(
+                    f"{path}:{number} is not a traffic record "
+                    "(expected a 'path' key or a prediction body)"
+                )
+    if not records:
+        raise ValueError(f"{path} has no traffic records")
+    return records
+
+
+def _percentiles(latencies: list[float]) -> dict[str, float]:
+    if not latencies:
+        return {"p50_ms": float("nan"), "p95_ms": float("nan"), "p99_ms": float("nan")}
+    p50, p95, p99 = np.percentile(np.array(latencies) * 1e3, [50, 95, 99])
+    return {"p50_ms": float(p50), "p95_ms": float(p95), "p99_ms": float(p99)}
+
+
+def summarise(calls: list[tuple[str, int, float]], elapsed_s: float) -> dict[str, Any]:
+    """Aggregates completed calls into a report.
+
+    Args:
+        calls: (path, status, latency seconds) per call; status 0 means the
+            call failed without a response.
+        elapsed_s: Wall-clock duration of the run.
+
+    Returns:
+        Throughput, latency percentiles of successful calls and error rates,
+        overall and per path.
+    """
+
+    def block(subset: list[tuple[str, int, float]]) -> dict[str, Any]:
+        statuses: dict[str, int] = {}
+        for _, status, _ in subset:
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+        n = len(subset)
+        client_errors = sum(1 for _, status, _ in subset if 400 <= status < 500)
+        server_errors = sum(1 for _, status, _ in subset if status >= 500)
+        failed = sum(1 for _, status, _ in subset if status == 0)
+        return {
+            "requests": n,
+            "throughput_rps": n / elapsed_s if elapsed_s > 0 else 0.0,
+            **_percentiles([latency for _, status, latency in subset if 200 <= status < 400]),
+            "error_rate": (client_errors + server_errors + failed) / n if n else 0.0,
+            "client_errors": client_errors,
+            "server_errors": server_errors,
+            "failed": failed,
+            "statuses": dict(sorted(statuses.items())),
+        }
+
+    paths = sorted({path for path, _, _ in calls})
+    return {
+        "elapsed_s": elapsed_s,
+        **block(calls),
+        "paths": {path: block([call for call in calls if call[0] == path]) for path in paths},
+    }
+
+
+async def replay(
+    client: httpx.AsyncClient,
+    records: list[dict[str, Any]],
+    n_requests: int,
+    concurrency: int,
+    rate: float | None = None,
+    seed: int = RANDOM_STATE,
+) -> dict[str, Any]:
+    """Replays traffic through ``client`` and reports on it.
+
+    Args:
+        client: Client bound to the target (ASGI app or server URL).
+        records: Traffic records, replayed in order and wrapping around.
+        n_requests: Number of calls to send.
+        concurrency: Maximum calls in flight.
+        rate: Mean arrivals per second (Poisson); None sends back to back.
+        seed: Seed for the arrival times.
+
+    Returns:
+        Report from ``summarise``.
+    """
+    calls: list[tuple[str, int, float]] = []
+    slots = asyncio.Semaphore(max(1, concurrency))
+
+    async def send(record: dict[str, Any], scheduled: float) -> None:
+        async with slots:
+            try:
+                response = await client.request(
+                    record["method"], record["path"], json=record["body"]
+                )
+                status = response.status_code
+            except httpx.HTTPError:
+                status = 0
+            calls.append((record["path"], status, time.perf_counter() - scheduled))
+
+    start = time.perf_counter()
+    if rate is None:
+        queue = iter(range(n_requests))
+
+        async def closed_loop_client() -> None:
+            for i in queue:
+                await send(records[i % len(records)], time.perf_counter())
+
+        await asyncio.gather(*(closed_loop_client() for _ in range(max(1, concurrency))))
+    else:
+        gaps = np.random.default_rng(seed).exponential(1.0 / rate, size=n_requests)
+        arrivals = start + np.cumsum(gaps)
+        tasks = []
+        for i, arrival in enumerate(arrivals):
+            delay = arrival - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(send(records[i % len(records)], float(arrival))))
+        await asyncio.gather(*tasks)
+    return summarise(calls, time.perf_counter() - start)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def uvicorn_server(workers: int = 1, timeout_s: float = 60.0) -> Iterator[str]:
+    """Starts ``uvicorn app.main:app`` on a free local port for the duration.
+
+    Args:
+        workers: Uvicorn worker processes.
+        timeout_s: How long to wait for the health check to pass.
+
+    Yields:
+        Base URL of the server.
+
+    Raises:
+        RuntimeError: If the server exits or is not healthy in time.
+    """
+    port = _free_port()
+    command = [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(workers), "--log-level", "warning",
+    ]
+    process = subprocess.Popen(command, cwd=BACKEND_DIR)
+    url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + timeout_s
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with status {process.returncode}")
+            try:
+                if httpx.get(f"{url}/api/v1/health", timeout=1.0).status_code == 200:
+                    break
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"uvicorn not healthy after {timeout_s:.0f}s")
+            time.sleep(0.2)
+        yield url
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+async def run(
+    records: list[dict[str, Any]],
+    n_requests: int,
+    concurrency: int,
+    rate: float | None,
+    url: str | None,
+    seed: int = RANDOM_STATE,
+) -> dict[str, Any]:
+    """Replays traffic against ``url``, or the ASGI app in-process if None."""
+    limits = httpx.Limits(max_connections=max(1, concurrency))
+    if url is not None:
+        async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30.0) as client:
+            return await replay(client, records, n_requests, concurrency, rate, seed)
+
+    from app.main import app
+    from app.services.ml_service import ml_service
+
+    if not ml_service.is_loaded:
+        ml_service.load()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load-test") as client:
+        return await replay(client, records, n_requests, concurrency, rate, seed)
+
+
+def main() -> None:
+    """Parses CLI arguments, replays the traffic and prints the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("traffic", type=Path, help="JSONL traffic file")
+    parser.add_argument("--requests", type=int, help="Calls to send (default: one pass)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rate", type=float, help="Mean arrivals per second (open loop)")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", help="Running server to target (default: ASGI app in-process)")
+    target.add_argument("--serve", action="store_true", help="Start a local uvicorn for the run")
+    parser.add_argument("--workers", type=int, default=1, help="Uvicorn workers with --serve")
+    parser.add_argument("--seed", type=int, default=RANDOM_STATE)
+    parser.add_argument("--output", type=Path, help="Also write the report as JSON")
+    args = parser.parse_args()
+    # The scaler was fitted on a DataFrame; silence the per-call feature-name warning.
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+    logging.disable(logging.WARNING)
+
+    records = load_traffic(args.traffic)
+    n_requests = args.requests or len(records)
+    if args.serve:
+        with uvicorn_server(args.workers) as url:
+            report = asyncio.run(
+                run(records, n_requests, args.concurrency, args.rate, url, args.seed)
+            )
+    else:
+        report = asyncio.run(
+            run(records, n_requests, args.concurrency, args.rate, args.url, args.seed)
+        )
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    print(
+        f"{report['requests']} requests in {report['elapsed_s']:.2f}s: "
+        f"{report['throughput_rps']:.0f} req/s, error rate {report['error_rate']:.2%}"
+    )
+    print(
+        f"{'path':<28} {'req':>6} {'p50':>9} {'p95':>9} {'p99':>9} "
+        f"{'4xx':>5} {'5xx':>5} {'fail':>5}"
+    )
+    for path, r in [("all", report), *report["paths"].items()]:
+        print(
+            f"{path:<28} {r['requests']:>6} {r['p50_ms']:>7.2f}ms {r['p95_ms']:>7.2f}ms "
+            f"{r['p99_ms']:>7.2f}ms {r['client_errors']:>5} {r['server_errors']:>5} "
+            f"{r['failed']:>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
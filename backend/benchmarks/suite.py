@@ -0,0 +1,304 @@
+"""Benchmark suite: core serving and training paths, as JSON, with regression checks.
+
+Cases (all timings; lower is better):
+
+  - predict_single: one ``MLService.predict`` with the prediction cache disabled
+  - predict_batch_<n>: one ``MLService.predict_batch`` of n rows
+  - load: ``MLService.load`` of the artifacts in ``models/``
+  - api_predict: median ``/api/v1/predict`` latency through ASGITransport
+  - train_<n>: ``train_model.train_and_save`` on n synthetic listings, written
+    to a scratch directory so ``models/`` is untouched
+
+Inputs are seeded with RANDOM_STATE, so two runs on the same machine measure
+the same work. Compare a run against a saved baseline to flag regressions.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.suite --output bench.json
+    python -m benchmarks.suite --baseline bench.json --threshold 0.15
+    python -m benchmarks.suite --cases predict_single api_predict --train-sizes 1000
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import tempfile
+import time
+import warnings
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterator
+
+import httpx
+import numpy
+import sklearn
+
+import train_model
+from app.main import app
+from app.services.ml_service import MLService, ml_service
+from app.services.prediction_cache import PredictionCache
+from benchmarks.common import best_of, make_requests
+
+# Scratch copies of every artifact path train_and_save writes.
+TRAIN_ARTIFACT_PATHS = {
+    "MODEL_PATH": "model.pkl",
+    "SCALER_PATH": "scaler.pkl",
+    "LABEL_ENCODER_PATH": "label_encoder.pkl",
+    "BUNDLE_DIR": "bundle",
+    "TRAINING_METADATA_PATH": "training_metadata.json",
+    "HOLDOUT_PATH": "holdout.npz",
+    "QUANTILE_MODELS_PATH": "quantiles.pkl",
+    "LOCATION_STATS_PATH": "location_stats.json",
+}
+
+CASES = ("predict_single", "predict_batch", "load", "api_predict", "train")
+
+
+def _fresh_service() -> MLService:
+    """Returns a loaded MLService with the prediction cache disabled."""
+    service = MLService()
+    service._cache = PredictionCache(max_size=0, ttl_seconds=0)
+    service.load()
+    return service
+
+
+def _result(value_s: float, unit: str, **extra: float) -> dict[str, float | str]:
+    scale = {"us": 1e6, "ms": 1e3, "s": 1.0}[unit]
+    return {"value": value_s * scale, "unit": unit, **extra}
+
+
+def bench_predict_single(repeat: int) -> dict[str, dict]:
+    """Times one uncached single-row prediction."""
+    service = _fresh_service()
+    request = make_requests(1)[0]
+    return {"predict_single": _result(best_of(lambda: service.predict(request), repeat), "us")}
+
+
+def bench_predict_batch(sizes: list[int], repeat: int) -> dict[str, dict]:
+    """Times one batch prediction per size.
+
+    Args:
+        sizes: Row counts of the batches.
+        repeat: Number of timed repetitions per size (best is kept).
+
+    Returns:
+        Results keyed by ``predict_batch_<rows>``.
+    """
+    service = _fresh_service()
+    results = {}
+    for n in sizes:
+        requests = make_requests(n)
+        batch_s = best_of(lambda: service.predict_batch(requests), repeat)
+        results[f"predict_batch_{n}"] = _result(batch_s, "ms", rows_per_s=n / batch_s)
+    return results
+
+
+def bench_load(repeat: int) -> dict[str, dict]:
+    """Times ``MLService.load`` into a fresh service (modules already imported)."""
+    return {"load": _result(best_of(lambda: MLService().load(), repeat), "ms")}
+
+
+def bench_api_predict(n_requests: int) -> dict[str, dict]:
+    """Times ``/api/v1/predict`` end to end through the ASGI app.
+
+    Args:
+        n_requests: Number of distinct requests sent, one at a time.
+
+    Returns:
+        Median and p99 latency of an uncached request.
+    """
+    if not ml_service.is_loaded:
+        ml_service.load()
+    cache, ml_service._cache = ml_service._cache, PredictionCache(max_size=0, ttl_seconds=0)
+    payloads = [r.model_dump(mode="json") for r in make_requests(n_requests)]
+
+    async def send_all() -> list[float]:
+        timings = []
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for payload in payloads:
+                start = time.perf_counter()
+                response = await client.post("/api/v1/predict", json=payload)
+                timings.append(time.perf_counter() - start)
+                response.raise_for_status()
+        return sorted(timings)
+
+    try:
+        timings = asyncio.run(send_all())
+    finally:
+        ml_service._cache = cache
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    return {"api_predict": _result(timings[len(timings) // 2], "us", p99_us=p99 * 1e6)}
+
+
+@contextmanager
+def scratch_model_dir(directory: Path) -> Iterator[None]:
+    """Points every artifact path of ``train_model`` into ``directory``."""
+    names = ["MODEL_DIR", *TRAIN_ARTIFACT_PATHS]
+    saved = {name: getattr(train_model, name) for name in names}
+    train_model.MODEL_DIR = directory
+    for name, filename in TRAIN_ARTIFACT_PATHS.items():
+        setattr(train_model, name, directory / filename)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(train_model, name, value)
+
+
+def bench_train(sizes: list[int], repeat: int) -> dict[str, dict]:
+    """Times a full ``train_and_save`` on synthetic listings of each size.
+
+    Args:
+        sizes: Number of synthetic rows per training run.
+        repeat: Number of timed runs per size (best is kept).
+
+    Returns:
+        Results keyed by ``train_<rows>``.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for n in sizes:
+            csv_path = directory / f"listings_{n}.csv"
+            train_model.generate_synthetic_data(n).to_csv(csv_path, index=False)
+            with scratch_model_dir(directory / f"models_{n}"):
+                train_s = best_of(
+                    lambda: train_model.train_and_save(ingest_options={"csv_path": csv_path}),
+                    repeat,
+                )
+            results[f"train_{n}"] = _result(train_s, "s", rows_per_s=n / train_s)
+    return results
+
+
+def environment() -> dict[str, str]:
+    """Returns the interpreter and library versions a run was measured with."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "numpy": numpy.__version__,
+        "sklearn": sklearn.__version__,
+    }
+
+
+def run(
+    cases: list[str],
+    batch_sizes: list[int],
+    train_sizes: list[int],
+    repeat: int,
+    api_requests: int,
+) -> dict:
+    """Runs the selected cases.
+
+    Args:
+        cases: Case groups to run (keys of CASES).
+        batch_sizes: Row counts for ``predict_batch``.
+        train_sizes: Dataset sizes for ``train``.
+        repeat: Timed repetitions of the micro-benchmarks (best is kept).
+        api_requests: Requests sent by ``api_predict``.
+
+    Returns:
+        JSON-serialisable report with the environment and one result per case.
+    """
+    steps: dict[str, Callable[[], dict[str, dict]]] = {
+        "predict_single": lambda: bench_predict_single(repeat),
+        "predict_batch": lambda: bench_predict_batch(batch_sizes, max(1, repeat // 10)),
+        "load": lambda: bench_load(max(1, repeat // 100)),
+        "api_predict": lambda: bench_api_predict(api_requests),
+        "train": lambda: bench_train(train_sizes, 1),
+    }
+    results: dict[str, dict] = {}
+    for case in cases:
+        results.update(steps[case]())
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[dict]:
+    """Compares two reports case by case.
+
+    Args:
+        current: Report from ``run``.
+        baseline: Earlier report to compare against.
+        threshold: Relative slowdown beyond which a case counts as a
+            regression, e.g. 0.15 for 15%.
+
+    Returns:
+        One row per case present in both reports, with the relative change
+        and whether it regressed.
+    """
+    rows = []
+    for name, result in current["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if before is None or before["unit"] != result["unit"] or before["value"] <= 0:
+            continue
+        change = result["value"] / before["value"] - 1.0
+        rows.append(
+            {
+                "case": name,
+                "unit": result["unit"],
+                "baseline": before["value"],
+                "current": result["value"],
+                "change": change,
+                "regression": change > threshold,
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    """Parses CLI arguments, runs the suite and reports or compares the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", nargs="+", default=list(CASES), choices=CASES)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--train-sizes", type=int, nargs="+", default=[1000, 2500, 10000])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--api-requests", type=int, default=300)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", type=Path, help="Earlier JSON report to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.15, help="Relative slowdown flagged as a regression"
+    )
+    args = parser.parse_args()
+    # The scaler was fitted on a DataFrame; silence the per-call feature-name warning.
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+    report = run(args.cases, args.batch_sizes, args.train_sizes, args.repeat, args.api_requests)
+    if args.baseline is None:
+        text = json.dumps(report, indent=2)
+        if args.output is None:
+            print(text)
+        else:
+            args.output.write_text(text + "\n")
+        return
+
+    rows = compare(report, json.loads(args.baseline.read_text()), args.threshold)
+    report["comparison"] = {
+        "baseline": str(args.baseline),
+        "threshold": args.threshold,
+        "cases": rows,
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"{'case':<20} {'baseline':>12} {'current':>12} {'change':>8}")
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['case']:<20} {row['baseline']:>10.2f}{row['unit']:<2} "
+            f"{row['current']:>10.2f}{row['unit']:<2} {row['change']:>+7.1%}{flag}"
+        )
+    regressions = [row["case"] for row in rows if row["regression"]]
+    if regressions:
+        print(f"Regressions beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Synthetic traffic generator: request mixes sampled from the training listings.
+
+Writes a JSONL traffic file for ``benchmarks.load_test``. Each line is one
+HTTP call:
+
+    {"method": "POST", "path": "/api/v1/predict", "body": {...}}
+
+Property specs are bootstrapped from whole rows of the training CSV, so the
+joint distribution of locality, size, floors and amenities matches real
+listings. The area is jittered so most requests miss the prediction cache,
+and a share of requests repeats earlier ones, as returning users do.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.traffic --requests 5000 --output traffic.jsonl
+    python -m benchmarks.traffic --mix predict=0.7 batch=0.1 explain=0.1 compare=0.1
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from app.schemas.prediction import NaviMumbaiLocation
+from benchmarks.common import RANDOM_STATE
+from train_model import FEATURES, find_csv, load_real_data
+
+DEFAULT_MIX = {"predict": 0.85, "batch": 0.05, "explain": 0.04, "compare": 0.04, "invalid": 0.02}
+
+# Schema bounds of PredictionRequest, applied after jittering and rounding.
+BOUNDS = {
+    "area_sqft": (300.0, 10000.0),
+    "bhk": (1, 5),
+    "bathrooms": (1, 5),
+    "floor": (0, 60),
+    "total_floors": (1, 60),
+    "age_of_property": (0, 50),
+    "parking": (0, 1),
+    "lift": (0, 1),
+}
+
+_LOCATIONS = {location.value.lower(): location.value for location in NaviMumbaiLocation}
+
+
+def sample_specs(
+    df: pd.DataFrame, n: int, rng: np.random.Generator, area_jitter: float = 0.05
+) -> list[dict[str, Any]]:
+    """Bootstraps ``n`` valid prediction bodies from listing rows.
+
+    Args:
+        df: Listings with FEATURES columns (locality names in any case).
+        n: Number of bodies to draw.
+        rng: Random generator.
+        area_jitter: Relative standard deviation of the area noise.
+
+    Returns:
+        Request bodies accepted by ``PredictionRequest``.
+
+    Raises:
+        ValueError: If no row has a supported locality.
+    """
+    df = df.assign(location=df["location"].str.strip().str.lower().map(_LOCATIONS))
+    df = df.dropna(subset=["location"])
+    if df.empty:
+        raise ValueError("No listing has a supported locality")
+    rows = df[FEATURES].iloc[rng.integers(len(df), size=n)].reset_index(drop=True)
+    rows["area_sqft"] = rows["area_sqft"] * rng.lognormal(0.0, area_jitter, size=n)
+
+    specs = []
+    for row in rows.itertuples(index=False):
+        spec: dict[str, Any] = {"location": row.location}
+        for name, (low, high) in BOUNDS.items():
+            value = min(max(getattr(row, name), low), high)
+            spec[name] = round(float(value), 2) if name == "area_sqft" else int(round(value))
+        spec["floor"] = min(spec["floor"], spec["total_floors"])
+        specs.append(spec)
+    return specs
+
+
+def build_traffic(
+    df: pd.DataFrame,
+    n: int,
+    mix: dict[str, float] = DEFAULT_MIX,
+    batch_size: int = 20,
+    duplicate_fraction: float = 0.2,
+    seed: int = RANDOM_STATE,
+) -> list[dict[str, Any]]:
+    """Builds ``n`` traffic records in the proportions of ``mix``.
+
+    Args:
+        df: Listings to sample property specs from.
+        n: Number of HTTP calls.
+        mix: Weight per kind of call: ``predict``, ``batch``, ``explain``,
+            ``compare`` and ``invalid`` (a /predict with an area below the
+            schema minimum, rejected with 422).
+        batch_size: Rows per /predict/batch call.
+        duplicate_fraction: Share of /predict calls that repeat an earlier one.
+        seed: Seed for reproducible traffic.
+
+    Returns:
+        Records with ``method``, ``path`` and ``body`` keys.
+
+    Raises:
+        ValueError: If the mix names an unknown kind or has no positive weight.
+    """
+    unknown = set(mix) - set(DEFAULT_MIX)
+    if unknown:
+        raise ValueError(f"Unknown traffic kinds {sorted(unknown)}; expected {list(DEFAULT_MIX)}")
+    weights = np.array([max(0.0, mix.get(kind, 0.0)) for kind in DEFAULT_MIX])
+    if weights.sum() <= 0:
+        raise ValueError("Traffic mix needs at least one positive weight")
+
+    rng = np.random.default_rng(seed)
+    kinds = rng.choice(list(DEFAULT_MIX), size=n, p=weights / weights.sum())
+    specs = iter(sample_specs(df, int(n + (kinds == "batch").sum() * batch_size), rng))
+    sent: list[dict[str, Any]] = []
+    records = []
+    for kind in kinds:
+        if kind == "batch":
+            body = {"items": [next(specs) for _ in range(batch_size)]}
+            records.append({"method": "POST", "path": "/api/v1/predict/batch", "body": body})
+            continue
+        spec = next(specs)
+        if kind == "predict" and sent and rng.random() < duplicate_fraction:
+            spec = sent[int(rng.integers(len(sent)))]
+        if kind == "invalid":
+            spec = {**spec, "area_sqft": BOUNDS["area_sqft"][0] / 2}
+        path = {
+            "predict": "/api/v1/predict",
+            "invalid": "/api/v1/predict",
+            "explain": "/api/v1/predict/explain",
+            "compare": "/api/v1/locations/compare",
+        }[kind]
+        if kind == "predict":
+            sent.append(spec)
+        records.append({"method": "POST", "path": path, "body": spec})
+    return records
+
+
+def parse_mix(values: list[str]) -> dict[str, float]:
+    """Parses ``kind=weight`` arguments into a mix."""
+    mix = {}
+    for value in values:
+        kind, _, weight = value.partition("=")
+        mix[kind] = float(weight)
+    return mix
+
+
+def main() -> None:
+    """Parses CLI arguments and writes a synthetic traffic file."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--csv", type=Path, help="Listings CSV (default: the bundled dataset)")
+    parser.add_argument("--mix", nargs="+", help="kind=weight pairs (default: mostly /predict)")
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--duplicate-fraction", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=RANDOM_STATE)
+    parser.add_argument("--output", type=Path, help="Traffic file to write (default: stdout)")
+    args = parser.parse_args()
+
+    csv_path = args.csv or find_csv()
+    if csv_path is None:
+        parser.error("Training CSV not found; pass --csv")
+    records = build_traffic(
+        load_real_data(csv_path),
+        args.requests,
+        parse_mix(args.mix) if args.mix else DEFAULT_MIX,
+        args.batch_size,
+        args.duplicate_fraction,
+        args.seed,
+    )
+    lines = "".join(json.dumps(record) + "\n" for record in records)
+    if args.output is None:
+        sys.stdout.write(lines)
+    else:
+        args.output.write_text(lines)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""Streaming CSV ingestion with compact dtypes and a columnar .npy cache.
+
+``train_model.load_real_data`` reads the whole CSV into memory at once, which
+is fine for the 2,500-row dataset but not for full scrapes with tens of
+millions of rows. This module reads the CSV in chunks with explicit compact
+dtypes (categorical ``location``, float32 numerics, int8 flags), applies the
+same cleaning filters to every chunk and keeps only the cleaned rows.
+
+The result can be cached as one ``.npy`` file per column plus a
+``manifest.json`` recording the source file's size and mtime, so later
+training runs skip CSV parsing entirely. The target column stays float64:
+float32 cannot represent prices above 2**24 INR exactly.
+
+Used by train_model.py:
+
+    python train_model.py --chunksize 500000 --data-cache models/.data_cache
+"""
+
+import json
+import logging
+import math
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+DEFAULT_CHUNKSIZE = 200_000
+# CSVs at least this large are streamed even without an explicit chunk size.
+CHUNKED_INGEST_MIN_BYTES = 64 * 1024 * 1024
+
+# Dtypes while parsing: numerics as float32 so missing values stay NaN.
+READ_DTYPES = {
+    "location": "category",
+    "area_sqft": "float32",
+    "bhk": "float32",
+    "bathrooms": "float32",
+    "floor": "float32",
+    "total_floors": "float32",
+    "age_of_property": "float32",
+    "parking": "float32",
+    "lift": "float32",
+    "actual_price": "float64",
+}
+# 0/1 flag columns narrowed once NaNs have been dropped. ``bhk`` and ``floor``
+# stay float32: the cleaned dataset holds imputed fractional values for them.
+INTEGER_DTYPES = {"parking": "int8", "lift": "int8"}
+
+
+def normalise_column(name: str) -> str:
+    """Normalises a CSV header the way train_model.load_real_data does."""
+    return name.strip().lower().replace(" ", "_")
+
+
+def peak_rss_mb() -> float:
+    """Returns this process's peak resident set size in MiB, or NaN if unknown.
+
+    The ``resource`` module is Unix-only; on Windows peak RSS is not reported.
+    """
+    try:
+        import resource
+    except ImportError:
+        return math.nan
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def clean_chunk(chunk: pd.DataFrame, target: str) -> pd.DataFrame:
+    """Drops incomplete rows and rows with a non-positive area or price."""
+    chunk = chunk.dropna()
+    return chunk[(chunk["area_sqft"] > 0) & (chunk[target] > 0)]
+
+
+def _resolve_columns(csv_path: Path, required: list[str]) -> dict[str, str]:
+    """Maps the CSV's raw header names to the required normalised names.
+
+    Raises:
+        ValueError: If required columns are missing.
+    """
+    header = pd.read_csv(csv_path, nrows=0).columns
+    raw_by_name = {normalise_column(raw): raw for raw in header}
+    missing = [c for c in required if c not in raw_by_name]
+    if missing:
+        raise ValueError(
+            f"CSV is missing required columns: {missing}. "
+            f"Found: {[normalise_column(c) for c in header]}"
+        )
+    return {raw_by_name[name]: name for name in required}
+
+
+def read_csv_chunked(
+    csv_path: Path, features: list[str], target: str, chunksize: int = DEFAULT_CHUNKSIZE
+) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """Streams a listings CSV into a compact, cleaned DataFrame.
+
+    Args:
+        csv_path: Path to the listings CSV.
+        features: Feature columns to keep, in order.
+        target: Target column name.
+        chunksize: Rows parsed per chunk.
+
+    Returns:
+        Tuple of (cleaned DataFrame with ``features + [target]`` columns,
+        ingestion stats with row counts, chunk count, seconds, the frame's
+        size in MiB and the process's peak RSS in MiB).
+
+    Raises:
+        ValueError: If required columns are missing.
+    """
+    required = features + [target]
+    rename = _resolve_columns(csv_path, required)
+    dtypes = {raw: READ_DTYPES.get(name, "float32") for raw, name in rename.items()}
+
+    start = time.perf_counter()
+    rows_read = chunks = 0
+    parts: list[pd.DataFrame] = []
+    with pd.read_csv(csv_path, usecols=list(rename), dtype=dtypes, chunksize=chunksize) as reader:
+        for chunk in reader:
+            chunks += 1
+            rows_read += len(chunk)
+            parts.append(clean_chunk(chunk.rename(columns=rename), target))
+
+    if parts:
+        # Chunks carry different category sets; union them before concatenating.
+        locations = union_categoricals([part["location"] for part in parts], sort_categories=True)
+        df = pd.concat([part.drop(columns="location") for part in parts], ignore_index=True)
+        df.insert(0, "location", pd.Categorical(locations))
+    else:
+        df = pd.DataFrame({name: pd.Series(dtype=READ_DTYPES.get(name)) for name in required})
+    df = df.astype(INTEGER_DTYPES)[required]
+
+    stats = {
+        "rows_read": rows_read,
+        "rows_kept": len(df),
+        "chunks": chunks,
+        "seconds": time.perf_counter() - start,
+        "frame_mb": df.memory_usage(deep=True).sum() / (1024 * 1024),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    return df, stats
+
+
+def _source_stamp(csv_path: Path) -> dict[str, Any]:
+    """Identifies a source CSV version by path, size and mtime."""
+    stat = csv_path.stat()
+    return {"path": str(csv_path.resolve()), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def write_cache(cache_dir: Path, df: pd.DataFrame, csv_path: Path) -> None:
+    """Writes a cleaned frame as one .npy file per column.
+
+    The manifest is written last, so an interrupted write leaves no valid
+    cache behind.
+
+    Args:
+        cache_dir: Cache directory.
+        df: Frame returned by ``read_csv_chunked``.
+        csv_path: Source CSV the frame was read from.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    (cache_dir / MANIFEST_NAME).unlink(missing_ok=True)
+    columns = {}
+    for name in df.columns:
+        series = df[name]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            np.save(cache_dir / f"{name}.codes.npy", series.cat.codes.to_numpy(), allow_pickle=False)
+            np.save(
+                cache_dir / f"{name}.categories.npy",
+                series.cat.categories.to_numpy(dtype=str),
+                allow_pickle=False,
+            )
+            columns[name] = "category"
+        else:
+            np.save(cache_dir / f"{name}.npy", series.to_numpy(), allow_pickle=False)
+            columns[name] = str(series.dtype)
+
+    manifest = {
+        "format_version": CACHE_FORMAT_VERSION,
+        "source": _source_stamp(csv_path),
+        "rows": len(df),
+        "columns": columns,
+    }
+    tmp = cache_dir / f".{MANIFEST_NAME}.{os.getpid()}.tmp"
+    tmp.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp, cache_dir / MANIFEST_NAME)
+    logger.info("Saved columnar data cache (%d rows) → %s", len(df), cache_dir)
+
+
+def read_cache(cache_dir: Path, csv_path: Path) -> pd.DataFrame | None:
+    """Loads a cache written by ``write_cache`` if it matches the source CSV.
+
+    Args:
+        cache_dir: Cache directory.
+        csv_path: Source CSV; a cache of a different size or mtime is stale.
+
+    Returns:
+        The cached frame, or None if there is no valid cache.
+    """
+    try:
+        manifest = json.loads((cache_dir / MANIFEST_NAME).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if manifest.get("format_version") != CACHE_FORMAT_VERSION:
+        return None
+    if manifest.get("source") != _source_stamp(csv_path):
+        logger.info("Data cache in %s is stale; re-reading %s", cache_dir, csv_path)
+        return None
+
+    data = {}
+    for name, dtype in manifest["columns"].items():
+        if dtype == "category":
+            data[name] = pd.Categorical.from_codes(
+                np.load(cache_dir / f"{name}.codes.npy", allow_pickle=False),
+                np.load(cache_dir / f"{name}.categories.npy", allow_pickle=False),
+            )
+        else:
+            data[name] = np.load(cache_dir / f"{name}.npy", allow_pickle=False)
+    return pd.DataFrame(data)
+
+
+def ingest_csv(
+    csv_path: Path,
+    features: list[str],
+    target: str,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    cache_dir: Path | None = None,
+) -> pd.DataFrame:
+    """Loads cleaned listings from the .npy cache or by streaming the CSV.
+
+    Args:
+        csv_path: Path to the listings CSV.
+        features: Feature columns to keep, in order.
+        target: Target column name.
+        chunksize: Rows parsed per chunk.
+        cache_dir: Columnar cache directory; None disables caching.
+
+    Returns:
+        DataFrame with ``features + [target]`` columns in compact dtypes.
+
+    Raises:
+        ValueError: If required columns are missing.
+    """
+    if cache_dir is not None:
+        start = time.perf_counter()
+        df = read_cache(cache_dir, csv_path)
+        if df is not None:
+            logger.info(
+                "Loaded %d rows from data cache %s in %.2fs (peak RSS %.0f MiB)",
+                len(df), cache_dir, time.perf_counter() - start, peak_rss_mb(),
+            )
+            return df
+
+    df, stats = read_csv_chunked(csv_path, features, target, chunksize)
+    logger.info(
+        "Streamed CSV: %d rows in %d chunks, kept %d after cleanup in %.2fs "
+        "(frame %.1f MiB, peak RSS %.0f MiB)",
+        stats["rows_read"], stats["chunks"], stats["rows_kept"], stats["seconds"],
+        stats["frame_mb"], stats["peak_rss_mb"],
+    )
+    filtered = stats["rows_read"] - stats["rows_kept"]
+    if filtered:
+        logger.warning("Filtered out %d rows with missing values or negative/zero area or price", filtered)
+    if cache_dir is not None:
+        write_cache(cache_dir, df, csv_path)
+    return df
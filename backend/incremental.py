@@ -0,0 +1,273 @@
+"""Incremental (warm-start) retraining from listings appended to the CSV.
+
+A full refit fits every boosting stage on every row. When the training CSV has
+only grown since the last run, this module instead:
+
+  1. Checks that the CSV still starts with the exact bytes recorded in
+     models/training_metadata.json (see ``train_model.csv_stamp``), so the
+     rows after that offset are the only new listings.
+  2. Reads and cleans just those rows, label-encodes them with the existing
+     vocabulary and scales them with the existing scaler.
+  3. Adds boosting stages fitted on the new rows with ``warm_start`` to the
+     point model and to the quantile models behind the price range. The
+     number of stages is proportional to the share of new rows, so build
+     time scales with the delta rather than the dataset.
+  4. Scores the model on the persisted holdout before and after the update,
+     records the drift against the holdout R² of the last full refit, and
+     saves the artifacts.
+
+A full refit (``train_model.train_and_save`` with the recorded parameters) is
+run instead when there is no usable metadata, the saved artifacts were
+pickled by a different scikit-learn version, the CSV was rewritten, the
+backend is not ``gbr``, new localities appear or holdout R² drifts more than
+``max_drift`` below the last full refit. New localities require a refit
+because the vocabulary is sorted: adding a name shifts the codes the existing
+trees split on.
+
+    python train_model.py --incremental
+"""
+
+import csv
+import hashlib
+import io
+import logging
+import math
+import pickle
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.model_selection import train_test_split
+
+import train_model
+from train_model import FEATURES, RANDOM_STATE, TARGET
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_DRIFT = 0.02
+# Share of the new rows added to the holdout instead of being fitted.
+DELTA_HOLDOUT_FRACTION = 0.20
+
+
+def appended_offset(csv_path: Path, data: dict) -> int | None:
+    """Returns the byte offset of rows appended since the recorded stamp.
+
+    Args:
+        csv_path: Current training CSV.
+        data: ``data`` section of the training metadata.
+
+    Returns:
+        Offset of the first new byte, or None if the CSV no longer starts
+        with the recorded content.
+    """
+    size = csv_path.stat().st_size
+    recorded = data["bytes"]
+    if size < recorded:
+        return None
+    digest = hashlib.sha256()
+    with open(csv_path, "rb") as f:
+        remaining = recorded
+        while remaining:
+            block = f.read(min(1 << 20, remaining))
+            if not block:
+                return None
+            digest.update(block)
+            remaining -= len(block)
+        following = f.read(1)
+    if digest.hexdigest() != data["sha256"]:
+        return None
+    # Without a trailing newline, appended text must start a new line;
+    # otherwise the last recorded row has been extended.
+    if not data.get("ends_with_newline", True) and following not in (b"", b"\n", b"\r"):
+        return None
+    return recorded
+
+
+def read_appended_listings(csv_path: Path, offset: int) -> pd.DataFrame:
+    """Reads and cleans the listings after ``offset`` in the CSV.
+
+    Args:
+        csv_path: Training CSV.
+        offset: Byte offset returned by ``appended_offset``.
+
+    Returns:
+        DataFrame with FEATURES and TARGET columns (possibly empty).
+    """
+    with open(csv_path, "rb") as f:
+        header = f.readline().decode()
+        f.seek(offset)
+        tail = f.read()
+    if not tail.strip():
+        return pd.DataFrame(columns=FEATURES + [TARGET])
+    names = next(csv.reader([header]))
+    return train_model.clean_listings(pd.read_csv(io.BytesIO(tail), names=names, header=None))
+
+
+def _add_stages(model, stages: int, features: np.ndarray, y: np.ndarray) -> None:
+    """Fits ``stages`` more boosting stages of ``model`` on new rows.
+
+    The new stages are fitted without row subsampling: a delta of a few rows
+    can leave no out-of-bag row, and sklearn's out-of-bag scoring then fails
+    on an all-zero weight vector.
+    """
+    subsample = model.subsample
+    model.set_params(warm_start=True, n_estimators=model.n_estimators_ + stages, subsample=1.0)
+    try:
+        model.fit(features, y)
+    finally:
+        model.set_params(warm_start=False, subsample=subsample)
+
+
+def _full_refit(metadata: dict | None, reason: str, ingest_options: dict | None) -> str:
+    """Falls back to a full refit with the recorded backend and parameters."""
+    logger.info("Full refit: %s.", reason)
+    backend = (metadata or {}).get("backend", "gbr")
+    params = (metadata or {}).get("params")
+    train_model.train_and_save(backend, ingest_options=ingest_options, params=params)
+    return "full"
+
+
+def train_incremental(
+    ingest_options: dict | None = None,
+    stages: int | None = None,
+    max_drift: float = DEFAULT_MAX_DRIFT,
+) -> str:
+    """Updates the saved model with listings appended to the training CSV.
+
+    Args:
+        ingest_options: Keyword arguments for ``train_model.load_training_data``;
+            only ``csv_path`` is used unless a full refit is needed.
+        stages: Boosting stages to add; defaults to the model's stage count
+            scaled by new rows / rows fitted so far (at least 1).
+        max_drift: Largest tolerated drop in holdout R² below the last full
+            refit before falling back to a full refit.
+
+    Returns:
+        ``"unchanged"`` if there were no new listings, ``"incremental"`` if
+        stages were added, or ``"full"`` if a full refit was run.
+    """
+    ingest_options = ingest_options or {}
+    metadata = train_model.load_training_metadata()
+    data = (metadata or {}).get("data")
+    csv_path = ingest_options.get("csv_path") or train_model.find_csv()
+
+    if metadata is None or data is None or csv_path is None:
+        return _full_refit(metadata, "no training metadata for the CSV", ingest_options)
+    if metadata.get("sklearn_version") != sklearn.__version__:
+        reason = (
+            f"artifacts pickled by scikit-learn {metadata.get('sklearn_version', 'unknown')}, "
+            f"running {sklearn.__version__}"
+        )
+        return _full_refit(metadata, reason, ingest_options)
+    if metadata["backend"] != "gbr":
+        return _full_refit(metadata, f"warm start supports gbr only, not {metadata['backend']}", ingest_options)
+    if not train_model.HOLDOUT_PATH.exists():
+        return _full_refit(metadata, "no saved holdout", ingest_options)
+    offset = appended_offset(csv_path, data)
+    if offset is None:
+        return _full_refit(metadata, f"{csv_path} was rewritten, not appended to", ingest_options)
+
+    delta = read_appended_listings(csv_path, offset)
+    if delta.empty:
+        logger.info("No new listings since %s; artifacts unchanged.", metadata["trained_at"])
+        return "unchanged"
+
+    with open(train_model.LABEL_ENCODER_PATH, "rb") as f:
+        label_encoder = pickle.load(f)
+    new_locations = set(delta["location"].astype(str).str.lower()) - set(label_encoder.classes_)
+    if new_locations:
+        return _full_refit(metadata, f"new localities {sorted(new_locations)}", ingest_options)
+
+    with open(train_model.MODEL_PATH, "rb") as f:
+        model = pickle.load(f)
+    with open(train_model.SCALER_PATH, "rb") as f:
+        scaler = pickle.load(f)
+
+    X_delta = delta[FEATURES].copy()
+    X_delta["location"] = label_encoder.transform(X_delta["location"].astype(str).str.lower())
+    X_delta = X_delta.to_numpy(dtype=float)
+    y_delta = delta[TARGET].to_numpy(dtype=float)
+
+    holdout = np.load(train_model.HOLDOUT_PATH)
+    X_holdout, y_holdout = holdout["X"], holdout["y"]
+    if len(delta) >= 2 / DELTA_HOLDOUT_FRACTION:
+        X_delta, X_delta_holdout, y_delta, y_delta_holdout = train_test_split(
+            X_delta, y_delta, test_size=DELTA_HOLDOUT_FRACTION, random_state=RANDOM_STATE
+        )
+        X_holdout = np.vstack([X_holdout, X_delta_holdout])
+        y_holdout = np.concatenate([y_holdout, y_delta_holdout])
+
+    holdout_features = scaler.transform(pd.DataFrame(X_holdout, columns=FEATURES))
+    r2_before = model.score(holdout_features, y_holdout)
+
+    n_before = model.n_estimators_
+    share = len(X_delta) / data["train_rows"]
+    if stages is None:
+        stages = max(1, math.ceil(n_before * share))
+    delta_features = scaler.transform(pd.DataFrame(X_delta, columns=FEATURES))
+    _add_stages(model, stages, delta_features, y_delta)
+
+    quantile_models = train_model.load_quantile_models() or {}
+    for quantile_model in quantile_models.values():
+        quantile_stages = max(1, math.ceil(quantile_model.n_estimators_ * share))
+        _add_stages(quantile_model, quantile_stages, delta_features, y_delta)
+
+    metrics = train_model.regression_metrics(y_holdout, model.predict(holdout_features))
+    r2_after = metrics["r2_score"]
+    intervals = None
+    if quantile_models:
+        intervals = train_model.interval_stats(
+            y_holdout,
+            model.predict(holdout_features),
+            quantile_models[min(quantile_models)].predict(holdout_features),
+            quantile_models[max(quantile_models)].predict(holdout_features),
+        )
+    baseline_r2 = metadata["r2_score"]
+    drift = r2_after - baseline_r2
+    logger.info(
+        "Added %d stages (%d → %d) from %d new listings. Holdout R² %.4f → %.4f "
+        "(%+.4f vs. last full refit, %d holdout rows).",
+        stages, n_before, model.n_estimators_, len(delta), r2_before, r2_after, drift, len(y_holdout),
+    )
+    if drift < -max_drift:
+        return _full_refit(metadata, f"holdout R² drifted {drift:+.4f} (limit -{max_drift})", ingest_options)
+
+    with open(train_model.MODEL_PATH, "wb") as f:
+        pickle.dump(model, f)
+    if quantile_models:
+        with open(train_model.QUANTILE_MODELS_PATH, "wb") as f:
+            pickle.dump(quantile_models, f)
+    np.savez(train_model.HOLDOUT_PATH, X=X_holdout, y=y_holdout)
+    params = {**metadata["params"], "n_estimators": model.n_estimators_}
+    dataset_rows = metadata.get("dataset_rows")
+    history = metadata.get("history", []) + [{
+        "mode": "incremental",
+        "trained_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "rows": len(delta),
+        "stages_added": stages,
+        "holdout_rows": len(y_holdout),
+        "holdout_r2_before": r2_before,
+        "holdout_r2": r2_after,
+        "drift": drift,
+        "intervals": intervals,
+    }]
+    train_model.export_bundle(
+        model,
+        scaler,
+        label_encoder,
+        metrics={"r2_score": r2_after, "params": params, "drift": drift, "intervals": intervals},
+        quantile_models=quantile_models,
+    )
+    train_model.write_training_metadata(
+        "gbr",
+        params,
+        baseline_r2,
+        metadata.get("hyperparameter_search"),
+        {**train_model.csv_stamp(csv_path), "train_rows": data["train_rows"] + len(X_delta)},
+        history,
+        metrics,
+        dataset_rows + len(delta) if dataset_rows is not None else None,
+    )
+    return "incremental"
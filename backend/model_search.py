@@ -0,0 +1,251 @@
+"""Parallel k-fold hyperparameter search for train_model.py.
+
+Evaluates every configuration of a grid (or a random sample of it) with
+k-fold cross-validation, one (config, fold) fit per task in a process pool,
+and caches each fold's result on disk so repeated runs only fit what is new.
+The winner is chosen by a latency-aware objective:
+
+    objective = mean CV R² - latency_weight * cost / REFERENCE_COST
+
+where ``cost`` is the number of trees times their maximum depth, i.e. the
+node visits needed to price one row, which is what serving time scales with.
+``REFERENCE_COST`` is the cost of the default 200-tree, depth-5 model, so a
+``latency_weight`` of 0.01 trades 0.01 R² for each multiple of today's cost.
+
+Run through train_model.py:
+
+    python train_model.py --search
+    python train_model.py --search --search-space space.json --search-samples 12 --folds 5
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import sklearn
+from sklearn.metrics import r2_score
+from sklearn.model_selection import KFold
+
+from train_model import DEFAULT_PARAMS, RANDOM_STATE, build_model
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_SPACES = {
+    "gbr": {"n_estimators": [100, 200, 400], "learning_rate": [0.05, 0.1], "max_depth": [3, 4, 5]},
+    "hist": {"max_iter": [100, 200, 400], "learning_rate": [0.05, 0.1], "max_depth": [3, 4, 5]},
+}
+# Tree-count parameter of each backend
+TREE_COUNT_PARAMS = {"gbr": "n_estimators", "hist": "max_iter"}
+REFERENCE_COST = 200 * 5
+DEFAULT_LATENCY_WEIGHT = 0.01
+
+
+def model_cost(backend: str, params: dict[str, Any]) -> int:
+    """Returns trees × depth, the per-row node visits of a configuration."""
+    params = {**DEFAULT_PARAMS[backend], **params}
+    return int(params[TREE_COUNT_PARAMS[backend]]) * int(params["max_depth"])
+
+
+def objective(mean_r2: float, cost: int, latency_weight: float) -> float:
+    """Scores a configuration; higher is better."""
+    return mean_r2 - latency_weight * cost / REFERENCE_COST
+
+
+def expand_space(
+    space: dict[str, list[Any]], n_samples: int | None = None, seed: int = RANDOM_STATE
+) -> list[dict[str, Any]]:
+    """Lists the configurations of a search space.
+
+    Args:
+        space: Candidate values per hyperparameter.
+        n_samples: If set and smaller than the grid, sample this many
+            configurations uniformly without replacement.
+        seed: Seed for the random sample.
+
+    Returns:
+        Configurations in grid order.
+    """
+    names = sorted(space)
+    grid = [dict(zip(names, values)) for values in itertools.product(*(space[n] for n in names))]
+    if n_samples is None or n_samples >= len(grid):
+        return grid
+    rng = np.random.default_rng(seed)
+    return [grid[i] for i in sorted(rng.choice(len(grid), size=n_samples, replace=False))]
+
+
+class FoldCache:
+    """Directory of JSON files, one per evaluated (config, fold)."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Returns a cached fold result, or None."""
+        try:
+            return json.loads((self.cache_dir / f"{key}.json").read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        """Stores a fold result atomically."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_dir / f".{key}.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(result))
+        os.replace(tmp, self.cache_dir / f"{key}.json")
+
+
+def _data_fingerprint(features: np.ndarray, y: np.ndarray) -> str:
+    """Hashes the training data so cached folds are tied to it."""
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(features, dtype=np.float64).tobytes())
+    digest.update(np.ascontiguousarray(y, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def _fold_key(backend: str, params: dict[str, Any], fold: int, folds: int, data: str) -> str:
+    """Returns the cache key of one (config, fold) evaluation."""
+    payload = json.dumps(
+        {
+            "backend": backend,
+            "params": params,
+            "fold": fold,
+            "folds": folds,
+            "data": data,
+            "random_state": RANDOM_STATE,
+            "sklearn": sklearn.__version__,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def _evaluate_fold(
+    backend: str,
+    params: dict[str, Any],
+    features: np.ndarray,
+    y: np.ndarray,
+    train_idx: np.ndarray,
+    val_idx: np.ndarray,
+) -> dict[str, float]:
+    """Fits one configuration on one fold; runs in a worker process."""
+    model = build_model(backend, params)
+    start = time.perf_counter()
+    model.fit(features[train_idx], y[train_idx])
+    fit_s = time.perf_counter() - start
+    return {"r2": float(r2_score(y[val_idx], model.predict(features[val_idx]))), "fit_s": fit_s}
+
+
+def run_search(
+    backend: str,
+    features: np.ndarray,
+    y: np.ndarray,
+    space: dict[str, list[Any]] | None = None,
+    n_samples: int | None = None,
+    folds: int = 5,
+    n_jobs: int | None = None,
+    latency_weight: float = DEFAULT_LATENCY_WEIGHT,
+    cache_dir: Path | None = None,
+) -> dict[str, Any]:
+    """Cross-validates a search space and picks the best configuration.
+
+    Args:
+        backend: One of train_model.TRAINING_BACKENDS.
+        features: Model input matrix (scaled for ``gbr``).
+        y: Target prices.
+        space: Candidate values per hyperparameter; defaults to
+            DEFAULT_SEARCH_SPACES for the backend.
+        n_samples: Random sample size of the grid; None evaluates all of it.
+        folds: Number of cross-validation folds.
+        n_jobs: Worker processes; defaults to all cores.
+        latency_weight: R² traded per multiple of REFERENCE_COST.
+        cache_dir: Directory of cached fold results; None disables caching.
+
+    Returns:
+        JSON-serializable summary: the chosen ``best_params``, its CV R²,
+        cost and objective, the search settings, fold counts (fitted vs.
+        cached) and every configuration's scores, best first.
+    """
+    space = space or DEFAULT_SEARCH_SPACES[backend]
+    configs = expand_space(space, n_samples)
+    y = np.asarray(y, dtype=float)
+    splits = list(KFold(n_splits=folds, shuffle=True, random_state=RANDOM_STATE).split(features))
+    data = _data_fingerprint(features, y)
+    cache = FoldCache(cache_dir) if cache_dir is not None else None
+
+    scores: dict[tuple[int, int], dict[str, float]] = {}
+    pending = []
+    for c, params in enumerate(configs):
+        for f in range(folds):
+            key = _fold_key(backend, params, f, folds, data)
+            cached = cache.get(key) if cache is not None else None
+            if cached is not None:
+                scores[c, f] = cached
+            else:
+                pending.append((c, f, key))
+
+    n_cached = len(scores)
+    n_jobs = n_jobs or os.cpu_count() or 1
+    logger.info(
+        "Searching %d %s configs × %d folds: %d cached, %d to fit on %d workers.",
+        len(configs), backend, folds, n_cached, len(pending), n_jobs,
+    )
+    start = time.perf_counter()
+    if pending:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            futures = {
+                pool.submit(
+                    _evaluate_fold, backend, configs[c], features, y, splits[f][0], splits[f][1]
+                ): (c, f, key)
+                for c, f, key in pending
+            }
+            for future in as_completed(futures):
+                c, f, key = futures[future]
+                scores[c, f] = future.result()
+                if cache is not None:
+                    cache.put(key, scores[c, f])
+
+    results = []
+    for c, params in enumerate(configs):
+        r2s = [scores[c, f]["r2"] for f in range(folds)]
+        cost = model_cost(backend, params)
+        results.append(
+            {
+                "params": params,
+                "mean_r2": float(np.mean(r2s)),
+                "std_r2": float(np.std(r2s)),
+                "mean_fit_s": float(np.mean([scores[c, f]["fit_s"] for f in range(folds)])),
+                "cost": cost,
+                "objective": objective(float(np.mean(r2s)), cost, latency_weight),
+            }
+        )
+    # Best objective first; cheaper configs win ties.
+    results.sort(key=lambda r: (-r["objective"], r["cost"]))
+    best = results[0]
+    logger.info(
+        "Best %s config %s: CV R²=%.4f, cost=%d, objective=%.4f (search took %.1fs).",
+        backend, best["params"], best["mean_r2"], best["cost"], best["objective"],
+        time.perf_counter() - start,
+    )
+    return {
+        "backend": backend,
+        "best_params": best["params"],
+        "best_cv_r2": best["mean_r2"],
+        "best_cost": best["cost"],
+        "best_objective": best["objective"],
+        "objective": "mean_cv_r2 - latency_weight * trees * max_depth / reference_cost",
+        "latency_weight": latency_weight,
+        "reference_cost": REFERENCE_COST,
+        "folds": folds,
+        "space": space,
+        "n_configs": len(configs),
+        "folds_fitted": len(pending),
+        "folds_cached": n_cached,
+        "results": results,
+    }
@@ -0,0 +1,6 @@
+"""Maintenance and verification tools for the backend.
+
+Run tools as modules from the backend directory, e.g.:
+
+    python -m scripts.verify_scaler_folding
+"""
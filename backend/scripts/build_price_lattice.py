@@ -0,0 +1,44 @@
+"""Builds the precomputed price lattice for the current model artifacts.
+
+Evaluates the model over the lattice configured in Settings (``LATTICE_*``
+environment variables), writes it next to the model artifacts, and reports
+build time, memory footprint and interpolation error against exact inference.
+
+Usage (from the backend directory):
+
+    python -m scripts.build_price_lattice
+"""
+
+import logging
+import warnings
+
+from app.core.config import get_settings
+from app.services.ml_service import ml_service
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """Builds, saves and summarises the price lattice."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # The scaler was fitted on a DataFrame; silence the per-call feature-name warning.
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+    settings = get_settings()
+    ml_service.load()
+    lattice = ml_service.build_lattice()
+    lattice.save(settings.lattice_path)
+
+    stats = lattice.stats()
+    logger.info("Lattice written to:   %s", settings.lattice_path)
+    logger.info("Shape:                %s (%d points)", stats.shape, stats.points)
+    logger.info("Memory footprint:     %.1f MB", stats.nbytes / 1e6)
+    logger.info("Build time:           %.2f s", stats.build_time_s)
+    logger.info("Mean abs error:       ₹%.0f", stats.mean_abs_error)
+    logger.info("P99 abs error:        ₹%.0f", stats.p99_abs_error)
+    logger.info("Max abs error:        ₹%.0f", stats.max_abs_error)
+    logger.info("Mean relative error:  %.2f%%", stats.mean_rel_error * 100)
+
+
+if __name__ == "__main__":
+    main()
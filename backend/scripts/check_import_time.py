@@ -0,0 +1,121 @@
+"""Regression check for the import cost of ``app.main``.
+
+Runs ``python -X importtime -c "import app.main"`` in fresh interpreters and
+fails if importing the app pulls in heavy numerical libraries (they belong to
+artifact loading, not to the server's import path) or if import time exceeds
+its budget. Uvicorn cannot bind the port until this import has finished.
+
+Usage (from the backend directory):
+
+    python -m scripts.check_import_time
+    python -m scripts.check_import_time --budget-ms 600 --top 15
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# Modules that must only be imported once artifacts are loaded.
+FORBIDDEN_MODULES = ("numpy", "pandas", "scipy", "sklearn", "joblib")
+# Budget for the cumulative import time of app.main, and for the share of it
+# spent in first-party ``app.*`` module bodies.
+DEFAULT_BUDGET_MS = 1000.0
+DEFAULT_FIRST_PARTY_BUDGET_MS = 100.0
+
+
+def measure(module: str = "app.main") -> dict[str, tuple[int, int]]:
+    """Imports ``module`` in a fresh interpreter under ``-X importtime``.
+
+    Args:
+        module: Dotted module name to import.
+
+    Returns:
+        Mapping of every imported module to (self, cumulative) microseconds.
+    """
+    env = {**os.environ, "PYTHONWARNINGS": "ignore"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def check(
+    module: str = "app.main",
+    budget_ms: float = DEFAULT_BUDGET_MS,
+    first_party_budget_ms: float = DEFAULT_FIRST_PARTY_BUDGET_MS,
+    repeat: int = 3,
+) -> tuple[list[str], dict[str, tuple[int, int]]]:
+    """Measures ``module`` and compares it against the import budgets.
+
+    The fastest of ``repeat`` runs is used, to filter out scheduler noise.
+
+    Args:
+        module: Dotted module name to import.
+        budget_ms: Maximum cumulative import time of ``module``.
+        first_party_budget_ms: Maximum total self time of ``app.*`` modules.
+        repeat: Number of fresh interpreters to measure.
+
+    Returns:
+        Tuple of (list of budget violations, timings of the fastest run).
+    """
+    runs = [measure(module) for _ in range(repeat)]
+    timings = min(runs, key=lambda t: t[module][1])
+
+    problems = []
+    for name in FORBIDDEN_MODULES:
+        if name in timings:
+            problems.append(f"{module} imports {name} ({timings[name][1] / 1e3:.1f} ms)")
+
+    total_ms = timings[module][1] / 1e3
+    if total_ms > budget_ms:
+        problems.append(f"{module} takes {total_ms:.1f} ms to import (budget {budget_ms:.0f} ms)")
+
+    first_party_ms = sum(s for name, (s, _) in timings.items() if name.split(".")[0] == "app") / 1e3
+    if first_party_ms > first_party_budget_ms:
+        problems.append(
+            f"app.* modules spend {first_party_ms:.1f} ms importing "
+            f"(budget {first_party_budget_ms:.0f} ms)"
+        )
+    return problems, timings
+
+
+def main() -> None:
+    """Parses CLI arguments, prints the slowest imports and exits non-zero on regression."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--first-party-budget-ms", type=float, default=DEFAULT_FIRST_PARTY_BUDGET_MS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    problems, timings = check(args.module, args.budget_ms, args.first_party_budget_ms, args.repeat)
+
+    print(f"{args.module}: {timings[args.module][1] / 1e3:.1f} ms cumulative")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    slowest = sorted(timings.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (self_us, cumulative_us) in slowest[: args.top]:
+        print(f"{cumulative_us / 1e3:>10.1f}ms {self_us / 1e3:>8.1f}ms  {name}")
+
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Verifies that the scaler-folded tree engine matches the scaled pipeline.
+
+Loads the artifacts from ``models/``, folds the StandardScaler into the tree
+thresholds, and compares ``engine.predict(X_raw)`` against
+``model.predict(scaler.transform(X_raw))`` on every row of the training CSV.
+
+Usage (from the backend directory):
+
+    python -m scripts.verify_scaler_folding
+    python -m scripts.verify_scaler_folding --csv ../navi_mumbai_real_estate_uncleaned_2500_cleaned.csv
+
+Exits with status 1 if any prediction deviates beyond the tolerance.
+"""
+
+import argparse
+import logging
+import pickle
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.services.tree_engine import CompiledEnsemble
+from train_model import FEATURES, find_csv, load_real_data
+
+logger = logging.getLogger(__name__)
+
+
+def verify(csv_path: Path, rtol: float) -> bool:
+    """Compares folded and scaled predictions over the whole CSV.
+
+    Args:
+        csv_path: Path to the training CSV.
+        rtol: Maximum allowed relative deviation per prediction.
+
+    Returns:
+        True if every row is within tolerance.
+    """
+    settings = get_settings()
+    with open(settings.model_path, "rb") as f:
+        model = pickle.load(f)
+    with open(settings.scaler_path, "rb") as f:
+        scaler = pickle.load(f)
+    with open(settings.label_encoder_path, "rb") as f:
+        label_encoder = pickle.load(f)
+
+    df = load_real_data(csv_path)
+    df = df[df["location"].str.lower().isin(label_encoder.classes_)]
+    X = df[FEATURES].copy()
+    X["location"] = label_encoder.transform(X["location"].str.lower())
+
+    expected = model.predict(scaler.transform(X))
+    folded = CompiledEnsemble.from_gradient_boosting(model, scaler=scaler)
+    actual = folded.predict(X.to_numpy(dtype=float))
+
+    abs_diff = np.abs(actual - expected)
+    rel_diff = abs_diff / np.maximum(np.abs(expected), 1.0)
+    mismatches = int((rel_diff > rtol).sum())
+
+    logger.info("Rows checked:          %d", len(df))
+    logger.info("Max abs deviation:     %.6g INR", abs_diff.max())
+    logger.info("Max rel deviation:     %.3g", rel_diff.max())
+    logger.info("Rows beyond rtol=%.0e: %d", rtol, mismatches)
+    return mismatches == 0
+
+
+def main() -> None:
+    """Parses CLI arguments and exits non-zero on mismatch."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", type=Path, default=None, help="Training CSV (default: auto-detect)")
+    parser.add_argument("--rtol", type=float, default=1e-9)
+    args = parser.parse_args()
+
+    csv_path = args.csv or find_csv()
+    if csv_path is None:
+        logger.error("Training CSV not found; pass --csv.")
+        sys.exit(2)
+
+    if verify(csv_path, args.rtol):
+        logger.info("✅ Folded thresholds match the scaled pipeline.")
+    else:
+        logger.error("❌ Folded thresholds diverge from the scaled pipeline.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
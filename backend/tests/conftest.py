@@ -1,6 +1,22 @@
 import pytest
 from httpx import ASGITransport, AsyncClient
 from app.main import app
+from app.schemas.prediction import NaviMumbaiLocation, PredictionRequest
+
+def pytest_addoption(parser):
+    parser.addoption("--perf", action="store_true", help="run wall-clock budget tests")
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "perf: wall-clock budget test, only run with --perf")
+
+def pytest_collection_modifyitems(config, items):
+    # Timing budgets are flaky on shared runners; they are opt-in.
+    if config.getoption("--perf"):
+        return
+    skip = pytest.mark.skip(reason="wall-clock budget; run with --perf")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip)
 
 @pytest.fixture(scope="session")
 def anyio_backend():
@@ -12,7 +28,40 @@ async def client():
     from app.services.ml_service import ml_service
     if not ml_service.is_loaded:
         ml_service.load()
-    
+
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
+
+@pytest.fixture
+def make_request():
+    """Builds a valid PredictionRequest; keyword arguments override its fields."""
+    def factory(**overrides):
+        fields = {
+            "location": NaviMumbaiLocation.KHARGHAR,
+            "area_sqft": 950,
+            "bhk": 2,
+            "bathrooms": 2,
+            "floor": 5,
+            "total_floors": 12,
+            "age_of_property": 3,
+            "parking": 1,
+            "lift": 1,
+        }
+        fields.update(overrides)
+        return PredictionRequest(**fields)
+
+    return factory
+
+@pytest.fixture
+def make_service():
+    """Builds and loads a private MLService with the given settings overrides."""
+    from app.services.ml_service import MLService
+
+    def factory(**settings_overrides):
+        service = MLService()
+        service._settings = service._settings.model_copy(update=settings_overrides)
+        service.load()
+        return service
+
+    return factory
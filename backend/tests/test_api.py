@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 @pytest.mark.anyio
@@ -46,3 +48,233 @@ async def test_get_model_info(client):
     assert data["model_name"] == "Gradient Boosting Regressor"
     assert "metrics" in data
     assert "feature_importance" in data
+
+@pytest.mark.anyio
+async def test_predict_price_batch(client):
+    item = {
+        "location": "Kharghar",
+        "area_sqft": 950,
+        "bhk": 2,
+        "bathrooms": 2,
+        "floor": 5,
+        "total_floors": 12,
+        "age_of_property": 3,
+        "parking": 1,
+        "lift": 1
+    }
+    payload = {"items": [item, {**item, "location": "Vashi", "area_sqft": 1200}]}
+    response = await client.post("/api/v1/predict/batch", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 2
+    assert data["succeeded"] == 2
+    assert data["failed"] == 0
+    assert [r["index"] for r in data["results"]] == [0, 1]
+
+    single = await client.post("/api/v1/predict", json=item)
+    assert data["results"][0]["prediction"] == single.json()
+
+@pytest.mark.anyio
+async def test_predict_price_batch_rejects_empty(client):
+    response = await client.post("/api/v1/predict/batch", json={"items": []})
+    assert response.status_code == 422
+
+@pytest.mark.anyio
+async def test_cache_stats(client):
+    response = await client.get("/api/v1/cache/stats")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["enabled"] is True
+    assert {"hits", "misses", "evictions", "size"} <= data.keys()
+
+@pytest.mark.anyio
+async def test_predict_returns_503_when_inference_queue_full(client, monkeypatch):
+    from app.services.inference_executor import ExecutorSaturatedError, inference_executor
+
+    async def saturated(location, values):
+        raise ExecutorSaturatedError("Inference queue is full.")
+
+    monkeypatch.setattr(inference_executor, "predict_values", saturated)
+    payload = {
+        "location": "Kharghar",
+        "area_sqft": 950,
+        "bhk": 2,
+        "bathrooms": 2,
+        "floor": 5,
+        "total_floors": 12,
+        "age_of_property": 3,
+        "parking": 1,
+        "lift": 1
+    }
+    response = await client.post("/api/v1/predict", json=payload)
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+@pytest.mark.anyio
+async def test_coalescer_stats_disabled_by_default(client):
+    response = await client.get("/api/v1/coalescer/stats")
+    assert response.status_code == 200
+    assert response.json()["enabled"] is False
+
+@pytest.mark.anyio
+async def test_explain_price(client):
+    payload = {
+        "location": "Kharghar",
+        "area_sqft": 950,
+        "bhk": 2,
+        "bathrooms": 2,
+        "floor": 5,
+        "total_floors": 12,
+        "age_of_property": 3,
+        "parking": 1,
+        "lift": 1
+    }
+    response = await client.post("/api/v1/predict/explain", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["contributions"]) == 9
+    total = sum(item["contribution"] for item in data["contributions"])
+    assert abs(data["base_price"] + total - data["predicted_price"]) < 1
+
+@pytest.mark.anyio
+async def test_sweep_price(client):
+    base = {
+        "location": "Kharghar",
+        "area_sqft": 950,
+        "bhk": 2,
+        "bathrooms": 2,
+        "floor": 5,
+        "total_floors": 12,
+        "age_of_property": 3,
+        "parking": 1,
+        "lift": 1
+    }
+    payload = {
+        "base": base,
+        "axes": [
+            {"feature": "location", "locations": ["Vashi", "Nerul"]},
+            {"feature": "floor", "start": 0, "stop": 20, "step": 5},
+        ],
+    }
+    response = await client.post("/api/v1/predict/sweep", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+    assert [axis["values"] for axis in data["axes"]] == [["Vashi", "Nerul"], [0, 5, 10, 15, 20]]
+    assert data["points"] == 10 and data["priced"] == 6
+    assert data["prices"][0][-1] is None and data["prices"][0][2] is not None
+
+    response = await client.post("/api/v1/predict/sweep?stream=true", json=payload)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[0]["points"] == 10
+    assert [line["prices"] for line in lines[1:-1]] == data["prices"]
+    assert lines[-1]["priced"] == 6
+
+@pytest.mark.anyio
+async def test_streamed_sweep_reports_failure_after_the_header(client, monkeypatch):
+    from app.api.routes import predict
+    from app.services.inference_executor import inference_executor
+
+    sweep = inference_executor.sweep
+    calls = []
+
+    async def failing_after_first_chunk(request):
+        calls.append(request)
+        if len(calls) > 1:
+            raise RuntimeError("worker died")
+        return await sweep(request)
+
+    monkeypatch.setattr(predict.settings, "sweep_stream_chunk_points", 5)
+    monkeypatch.setattr(inference_executor, "sweep", failing_after_first_chunk)
+    payload = {
+        "base": {
+            "location": "Kharghar",
+            "area_sqft": 950,
+            "bhk": 2,
+            "bathrooms": 2,
+            "floor": 5,
+            "total_floors": 12,
+            "age_of_property": 3,
+            "parking": 1,
+            "lift": 1,
+        },
+        "axes": [
+            {"feature": "location", "locations": ["Vashi", "Nerul"]},
+            {"feature": "floor", "start": 0, "stop": 20, "step": 5},
+        ],
+    }
+    response = await client.post("/api/v1/predict/sweep?stream=true", json=payload)
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(calls) == 2
+    assert [line["index"] for line in lines[1:-1]] == [0]
+    assert lines[-1] == {"error": "Sweep aborted: an error occurred."}
+
+@pytest.mark.anyio
+async def test_sweep_price_rejects_bad_axes(client):
+    base = {
+        "location": "Kharghar",
+        "area_sqft": 950,
+        "bhk": 2,
+        "bathrooms": 2,
+        "floor": 5,
+        "total_floors": 12,
+        "age_of_property": 3,
+        "parking": 1,
+        "lift": 1
+    }
+    too_big = {"base": base, "axes": [{"feature": "area_sqft", "start": 300, "stop": 10000, "step": 0.5}]}
+    response = await client.post("/api/v1/predict/sweep", json=too_big)
+    assert response.status_code == 400
+
+    out_of_bounds = {"base": base, "axes": [{"feature": "bhk", "values": [1, 2, 99]}]}
+    response = await client.post("/api/v1/predict/sweep", json=out_of_bounds)
+    assert response.status_code == 422
+
+@pytest.mark.anyio
+async def test_compare_locations(client):
+    payload = {
+        "location": "Kharghar",
+        "area_sqft": 950,
+        "bhk": 2,
+        "bathrooms": 2,
+        "floor": 5,
+        "total_floors": 12,
+        "age_of_property": 3,
+        "parking": 1,
+        "lift": 1
+    }
+    response = await client.post("/api/v1/locations/compare", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["sort_by"] == "price" and data["total"] == len(data["locations"]) > 1
+    prices = [item["predicted_price"] for item in data["locations"]]
+    assert prices == sorted(prices, reverse=True)
+    assert data["locations"][data["selected_rank"] - 1]["location"] == "Kharghar"
+
+    response = await client.post("/api/v1/locations/compare?sort_by=area", json=payload)
+    assert response.status_code == 422
+
+@pytest.mark.anyio
+async def test_compare_locations_rejects_unsupported_location(client, monkeypatch):
+    import numpy as np
+
+    from app.services.location_vocab import LocationVocabulary
+    from app.services.ml_service import ml_service
+
+    monkeypatch.setattr(ml_service.artifacts, "vocabulary", LocationVocabulary(np.array(["vashi"])))
+    payload = {
+        "location": "Kharghar",
+        "area_sqft": 950,
+        "bhk": 2,
+        "bathrooms": 2,
+        "floor": 5,
+        "total_floors": 12,
+        "age_of_property": 3,
+        "parking": 1,
+        "lift": 1
+    }
+    response = await client.post("/api/v1/locations/compare", json=payload)
+    assert response.status_code == 400
+    assert "not supported" in response.json()["detail"]
@@ -0,0 +1,32 @@
+import json
+
+import train_model
+from benchmarks.suite import compare, run
+
+
+def report(**values):
+    return {"results": {name: {"value": value, "unit": "ms"} for name, value in values.items()}}
+
+
+def test_compare_flags_only_slowdowns_beyond_the_threshold():
+    baseline = report(load=10.0, predict_batch_100=4.0, train_1000=2.0)
+    current = report(load=11.0, predict_batch_100=5.0, api_predict=3.0)
+    current["results"]["train_1000"] = {"value": 9.0, "unit": "s"}
+
+    rows = {row["case"]: row for row in compare(current, baseline, threshold=0.15)}
+    # api_predict has no baseline and train_1000 changed unit, so neither is compared.
+    assert set(rows) == {"load", "predict_batch_100"}
+    assert not rows["load"]["regression"] and rows["predict_batch_100"]["regression"]
+    assert rows["predict_batch_100"]["change"] == 0.25
+
+
+def test_suite_report_is_json_and_training_leaves_models_untouched():
+    model_mtime = train_model.MODEL_PATH.stat().st_mtime_ns
+    result = run(["predict_single", "load", "train"], [], [300], repeat=3, api_requests=0)
+
+    assert set(result["results"]) == {"predict_single", "load", "train_300"}
+    assert result["results"]["predict_single"]["unit"] == "us"
+    assert result["results"]["train_300"]["rows_per_s"] > 0
+    assert json.loads(json.dumps(result))["environment"]["sklearn"]
+    assert train_model.MODEL_PATH.stat().st_mtime_ns == model_mtime
+    assert train_model.MODEL_DIR.name == "models"
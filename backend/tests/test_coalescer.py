@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from app.services.coalescer import PredictionCoalescer
+from app.services.ml_service import ml_service
+
+# Ensure model is loaded for unit tests
+if not ml_service.is_loaded:
+    ml_service.load()
+
+
+class RecordingBatchPredictor:
+    def __init__(self):
+        self.batch_sizes = []
+
+    async def __call__(self, requests):
+        self.batch_sizes.append(len(requests))
+        return ml_service.predict_batch(requests)
+
+
+@pytest.mark.anyio
+async def test_concurrent_requests_are_coalesced(make_request):
+    predictor = RecordingBatchPredictor()
+    coalescer = PredictionCoalescer(predictor, window_ms=20, max_batch_size=64)
+    requests = [make_request(area_sqft=600 + 10 * i) for i in range(10)]
+
+    results = await asyncio.gather(*(coalescer.submit(r) for r in requests))
+
+    assert predictor.batch_sizes == [10]
+    assert results == [ml_service.predict(r) for r in requests]
+    stats = coalescer.stats()
+    assert stats.batches == 1
+    assert stats.requests == 10
+    assert stats.batch_size_histogram["<=16"] == 1
+
+
+@pytest.mark.anyio
+async def test_full_batch_is_flushed_immediately(make_request):
+    predictor = RecordingBatchPredictor()
+    coalescer = PredictionCoalescer(predictor, window_ms=10_000, max_batch_size=4)
+    requests = [make_request(area_sqft=700 + i) for i in range(8)]
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(coalescer.submit(r) for r in requests)), timeout=2
+    )
+
+    assert predictor.batch_sizes == [4, 4]
+    assert len(results) == 8
+
+
+@pytest.mark.anyio
+async def test_batch_failure_is_propagated_to_every_caller(make_request):
+    async def failing(requests):
+        raise RuntimeError("boom")
+
+    coalescer = PredictionCoalescer(failing, window_ms=1, max_batch_size=8)
+    requests = [make_request(area_sqft=800 + i) for i in range(3)]
+    results = await asyncio.gather(
+        *(coalescer.submit(r) for r in requests), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
@@ -0,0 +1,67 @@
+import math
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_ingest import ingest_csv, peak_rss_mb, read_cache
+from train_model import FEATURES, TARGET, generate_synthetic_data, load_real_data
+
+
+@pytest.fixture()
+def csv_path(tmp_path):
+    df = generate_synthetic_data(500)
+    df.loc[[3, 40, 410], "area_sqft"] = np.nan
+    df.loc[[7, 250], "area_sqft"] = -5.0
+    df.loc[[11], TARGET] = 0
+    # Raw headers as they appear in scraped dumps.
+    df.columns = [" " + c.replace("_", " ").title() for c in df.columns]
+    path = tmp_path / "listings.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_chunked_ingest_matches_whole_file_read(csv_path):
+    expected = load_real_data(csv_path)
+    df = load_real_data(csv_path, chunksize=64)
+
+    assert list(df.columns) == FEATURES + [TARGET]
+    assert len(df) == len(expected) == 494
+    assert isinstance(df["location"].dtype, pd.CategoricalDtype)
+    assert df["area_sqft"].dtype == np.float32
+    assert df["lift"].dtype == np.int8
+    assert df[TARGET].dtype == np.float64
+    assert (df["location"].astype(str).to_numpy() == expected["location"].to_numpy()).all()
+    np.testing.assert_allclose(
+        df.drop(columns="location").to_numpy(float),
+        expected.drop(columns="location").to_numpy(float),
+        rtol=1e-6,
+    )
+
+
+def test_cache_round_trip_and_invalidation(csv_path, tmp_path):
+    cache_dir = tmp_path / "cache"
+    df = ingest_csv(csv_path, FEATURES, TARGET, chunksize=100, cache_dir=cache_dir)
+
+    cached = read_cache(cache_dir, csv_path)
+    pd.testing.assert_frame_equal(cached, df)
+
+    with open(csv_path, "a") as f:
+        f.write("Airoli,900,2,2,3,10,5,1,1,9000000\n")
+    assert read_cache(cache_dir, csv_path) is None
+    assert len(ingest_csv(csv_path, FEATURES, TARGET, cache_dir=cache_dir)) == len(df) + 1
+
+
+def test_missing_columns_are_reported(tmp_path):
+    path = tmp_path / "bad.csv"
+    pd.DataFrame({"location": ["Airoli"], "area_sqft": [900]}).to_csv(path, index=False)
+    with pytest.raises(ValueError, match="missing required columns"):
+        load_real_data(path, chunksize=10)
+
+
+def test_peak_rss_is_nan_without_the_resource_module(monkeypatch):
+    assert peak_rss_mb() > 0
+    # Importing a None entry in sys.modules raises ImportError, as on Windows.
+    monkeypatch.setitem(sys.modules, "resource", None)
+    assert math.isnan(peak_rss_mb())
@@ -0,0 +1,129 @@
+import itertools
+import math
+
+import numpy as np
+import pytest
+from sklearn.ensemble import GradientBoostingRegressor
+
+from app.services.explainer import PathExplainer, gain_importance
+from app.services.ml_service import ml_service
+from app.services.model_bundle import load_bundle, write_bundle
+from app.services.tree_engine import CompiledEnsemble
+from app.schemas.prediction import PredictionRequest, NaviMumbaiLocation
+
+# Ensure model is loaded for unit tests
+if not ml_service.is_loaded:
+    ml_service.load()
+
+
+def expected_tree_output(tree, x, known):
+    """Path-dependent expectation of one sklearn tree given the features in ``known``."""
+    def walk(node):
+        if tree.children_left[node] < 0:
+            return tree.value[node].ravel()[0]
+        left, right = tree.children_left[node], tree.children_right[node]
+        if tree.feature[node] in known:
+            return walk(left if np.float32(x[tree.feature[node]]) <= tree.threshold[node] else right)
+        cover = tree.weighted_n_node_samples
+        return (cover[left] * walk(left) + cover[right] * walk(right)) / cover[node]
+    return walk(0)
+
+
+def brute_force_shapley(model, x):
+    n = model.n_features_in_
+
+    def value(known):
+        return sum(
+            model.learning_rate * expected_tree_output(est.tree_, x, known)
+            for est in model.estimators_[:, 0]
+        )
+
+    phi = np.zeros(n)
+    for i in range(n):
+        others = [j for j in range(n) if j != i]
+        for size in range(n):
+            weight = math.factorial(size) * math.factorial(n - size - 1) / math.factorial(n)
+            for known in itertools.combinations(others, size):
+                phi[i] += weight * (value(set(known) | {i}) - value(set(known)))
+    return phi
+
+
+@pytest.fixture(scope="module")
+def small_model():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 4))
+    y = 3 * X[:, 0] + X[:, 1] * X[:, 2] + rng.normal(size=300)
+    model = GradientBoostingRegressor(n_estimators=6, max_depth=3, subsample=0.8, random_state=0)
+    return model.fit(X, y), X
+
+
+def test_contributions_are_exact_shapley_values(small_model):
+    model, X = small_model
+    explainer = PathExplainer(CompiledEnsemble.from_gradient_boosting(model))
+
+    contributions = explainer.explain(X[:4])
+    expected = np.array([brute_force_shapley(model, x) for x in X[:4]])
+    np.testing.assert_allclose(contributions, expected, atol=1e-12)
+    np.testing.assert_allclose(
+        contributions.sum(axis=1) + explainer.expected_value, model.predict(X[:4]), atol=1e-12
+    )
+
+
+def test_gain_importance_matches_sklearn(small_model):
+    model, _ = small_model
+    engine = CompiledEnsemble.from_gradient_boosting(model)
+    np.testing.assert_allclose(gain_importance(engine), model.feature_importances_, atol=1e-12)
+
+
+def test_bundle_and_fused_engines_explain_identically(tmp_path):
+    artifacts = ml_service.artifacts
+    models = [artifacts.model] + artifacts.quantile_models
+    fused = CompiledEnsemble.fuse(
+        [CompiledEnsemble.from_gradient_boosting(m, scaler=artifacts.scaler) for m in models]
+    )
+    write_bundle(
+        tmp_path, artifacts.model, artifacts.scaler, artifacts.label_encoder, ["f"] * 9,
+        quantile_models=dict(zip(artifacts.quantiles, artifacts.quantile_models)),
+    )
+    bundle_engine = load_bundle(tmp_path).engine(fold_scaler=True)
+
+    rng = np.random.default_rng(5)
+    raw = np.column_stack([rng.integers(0, 21, 50), rng.uniform(300, 3000, (50, 8))])
+    explainer = PathExplainer(fused)
+    from_fused = explainer.explain(raw)
+    np.testing.assert_allclose(PathExplainer(bundle_engine).explain(raw), from_fused)
+    np.testing.assert_allclose(
+        from_fused.sum(axis=1) + explainer.expected_value, fused.predict(raw), rtol=1e-9
+    )
+
+
+def test_ml_service_explain_sums_to_prediction():
+    request = PredictionRequest(
+        location=NaviMumbaiLocation.VASHI,
+        area_sqft=1100,
+        bhk=2,
+        bathrooms=2,
+        floor=7,
+        total_floors=14,
+        age_of_property=4,
+        parking=1,
+        lift=1
+    )
+    explanation = ml_service.explain(request)
+
+    assert explanation.predicted_price == ml_service.predict(request).predicted_price
+    total = sum(item.contribution for item in explanation.contributions)
+    assert total == pytest.approx(explanation.predicted_price - explanation.base_price, abs=0.1)
+    magnitudes = [abs(item.contribution) for item in explanation.contributions]
+    assert magnitudes == sorted(magnitudes, reverse=True)
+    values = {item.name: item.value for item in explanation.contributions}
+    assert values["location"] == "Vashi" and values["area_sqft"] == 1100
+
+
+def test_model_info_importance_is_computed_from_the_trees():
+    info = ml_service.get_model_info()
+    importance = {item.name: item.importance for item in info.feature_importance}
+    expected = ml_service.artifacts.model.feature_importances_
+    assert sum(importance.values()) == pytest.approx(1.0, abs=1e-3)
+    assert importance["area_sqft"] == round(float(expected[1]), 4)
+    assert info.feature_importance[0].importance == max(importance.values())
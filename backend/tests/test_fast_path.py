@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from app.api import fast_path
+from app.api.routes import predict
+from app.schemas.prediction import PredictionRequest
+from app.services.prediction_cache import request_values
+
+BODY = {
+    "location": "Kharghar",
+    "area_sqft": 950,
+    "bhk": 2,
+    "bathrooms": 2,
+    "floor": 5,
+    "total_floors": 12,
+    "age_of_property": 3,
+    "parking": 1,
+    "lift": 1,
+}
+
+
+def test_decoder_matches_validation_and_declines_anything_else():
+    request = PredictionRequest(**BODY)
+    assert fast_path.decode_prediction(json.dumps(BODY).encode()) == (
+        "Kharghar",
+        request_values(request),
+    )
+
+    declined = [
+        {**BODY, "area_sqft": 299.9},
+        {**BODY, "bhk": 2.0},
+        {**BODY, "lift": True},
+        {**BODY, "bhk": "2"},
+        {**BODY, "location": "kharghar"},
+        {**BODY, "extra": 1},
+        {key: value for key, value in BODY.items() if key != "bhk"},
+        [BODY],
+    ]
+    for body in declined:
+        assert fast_path.decode_prediction(json.dumps(body).encode()) is None
+    assert fast_path.decode_prediction(b"{not json") is None
+
+
+def test_json_media_type_ignores_parameters_and_case():
+    for content_type in ("application/json", "application/json; charset=utf-8",
+                         "Application/JSON;charset=UTF-8"):
+        assert fast_path.is_json_content(content_type)
+    for content_type in (None, "", "text/plain", "application/jsonx", "application/x-json"):
+        assert not fast_path.is_json_content(content_type)
+
+
+@pytest.mark.anyio
+async def test_charset_parameter_takes_the_fast_path(client, monkeypatch):
+    decoded = []
+
+    def spy(body):
+        decoded.append(fast_path.decode_prediction(body))
+        return decoded[-1]
+
+    monkeypatch.setattr(predict, "decode_prediction", spy)
+    response = await client.post(
+        "/api/v1/predict",
+        content=json.dumps(BODY),
+        headers={"content-type": "application/json; charset=utf-8"},
+    )
+    assert response.status_code == 200
+    assert decoded == [("Kharghar", request_values(PredictionRequest(**BODY)))]
+
+
+@pytest.mark.anyio
+async def test_fast_and_standard_paths_answer_identically(client, monkeypatch):
+    bodies = [BODY, {**BODY, "area_sqft": 1234.5}, {**BODY, "area_sqft": 100}, {**BODY, "bhk": "2"}]
+
+    async def post_all():
+        responses = [await client.post("/api/v1/predict", json=body) for body in bodies]
+        return [(r.status_code, r.headers["content-type"], r.content) for r in responses]
+
+    decoded = []
+
+    def spy(body):
+        decoded.append(fast_path.decode_prediction(body))
+        return decoded[-1]
+
+    monkeypatch.setattr(predict, "decode_prediction", spy)
+    fast = await post_all()
+    assert [result is not None for result in decoded] == [True, True, False, False]
+    monkeypatch.setattr(predict.settings, "fast_path_enabled", False)
+    standard = await post_all()
+
+    assert fast == standard
+    assert [status for status, _, _ in fast] == [200, 200, 422, 200]
@@ -0,0 +1,115 @@
+import json
+import pickle
+
+import numpy as np
+import pytest
+import sklearn
+
+import train_model
+from incremental import train_incremental
+from train_model import generate_synthetic_data
+
+PARAMS = {"n_estimators": 40, "learning_rate": 0.1, "max_depth": 3}
+
+
+@pytest.fixture()
+def workspace(tmp_path, monkeypatch):
+    model_dir = tmp_path / "models"
+    model_dir.mkdir()
+    for name, filename in [
+        ("MODEL_PATH", "model.pkl"),
+        ("SCALER_PATH", "scaler.pkl"),
+        ("LABEL_ENCODER_PATH", "label_encoder.pkl"),
+        ("BUNDLE_DIR", "bundle"),
+        ("TRAINING_METADATA_PATH", "training_metadata.json"),
+        ("HOLDOUT_PATH", "holdout.npz"),
+        ("QUANTILE_MODELS_PATH", "quantiles.pkl"),
+        ("LOCATION_STATS_PATH", "location_stats.json"),
+    ]:
+        monkeypatch.setattr(train_model, name, model_dir / filename)
+    monkeypatch.setattr(train_model, "MODEL_DIR", model_dir)
+
+    csv_path = tmp_path / "listings.csv"
+    generate_synthetic_data(600).to_csv(csv_path, index=False)
+    ingest_options = {"csv_path": csv_path}
+    train_model.train_and_save("gbr", ingest_options=ingest_options, params=PARAMS)
+    return csv_path, ingest_options
+
+
+def append_listings(csv_path, n, seed, location=None):
+    df = generate_synthetic_data(n)
+    df = df.sample(frac=1, random_state=seed).reset_index(drop=True)
+    if location is not None:
+        df["location"] = location
+    df.to_csv(csv_path, mode="a", header=False, index=False)
+
+
+def load_model():
+    with open(train_model.MODEL_PATH, "rb") as f:
+        return pickle.load(f)
+
+
+def test_unchanged_csv_keeps_artifacts(workspace):
+    _, ingest_options = workspace
+    before = train_model.MODEL_PATH.read_bytes()
+    assert train_incremental(ingest_options) == "unchanged"
+    assert train_model.MODEL_PATH.read_bytes() == before
+
+
+def test_appended_listings_add_stages_and_track_drift(workspace):
+    csv_path, ingest_options = workspace
+    holdout_rows = len(np.load(train_model.HOLDOUT_PATH)["y"])
+    dataset_rows = train_model.load_training_metadata()["dataset_rows"]
+    append_listings(csv_path, 100, seed=1)
+
+    assert train_incremental(ingest_options, max_drift=1.0) == "incremental"
+
+    model = load_model()
+    metadata = train_model.load_training_metadata()
+    entry = metadata["history"][-1]
+    # 80 of the 100 new rows are fitted, 20 join the holdout.
+    assert entry["stages_added"] == int(np.ceil(40 * 80 / 480))
+    assert model.n_estimators_ == 40 + entry["stages_added"]
+    quantile_models = train_model.load_quantile_models()
+    assert [m.n_estimators_ for m in quantile_models.values()] == [100 + 17, 100 + 17]
+    assert 0 < entry["intervals"]["coverage"] <= 1
+    assert metadata["params"]["n_estimators"] == model.n_estimators_
+    assert entry["holdout_rows"] == holdout_rows + 20
+    assert len(np.load(train_model.HOLDOUT_PATH)["y"]) == holdout_rows + 20
+    assert entry["drift"] == pytest.approx(entry["holdout_r2"] - metadata["r2_score"])
+    assert metadata["data"]["bytes"] == csv_path.stat().st_size
+    assert metadata["dataset_rows"] == dataset_rows + 100
+    assert metadata["metrics"]["r2_score"] == pytest.approx(entry["holdout_r2"])
+
+    assert train_incremental(ingest_options) == "unchanged"
+
+
+def test_new_locality_or_rewrite_forces_full_refit(workspace):
+    csv_path, ingest_options = workspace
+    append_listings(csv_path, 20, seed=2, location="Dronagiri")
+    assert train_incremental(ingest_options) == "full"
+    assert load_model().n_estimators_ == 40
+    assert [h["mode"] for h in train_model.load_training_metadata()["history"]] == ["full"]
+
+    generate_synthetic_data(300).to_csv(csv_path, index=False)
+    assert train_incremental(ingest_options) == "full"
+
+
+def test_single_appended_listing_adds_stages(workspace):
+    csv_path, ingest_options = workspace
+    append_listings(csv_path, 1, seed=3)
+    assert train_incremental(ingest_options, max_drift=1.0) == "incremental"
+    assert load_model().n_estimators_ == 41 and load_model().subsample == 0.8
+
+    append_listings(csv_path, 1, seed=4)
+    assert train_incremental(ingest_options, max_drift=1.0) == "incremental"
+    assert load_model().n_estimators_ == 42
+
+
+def test_other_sklearn_version_forces_full_refit(workspace):
+    _, ingest_options = workspace
+    metadata = train_model.load_training_metadata()
+    train_model.TRAINING_METADATA_PATH.write_text(json.dumps({**metadata, "sklearn_version": "0.0"}))
+
+    assert train_incremental(ingest_options) == "full"
+    assert train_model.load_training_metadata()["sklearn_version"] == sklearn.__version__
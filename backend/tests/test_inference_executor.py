@@ -0,0 +1,136 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services.inference_executor import (
+    ExecutorSaturatedError,
+    InferenceExecutor,
+    _init_worker,
+)
+from app.services.ml_service import ml_service
+from app.schemas.prediction import NaviMumbaiLocation, PredictionRequest
+
+# Ensure model is loaded for unit tests
+if not ml_service.is_loaded:
+    ml_service.load()
+
+REQUEST = PredictionRequest(
+    location=NaviMumbaiLocation.AIROLI,
+    area_sqft=720,
+    bhk=1,
+    bathrooms=1,
+    floor=2,
+    total_floors=8,
+    age_of_property=6,
+    parking=0,
+    lift=1
+)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("mode", ["inline", "thread", "process"])
+async def test_executor_modes_match_direct_prediction(mode):
+    executor = InferenceExecutor(mode=mode, workers=1, max_queue=4)
+    executor.start()
+    try:
+        result = await executor.predict(REQUEST)
+        batch = await executor.predict_batch([REQUEST])
+    finally:
+        executor.shutdown()
+    expected = ml_service.predict(REQUEST)
+    assert result == expected
+    assert batch[0].prediction == expected
+
+
+@pytest.mark.anyio
+async def test_executor_rejects_when_queue_is_full():
+    executor = InferenceExecutor(mode="thread", workers=1, max_queue=1)
+    executor.start()
+    release = threading.Event()
+
+    def blocking():
+        release.wait(5)
+        return "done"
+
+    try:
+        running = [asyncio.ensure_future(executor._run(blocking, blocking)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        assert executor.in_flight == 2
+        with pytest.raises(ExecutorSaturatedError):
+            await executor._run(blocking, blocking)
+        assert executor.rejected == 1
+        release.set()
+        assert await asyncio.gather(*running) == ["done", "done"]
+        assert executor.in_flight == 0
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_restart_builds_new_workers_before_swapping():
+    executor = InferenceExecutor(mode="process", workers=1)
+    old_pool, new_pool = ThreadPoolExecutor(1), ThreadPoolExecutor(1)
+    executor._pool, executor._running = old_pool, True
+    serving_during_build = []
+
+    def create_pool():
+        serving_during_build.append(executor._pool)
+        return new_pool
+
+    executor._create_pool = create_pool
+    executor.restart_workers()
+    assert serving_during_build == [old_pool]
+    assert executor._pool is new_pool
+    assert old_pool._shutdown
+
+    # A shutdown while the replacement starts leaves the executor stopped.
+    replacement = ThreadPoolExecutor(1)
+
+    def create_pool_during_shutdown():
+        executor.shutdown()
+        return replacement
+
+    executor._create_pool = create_pool_during_shutdown
+    executor.restart_workers()
+    assert executor._pool is None
+    assert new_pool._shutdown and replacement._shutdown
+
+
+@pytest.mark.anyio
+async def test_workers_failing_to_start_fall_back_to_inline(monkeypatch):
+    executor = InferenceExecutor(mode="process", workers=1)
+    monkeypatch.setattr(ml_service, "_artifacts", None)
+    executor.start()
+    assert executor._pool is None
+    monkeypatch.undo()
+
+    assert await executor.predict(REQUEST) == ml_service.predict(REQUEST)
+    # The next reload starts the workers.
+    pool = ThreadPoolExecutor(1)
+    executor._create_pool = lambda: pool
+    executor.restart_workers()
+    assert executor._pool is pool
+    executor.shutdown()
+
+
+def test_failed_restart_keeps_the_old_workers():
+    executor = InferenceExecutor(mode="process", workers=1)
+    old_pool = ThreadPoolExecutor(1)
+    executor._pool, executor._running = old_pool, True
+
+    def broken_pool():
+        raise OSError("spawn failed")
+
+    executor._create_pool = broken_pool
+    with pytest.raises(RuntimeError, match="spawn failed"):
+        executor.restart_workers()
+    assert executor._pool is old_pool and not old_pool._shutdown
+    executor.shutdown()
+
+
+def test_worker_refuses_artifacts_other_than_the_validated_set():
+    _init_worker(ml_service.artifacts.fingerprint)
+    with pytest.raises(RuntimeError, match="expected 000000000000"):
+        _init_worker("0" * 64)
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from app.schemas.prediction import PredictionRequest
+from benchmarks.load_test import load_traffic, replay
+from benchmarks.traffic import build_traffic
+from train_model import generate_synthetic_data
+
+LISTINGS = generate_synthetic_data(300)
+
+
+def test_synthetic_traffic_follows_the_mix_and_listings():
+    mix = {"predict": 0.6, "batch": 0.2, "compare": 0.1, "invalid": 0.1}
+    records = build_traffic(LISTINGS, 400, mix, batch_size=5, seed=7)
+
+    assert records == build_traffic(LISTINGS, 400, mix, batch_size=5, seed=7)
+    counts = {}
+    for record in records:
+        counts[record["path"]] = counts.get(record["path"], 0) + 1
+    assert set(counts) == {"/api/v1/predict", "/api/v1/predict/batch", "/api/v1/locations/compare"}
+    assert 60 <= counts["/api/v1/predict/batch"] <= 100
+
+    batches = [r["body"]["items"] for r in records if r["path"] == "/api/v1/predict/batch"]
+    singles = [r["body"] for r in records if r["path"] != "/api/v1/predict/batch"]
+    invalid = [spec for spec in singles if spec["area_sqft"] < 300]
+    specs = [spec for spec in singles if spec["area_sqft"] >= 300]
+    specs += [item for items in batches for item in items]
+    assert 20 <= len(invalid) <= 60
+    for spec in specs:
+        PredictionRequest(**spec)
+    synthetic_locations = set(LISTINGS["location"].str.lower())
+    assert {spec["location"].lower() for spec in specs} <= synthetic_locations
+
+    with pytest.raises(ValueError, match="Unknown traffic kinds"):
+        build_traffic(LISTINGS, 10, {"upload": 1.0})
+
+
+def test_load_traffic_accepts_bare_bodies_and_rejects_other_records(tmp_path):
+    body = {"location": "Vashi", "area_sqft": 900}
+    path = tmp_path / "traffic.jsonl"
+    health = {"path": "/api/v1/health", "method": "get"}
+    path.write_text(json.dumps(body) + "\n\n" + json.dumps(health))
+    assert load_traffic(path) == [
+        {"method": "POST", "path": "/api/v1/predict", "body": body},
+        {"method": "GET", "path": "/api/v1/health", "body": None},
+    ]
+
+    path.write_text(json.dumps({"request_id": "user-001", "title": "Not traffic"}) + "\n")
+    with pytest.raises(ValueError, match=":1 is not a traffic record"):
+        load_traffic(path)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("rate", [None, 500.0])
+async def test_replay_reports_latency_and_error_rates(client, rate):
+    records = build_traffic(LISTINGS, 30, {"predict": 0.5, "invalid": 0.5}, seed=3)
+    report = await replay(client, records, n_requests=40, concurrency=4, rate=rate)
+
+    invalid = sum(1 for i in range(40) if records[i % 30]["body"]["area_sqft"] < 300)
+    assert report["requests"] == 40 and report["client_errors"] == invalid
+    assert report["statuses"] == {"200": 40 - invalid, "422": invalid}
+    assert report["error_rate"] == invalid / 40 and report["server_errors"] == report["failed"] == 0
+    assert 0 < report["p50_ms"] <= report["p95_ms"] <= report["p99_ms"]
+    assert report["paths"]["/api/v1/predict"]["requests"] == 40
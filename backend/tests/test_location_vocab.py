@@ -0,0 +1,39 @@
+import numpy as np
+
+from app.schemas.prediction import NaviMumbaiLocation
+from app.services.location_vocab import LocationVocabulary, normalize_location
+from app.services.ml_service import ml_service
+
+
+def test_vocabulary_resolves_enum_values_case_variants_and_aliases():
+    classes = np.array(["belapur", "cbd belapur", "kharghar", "kopar khairane", "panvel"])
+    vocabulary = LocationVocabulary(classes)
+
+    assert vocabulary.codes == {
+        "Belapur": 0, "CBD Belapur": 1, "Kharghar": 2, "Kopar Khairane": 3, "Panvel": 4
+    }
+    assert [vocabulary.code(name) for name in ("KHARGHAR", "panvel", " Panvel ")] == [2, 4, 4]
+    assert vocabulary.code("C.B.D. Belapur") == vocabulary.code("cbd") == 1
+    assert vocabulary.code("Belapur") == 0
+    assert vocabulary.code("Koparkhairane") == vocabulary.code("Kopar-Khairane") == 3
+    assert vocabulary.display_names == sorted(vocabulary.codes)
+
+    codes, errors = vocabulary.encode(["Panvel", "Vashi", "kharghar"])
+    assert codes.tolist() == [4, -1, 2]
+    assert list(errors) == [1] and errors[1].startswith("Location 'Vashi' is not supported")
+    assert normalize_location("  New-Panvel ") == "new panvel"
+
+
+def test_vocabulary_matches_the_label_encoder():
+    if not ml_service.is_loaded:
+        ml_service.load()
+    artifacts = ml_service.artifacts
+    vocabulary = artifacts.vocabulary
+
+    for location in NaviMumbaiLocation:
+        expected = artifacts.label_encoder.transform([location.value.lower()])[0]
+        assert vocabulary.code(location.value) == expected
+    labels = ml_service.get_known_locations()
+    assert ml_service.get_location_names() == sorted(
+        "CBD Belapur" if label == "cbd belapur" else label.title() for label in labels
+    )
@@ -0,0 +1,116 @@
+import pytest
+
+from app.core.metrics import (
+    OBSERVE_BUDGET_S,
+    VALIDATION_STAGE,
+    MetricsRegistry,
+    route_template,
+)
+from app.schemas.prediction import BatchPredictionRequest
+from app.services.ml_service import ml_service
+from benchmarks.common import best_of
+
+# Ensure model is loaded for unit tests
+if not ml_service.is_loaded:
+    ml_service.load()
+
+
+def test_histogram_and_counter_render_in_exposition_format():
+    registry = MetricsRegistry(enabled=True)
+    requests = registry.counter("requests_total", "Requests.", ("route",))
+    latency = registry.histogram("latency_seconds", "Latency.", ("stage",), buckets=(0.1, 1.0))
+    requests.labels('/a"b').inc()
+    requests.labels('/a"b').inc(2)
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.labels("predict").observe(value)
+    registry.callback("queued", "gauge", "Queued.", lambda: [({}, 7.0)])
+    registry.callback("absent", "gauge", "Not reported.", lambda: [])
+
+    lines = registry.render().splitlines()
+    assert lines[:3] == [
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        'requests_total{route="/a\\"b"} 3',
+    ]
+    assert lines[4:10] == [
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{stage="predict",le="0.1"} 2',
+        'latency_seconds_bucket{stage="predict",le="1"} 3',
+        'latency_seconds_bucket{stage="predict",le="+Inf"} 4',
+        'latency_seconds_sum{stage="predict"} 3.65',
+        'latency_seconds_count{stage="predict"} 4',
+    ]
+    assert lines[-1] == "queued 7" and not any("absent" in line for line in lines)
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry(enabled=False)
+    registry.counter("requests_total", "Requests.", ("route",)).labels("/a").inc()
+    registry.histogram("latency_seconds", "Latency.").labels().observe(0.1)
+    assert registry.render() == ""
+
+
+def test_observation_stays_within_budget():
+    child = MetricsRegistry(enabled=True).histogram("latency_seconds", "Latency.").labels()
+    assert best_of(lambda: child.observe(1e-4), 1000) < OBSERVE_BUDGET_S
+
+
+def test_route_template_restores_path_parameters():
+    scope = {"route": object(), "path": "/api/v1/jobs/42", "path_params": {"job_id": 42}}
+    assert route_template(scope) == "/api/v1/jobs/{job_id}"
+    assert route_template({"path": "/missing"}) == "unmatched"
+
+
+@pytest.mark.anyio
+async def test_metrics_endpoint_reports_requests_and_stages(client):
+    payload = {
+        "location": "Kharghar",
+        "area_sqft": 1234.5,
+        "bhk": 2,
+        "bathrooms": 2,
+        "floor": 4,
+        "total_floors": 12,
+        "age_of_property": 3,
+        "parking": 1,
+        "lift": 1
+    }
+    assert (await client.post("/api/v1/predict", json=payload)).status_code == 200
+    response = await client.post("/api/v1/predict", json={**payload, "bhk": 99})
+    assert response.status_code == 422
+
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert 'http_requests_total{method="POST",route="/api/v1/predict",status="200"}' in text
+    assert 'http_requests_total{method="POST",route="/api/v1/predict",status="422"}' in text
+    for stage in ("validation", "features", "predict", "response"):
+        assert f'predict_stage_duration_seconds_count{{stage="{stage}"}}' in text
+    assert f'predictions_total{{artifact_version="{ml_service.version}",cache="miss"}}' in text
+    assert f'model_info{{artifact_version="{ml_service.version}"}} 1' in text
+
+
+@pytest.mark.anyio
+async def test_validation_stage_counts_only_predict_requests(client):
+    def observations():
+        return sum(VALIDATION_STAGE._counts)
+
+    payload = {
+        "location": "Kharghar",
+        "area_sqft": 950,
+        "bhk": 2,
+        "bathrooms": 2,
+        "floor": 4,
+        "total_floors": 12,
+        "age_of_property": 3,
+        "parking": 1,
+        "lift": 1,
+    }
+    before = observations()
+    BatchPredictionRequest(items=[payload] * 50)
+    assert observations() == before
+
+    # One canonical body, one the decoder declines ("bhk" as a string).
+    for body in (payload, {**payload, "bhk": "2"}):
+        assert (await client.post("/api/v1/predict", json=body)).status_code == 200
+    assert observations() == before + 2
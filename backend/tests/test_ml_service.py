@@ -1,4 +1,8 @@
-from app.services.ml_service import ml_service
+import json
+
+import pytest
+
+from app.services.ml_service import ExplanationUnavailableError, ml_service
 from app.schemas.prediction import PredictionRequest, NaviMumbaiLocation
 
 # Ensure model is loaded for unit tests
@@ -27,8 +31,188 @@ def test_ml_service_predict():
     assert result.price_per_sqft > 0
 
 def test_ml_service_get_model_info():
+    metadata = json.loads(ml_service._settings.training_metadata_path.read_text())
     info = ml_service.get_model_info()
     assert info.model_name == "Gradient Boosting Regressor"
-    assert info.dataset_rows == 2450
+    assert info.model_version == metadata["trained_at"]
+    assert info.dataset_rows == metadata["dataset_rows"]
     assert len(info.features) == 9
-    assert info.metrics.r2_score == 0.8385
+    assert info.metrics.model_dump() == metadata["metrics"]
+
+def test_ml_service_predict_batch_matches_single():
+    requests = [
+        PredictionRequest(
+            location=location,
+            area_sqft=600 + 150 * i,
+            bhk=1 + i % 5,
+            bathrooms=1 + i % 3,
+            floor=i % 10,
+            total_floors=10,
+            age_of_property=i,
+            parking=i % 2,
+            lift=1
+        )
+        for i, location in enumerate(list(NaviMumbaiLocation)[:8])
+    ]
+    results = ml_service.predict_batch(requests)
+    assert len(results) == len(requests)
+    for request, item in zip(requests, results):
+        assert item.error is None
+        assert item.prediction == ml_service.predict(request)
+
+def test_ml_service_predict_batch_empty():
+    assert ml_service.predict_batch([]) == []
+
+def test_ml_service_reload_invalidates_cache():
+    request = PredictionRequest(
+        location=NaviMumbaiLocation.NERUL,
+        area_sqft=870,
+        bhk=2,
+        bathrooms=2,
+        floor=3,
+        total_floors=7,
+        age_of_property=8,
+        parking=0,
+        lift=1
+    )
+    first = ml_service.predict(request)
+    assert ml_service.predict(request) is first
+
+    invalidations = ml_service.get_cache_stats().invalidations
+    ml_service.load()
+    assert ml_service.get_cache_stats().invalidations == invalidations + 1
+    assert ml_service.predict(request) is not first
+
+
+def test_ml_service_serves_histogram_model_without_scaler(tmp_path, make_service):
+    import pickle
+
+    from train_model import build_model, encode_locations, load_training_data
+
+    X, y, label_encoder = encode_locations(load_training_data())
+    model = build_model("hist").fit(X.to_numpy(dtype=float), y)
+    (tmp_path / "model.pkl").write_bytes(pickle.dumps(model))
+    (tmp_path / "label_encoder.pkl").write_bytes(pickle.dumps(label_encoder))
+
+    service = make_service(
+        model_path=tmp_path / "model.pkl",
+        scaler_path=tmp_path / "missing-scaler.pkl",
+        label_encoder_path=tmp_path / "label_encoder.pkl",
+        quantile_models_path=tmp_path / "missing-quantiles.pkl",
+        inference_engine="compiled",
+    )
+    assert service.artifacts.scaler is None and service.artifacts.engine is None
+
+    request = PredictionRequest(
+        location=NaviMumbaiLocation.KHARGHAR,
+        area_sqft=950,
+        bhk=2,
+        bathrooms=2,
+        floor=5,
+        total_floors=12,
+        age_of_property=3,
+        parking=1,
+        lift=1
+    )
+    raw = service.artifacts.build_raw_vector(request)
+    assert service.predict(request).predicted_price == round(float(model.predict(raw)[0]), 2)
+    info = service.get_model_info()
+    assert info.model_name == "Histogram Gradient Boosting Regressor"
+    assert sum(item.importance for item in info.feature_importance) == pytest.approx(1.0, abs=1e-3)
+    with pytest.raises(ExplanationUnavailableError):
+        service.explain(request)
+
+def test_price_range_comes_from_quantile_models(make_service):
+    request = PredictionRequest(
+        location=NaviMumbaiLocation.NERUL,
+        area_sqft=1200,
+        bhk=3,
+        bathrooms=2,
+        floor=4,
+        total_floors=12,
+        age_of_property=8,
+        parking=1,
+        lift=1
+    )
+    artifacts = ml_service.artifacts
+    assert artifacts.quantiles == (0.1, 0.9)
+    features = artifacts.prepare_features(artifacts.build_raw_vector(request))
+    low, high = (float(m.predict(features)[0]) for m in artifacts.quantile_models)
+
+    result = ml_service.predict(request)
+    assert result.price_range_low == round(min(low, result.predicted_price), 2)
+    assert result.price_range_high == round(max(high, result.predicted_price), 2)
+    width = (result.price_range_high - result.price_range_low) / result.predicted_price
+    assert result.confidence_score == pytest.approx(1 / (1 + width), abs=1e-4)
+
+    service = make_service(prediction_intervals=False)
+    fixed = service.predict(request)
+    assert fixed.price_range_high == pytest.approx(fixed.predicted_price * 1.08, abs=0.01)
+    assert fixed.confidence_score == 0.84
+
+def test_ml_service_sweep_matches_single_predictions():
+    from app.schemas.prediction import SweepAxis, SweepRequest
+
+    base = PredictionRequest(
+        location=NaviMumbaiLocation.KHARGHAR,
+        area_sqft=1000,
+        bhk=2,
+        bathrooms=2,
+        floor=5,
+        total_floors=10,
+        age_of_property=5,
+        parking=1,
+        lift=1
+    )
+    curve = ml_service.sweep(
+        SweepRequest(base=base, axes=[SweepAxis(feature="area_sqft", start=600, stop=1400, step=200)])
+    )
+    assert curve.axes[0].values == [600, 800, 1000, 1200, 1400]
+    for area, price in zip(curve.axes[0].values, curve.prices):
+        expected = ml_service.predict(base.model_copy(update={"area_sqft": area}))
+        assert price == expected.predicted_price
+
+    grid = ml_service.sweep(
+        SweepRequest(
+            base=base,
+            axes=[
+                SweepAxis(feature="total_floors", values=[4, 8]),
+                SweepAxis(feature="floor", start=0, stop=8, step=2),
+            ],
+        )
+    )
+    assert len(grid.prices) == 2 and len(grid.prices[0]) == 5
+    assert grid.prices[0][3:] == [None, None] and None not in grid.prices[1]
+    assert grid.priced == 8 and grid.errors == ["Floor exceeds total floors at some points; they are left unpriced."]
+
+def test_ml_service_compare_locations_ranks_every_locality(tmp_path):
+    from app.services.location_index import LocationIndex
+
+    request = PredictionRequest(
+        location=NaviMumbaiLocation.VASHI,
+        area_sqft=1000,
+        bhk=2,
+        bathrooms=2,
+        floor=5,
+        total_floors=10,
+        age_of_property=5,
+        parking=1,
+        lift=1
+    )
+    comparison = ml_service.compare_locations(request, "price_per_sqft")
+    assert comparison.total == len(ml_service.get_known_locations())
+    assert [item.rank for item in comparison.locations] == list(range(1, comparison.total + 1))
+    per_sqft = [item.price_per_sqft for item in comparison.locations]
+    assert per_sqft == sorted(per_sqft, reverse=True)
+
+    vashi = comparison.locations[comparison.selected_rank - 1]
+    assert vashi.location == "Vashi"
+    assert vashi.predicted_price == ml_service.predict(request).predicted_price
+    assert vashi.market.listings > 0
+    assert vashi.vs_market_median == pytest.approx(
+        vashi.price_per_sqft / vashi.market.median_price_per_sqft - 1, abs=1e-4
+    )
+
+    classes = ml_service.artifacts.label_encoder.classes_
+    bare = LocationIndex.load(tmp_path / "missing.json", classes)
+    assert bare.names[1:3] == ["Belapur", "CBD Belapur"] and bare.market == [None] * len(classes)
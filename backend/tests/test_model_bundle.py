@@ -0,0 +1,92 @@
+import pickle
+from pathlib import Path
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from app.core.config import get_settings
+from app.services.model_bundle import load_bundle, write_bundle
+from app.schemas.prediction import NaviMumbaiLocation, PredictionRequest
+
+
+@pytest.fixture(scope="module")
+def bundle_dir(tmp_path_factory):
+    settings = get_settings()
+    artifacts = []
+    for path in (settings.model_path, settings.scaler_path, settings.label_encoder_path):
+        with open(path, "rb") as f:
+            artifacts.append(pickle.load(f))
+    path = tmp_path_factory.mktemp("bundle")
+    write_bundle(path, *artifacts, features=["f"] * 9, metadata={"note": "test"})
+    return path
+
+
+def sample_requests():
+    rng = np.random.default_rng(3)
+    locations = list(NaviMumbaiLocation)
+    requests = []
+    for _ in range(200):
+        total_floors = int(rng.integers(1, 40))
+        requests.append(
+            PredictionRequest(
+                location=locations[rng.integers(len(locations))],
+                area_sqft=float(rng.uniform(300, 4000)),
+                bhk=int(rng.integers(1, 6)),
+                bathrooms=int(rng.integers(1, 6)),
+                floor=int(rng.integers(0, total_floors + 1)),
+                total_floors=total_floors,
+                age_of_property=int(rng.integers(0, 30)),
+                parking=int(rng.integers(0, 2)),
+                lift=int(rng.integers(0, 2)),
+            )
+        )
+    return requests
+
+
+def test_bundle_is_memory_mapped(bundle_dir):
+    bundle = load_bundle(bundle_dir)
+    assert bundle.manifest["n_trees"] == 200
+    assert bundle.manifest["note"] == "test"
+    engine = bundle.engine(fold_scaler=True)
+    # Read-only views of the memory maps, not private copies.
+    for array in (engine.feature, engine.threshold, engine.left, engine.value, engine.roots):
+        assert not array.flags.writeable
+
+
+@pytest.mark.parametrize("fold_scaler", [True, False])
+def test_bundle_predictions_match_pickles(bundle_dir, fold_scaler, make_service):
+    reference = make_service(prediction_cache_size=0)
+    service = make_service(artifact_format="bundle", bundle_dir=bundle_dir, fold_scaler=fold_scaler)
+
+    requests = sample_requests()
+    expected = [item.prediction.predicted_price for item in reference.predict_batch(requests)]
+    actual = [item.prediction.predicted_price for item in service.predict_batch(requests)]
+    assert actual == expected
+
+
+def test_bundle_rejects_unknown_locations(bundle_dir, make_service):
+    service = make_service(artifact_format="bundle", bundle_dir=bundle_dir)
+    with pytest.raises(ValueError):
+        service.artifacts.label_encoder.transform(["atlantis"])
+    assert service.artifacts.label_encoder.transform(["vashi"])[0] == list(service.get_known_locations()).index("vashi")
+
+
+def test_bundle_loading_does_not_import_sklearn(bundle_dir):
+    code = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "from app.services.ml_service import MLService\n"
+        "service = MLService()\n"
+        "service._settings = service._settings.model_copy(\n"
+        f"    update={{'artifact_format': 'bundle', 'bundle_dir': Path({str(bundle_dir)!r})}}\n"
+        ")\n"
+        "service.load()\n"
+        "print('sklearn' in sys.modules)\n"
+    )
+    backend_dir = Path(__file__).resolve().parents[1]
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=backend_dir
+    )
+    assert result.stdout.strip() == "False"
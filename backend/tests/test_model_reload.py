@@ -0,0 +1,148 @@
+import pickle
+import shutil
+import threading
+import time
+
+import pytest
+
+from app.core.config import get_settings
+from app.services.ml_service import ModelValidationError, ReloadInProgressError
+from app.services.model_watcher import ModelWatcher
+from app.schemas.prediction import NaviMumbaiLocation, PredictionRequest
+
+REQUEST = PredictionRequest(
+    location=NaviMumbaiLocation.VASHI,
+    area_sqft=1100,
+    bhk=2,
+    bathrooms=2,
+    floor=4,
+    total_floors=14,
+    age_of_property=6,
+    parking=1,
+    lift=1,
+)
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    settings = get_settings()
+    for path in (settings.model_path, settings.scaler_path, settings.label_encoder_path):
+        shutil.copy(path, tmp_path / path.name)
+    return tmp_path
+
+
+@pytest.fixture
+def model_settings(model_dir):
+    return {
+        "model_dir": model_dir,
+        "model_path": model_dir / "model.pkl",
+        "scaler_path": model_dir / "scaler.pkl",
+        "label_encoder_path": model_dir / "label_encoder.pkl",
+    }
+
+
+def rewrite_model(model_dir):
+    """Re-pickles the same model with another protocol: new bytes, same predictions."""
+    path = model_dir / "model.pkl"
+    model = pickle.loads(path.read_bytes())
+    path.write_bytes(pickle.dumps(model, protocol=4))
+
+
+def test_reload_with_unchanged_artifacts_keeps_version(model_settings, make_service):
+    service = make_service(**model_settings)
+    version = service.version
+
+    result = service.reload()
+    assert result.status == "unchanged"
+    assert result.artifact_version == version
+    assert result.canary_rows > 0 and result.canary_r2 > 0.5
+
+
+def test_reload_swaps_validated_artifacts(model_dir, model_settings, make_service):
+    service = make_service(**model_settings)
+    old_artifacts = service.artifacts
+    before = service.predict(REQUEST)
+
+    rewrite_model(model_dir)
+    result = service.reload()
+
+    assert result.status == "reloaded"
+    assert result.previous_version == old_artifacts.version
+    assert service.version == result.artifact_version != old_artifacts.version
+    # The cache never serves responses computed by replaced artifacts.
+    after = service.predict(REQUEST)
+    assert after is not before
+    assert after.predicted_price == before.predicted_price
+    # Requests that captured the old artifacts can still finish on them.
+    assert old_artifacts.predict_raw(old_artifacts.build_raw_vector(REQUEST))[0] > 0
+
+
+def test_failing_reload_listener_is_reported_not_fatal(model_dir, model_settings, make_service):
+    service = make_service(**model_settings)
+
+    def restart_workers():
+        raise RuntimeError("Inference workers failed to restart")
+
+    service.on_reload(restart_workers)
+    rewrite_model(model_dir)
+    result = service.reload()
+
+    assert result.status == "reloaded"
+    assert service.version == result.artifact_version
+    assert result.warnings == ["Inference workers failed to restart"]
+
+
+def test_reload_rejects_artifacts_failing_canary(model_dir, model_settings, make_service):
+    service = make_service(**model_settings, canary_min_r2=1.01)
+    version = service.version
+
+    rewrite_model(model_dir)
+    with pytest.raises(ModelValidationError):
+        service.reload()
+    assert service.version == version
+
+
+def test_concurrent_reload_is_rejected(model_settings, make_service):
+    service = make_service(**model_settings)
+    service._reload_lock.acquire()
+    try:
+        with pytest.raises(ReloadInProgressError):
+            service.reload()
+    finally:
+        service._reload_lock.release()
+
+
+def test_watcher_triggers_once_files_are_stable(tmp_path):
+    path = tmp_path / "model.pkl"
+    path.write_bytes(b"v1")
+    changed = threading.Event()
+    watcher = ModelWatcher(lambda: [path], changed.set, interval_seconds=0.02)
+    watcher.start()
+    try:
+        time.sleep(0.05)
+        assert not changed.is_set()
+        path.write_bytes(b"version 2")
+        assert changed.wait(timeout=2)
+        assert watcher.reloads == 1
+    finally:
+        watcher.stop()
+
+
+@pytest.mark.anyio
+async def test_admin_reload_requires_token(client, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "admin_token", None)
+    assert (await client.post("/api/v1/admin/reload")).status_code == 404
+
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    response = await client.post("/api/v1/admin/reload", headers={"Authorization": "Bearer nope"})
+    assert response.status_code == 401
+
+    response = await client.post("/api/v1/admin/reload", headers={"Authorization": "Bearer secret"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] in ("reloaded", "unchanged")
+
+    health = (await client.get("/api/v1/health")).json()
+    info = (await client.get("/api/v1/model-info")).json()
+    assert health["artifact_version"] == info["artifact_version"] == data["artifact_version"]
@@ -0,0 +1,52 @@
+import pytest
+
+from model_search import expand_space, model_cost, run_search
+from train_model import encode_locations, generate_synthetic_data, prepare_features
+
+SPACE = {"n_estimators": [10, 40], "learning_rate": [0.1], "max_depth": [2]}
+
+
+@pytest.fixture(scope="module")
+def data():
+    X, y, _ = encode_locations(generate_synthetic_data(300))
+    features, _ = prepare_features("gbr", X)
+    return features, y.to_numpy(dtype=float)
+
+
+def test_expand_space_grid_and_sample():
+    space = {"a": [1, 2, 3], "b": [4, 5]}
+    assert len(expand_space(space)) == 6
+    sample = expand_space(space, n_samples=3)
+    assert len(sample) == 3
+    assert sample == expand_space(space, n_samples=3)
+    assert all(config in expand_space(space) for config in sample)
+
+
+def test_model_cost_is_trees_times_depth():
+    assert model_cost("gbr", {"n_estimators": 100, "max_depth": 3}) == 300
+    assert model_cost("hist", {"max_depth": 4}) == 200 * 4
+
+
+def test_repeated_search_reuses_cached_folds(data, tmp_path):
+    features, y = data
+    first = run_search("gbr", features, y, space=SPACE, folds=2, n_jobs=2, cache_dir=tmp_path)
+    assert (first["folds_fitted"], first["folds_cached"]) == (4, 0)
+
+    second = run_search("gbr", features, y, space=SPACE, folds=2, n_jobs=2, cache_dir=tmp_path)
+    assert (second["folds_fitted"], second["folds_cached"]) == (0, 4)
+    assert second["results"] == first["results"]
+    assert second["best_params"] == first["best_params"]
+
+
+def test_latency_weight_favours_cheaper_models(data, tmp_path):
+    features, y = data
+    accurate = run_search(
+        "gbr", features, y, space=SPACE, folds=2, n_jobs=1, latency_weight=0.0, cache_dir=tmp_path
+    )
+    assert accurate["best_params"]["n_estimators"] == 40
+
+    cheap = run_search(
+        "gbr", features, y, space=SPACE, folds=2, n_jobs=1, latency_weight=100.0, cache_dir=tmp_path
+    )
+    assert cheap["best_params"]["n_estimators"] == 10
+    assert cheap["folds_fitted"] == 0
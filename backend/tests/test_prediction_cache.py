@@ -0,0 +1,78 @@
+from app.services.prediction_cache import PredictionCache, make_cache_key
+from app.schemas.prediction import PredictionResponse
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_response(price):
+    return PredictionResponse(
+        predicted_price=price,
+        price_in_lakhs=price / 100_000,
+        price_range_low=price,
+        price_range_high=price,
+        price_per_sqft=price / 950,
+        confidence_score=0.84,
+        input_summary={},
+    )
+
+
+def test_cache_key_normalises_numeric_types(make_request):
+    assert make_cache_key(make_request(area_sqft=950)) == make_cache_key(make_request(area_sqft=950.0))
+    assert make_cache_key(make_request()) != make_cache_key(make_request(bhk=3))
+
+
+def test_cache_hit_and_miss_counters(make_request):
+    cache = PredictionCache(max_size=4, ttl_seconds=60)
+    key = make_cache_key(make_request())
+    assert cache.get(key) is None
+    cache.put(key, make_response(1.0))
+    assert cache.get(key).predicted_price == 1.0
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_cache_evicts_least_recently_used(make_request):
+    cache = PredictionCache(max_size=2, ttl_seconds=60)
+    keys = [make_cache_key(make_request(bhk=bhk)) for bhk in (1, 2, 3)]
+    cache.put(keys[0], make_response(1.0))
+    cache.put(keys[1], make_response(2.0))
+    cache.get(keys[0])
+    cache.put(keys[2], make_response(3.0))
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.stats().evictions == 1
+
+
+def test_cache_entries_expire_after_ttl(make_request):
+    clock = FakeClock()
+    cache = PredictionCache(max_size=2, ttl_seconds=10, clock=clock)
+    key = make_cache_key(make_request())
+    cache.put(key, make_response(1.0))
+    clock.now = 9.9
+    assert cache.get(key) is not None
+    clock.now = 10.0
+    assert cache.get(key) is None
+    assert cache.stats().expirations == 1
+
+
+def test_cache_clear_and_disabled(make_request):
+    cache = PredictionCache(max_size=2, ttl_seconds=60)
+    key = make_cache_key(make_request())
+    cache.put(key, make_response(1.0))
+    cache.clear()
+    assert cache.get(key) is None
+    assert cache.stats().invalidations == 1
+
+    disabled = PredictionCache(max_size=0, ttl_seconds=60)
+    disabled.put(key, make_response(1.0))
+    assert disabled.get(key) is None
+    assert disabled.stats().enabled is False
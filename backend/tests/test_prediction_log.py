@@ -0,0 +1,101 @@
+import asyncio
+import json
+import sqlite3
+
+import pytest
+
+from app.services.ml_service import ml_service
+from app.services.prediction_log import LOG_COLUMNS, JsonlSink, PredictionLog, SqliteSink
+
+# Ensure model is loaded for unit tests
+if not ml_service.is_loaded:
+    ml_service.load()
+
+
+class FailingSink:
+    name = "failing"
+
+    def write(self, rows):
+        raise OSError("disk full")
+
+    def close(self):
+        pass
+
+
+@pytest.mark.anyio
+async def test_predictions_are_flushed_to_jsonl_and_sqlite(tmp_path, make_request):
+    jsonl, sqlite = JsonlSink(tmp_path / "log.jsonl"), SqliteSink(tmp_path / "log.sqlite")
+    log = PredictionLog([jsonl, sqlite], flush_interval_s=0.01)
+    requests = [make_request(area_sqft=800 + i) for i in range(5)]
+    for request in requests[:3]:
+        log.record("predict", request, ml_service.predict(request), "abc123", 0.002)
+    log.record_many(
+        "predict/batch", [(r, ml_service.predict(r)) for r in requests[3:]], "abc123", 0.004
+    )
+
+    await asyncio.sleep(0.1)
+    assert log.stats().logged == 5 and log.stats().queued == 0
+    await log.close()
+
+    rows = [json.loads(line) for line in (tmp_path / "log.jsonl").read_text().splitlines()]
+    assert [row["area_sqft"] for row in rows] == [800, 801, 802, 803, 804]
+    assert rows[0]["predicted_price"] == ml_service.predict(requests[0]).predicted_price
+    assert rows[0]["latency_ms"] == 2.0 and rows[-1]["endpoint"] == "predict/batch"
+    assert list(rows[0]) == list(LOG_COLUMNS)
+
+    with sqlite3.connect(tmp_path / "log.sqlite") as conn:
+        query = "SELECT location, area_sqft, artifact_version FROM predictions"
+        stored = conn.execute(query).fetchall()
+    assert stored == [("Kharghar", 800 + i, "abc123") for i in range(5)]
+
+
+@pytest.mark.anyio
+async def test_full_buffer_drops_instead_of_blocking(tmp_path, make_request):
+    log = PredictionLog([JsonlSink(tmp_path / "log.jsonl")], max_queue=4, flush_interval_s=60)
+    request = make_request(area_sqft=900)
+    response = ml_service.predict(request)
+    for _ in range(3):
+        log.record("predict", request, response, None, 0.001)
+    log.record_many("predict/batch", [(request, response)] * 3, None, 0.001)
+
+    stats = log.stats()
+    assert stats.queued == 4 and stats.dropped == 2
+    await log.close()
+    assert log.stats().logged == 4
+    assert len((tmp_path / "log.jsonl").read_text().splitlines()) == 4
+
+
+@pytest.mark.anyio
+async def test_full_batch_wakes_the_flush_and_failing_sinks_are_counted(tmp_path, make_request):
+    log = PredictionLog(
+        [FailingSink(), JsonlSink(tmp_path / "log.jsonl")], flush_interval_s=60, flush_batch_size=2
+    )
+    request = make_request(area_sqft=1000)
+    response = ml_service.predict(request)
+    log.record_many("predict/batch", [(request, response)] * 2, None, 0.001)
+
+    await asyncio.sleep(0.1)
+    stats = log.stats()
+    assert stats.flushes == 1 and stats.failed == 2 and stats.logged == 0
+    # The healthy sink still received the batch.
+    assert len((tmp_path / "log.jsonl").read_text().splitlines()) == 2
+    await log.close()
+
+
+@pytest.mark.anyio
+async def test_predict_route_records_predictions(client, monkeypatch, tmp_path, make_request):
+    from app.services import prediction_log as prediction_log_module
+
+    log = PredictionLog([JsonlSink(tmp_path / "log.jsonl")], flush_interval_s=60)
+    monkeypatch.setattr(prediction_log_module, "prediction_log", log)
+    payload = make_request(area_sqft=1111).model_dump(mode="json")
+
+    assert (await client.post("/api/v1/predict", json=payload)).status_code == 200
+    response = await client.post("/api/v1/predict/batch", json={"items": [payload, payload]})
+    assert response.status_code == 200
+    await log.close()
+
+    rows = [json.loads(line) for line in (tmp_path / "log.jsonl").read_text().splitlines()]
+    assert [row["endpoint"] for row in rows] == ["predict", "predict/batch", "predict/batch"]
+    assert {row["artifact_version"] for row in rows} == {ml_service.version}
+    assert rows[0]["latency_ms"] > 0
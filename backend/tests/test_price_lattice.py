@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from app.services.price_lattice import PriceLattice
+
+SMALL_LATTICE = {
+    "lattice_enabled": True,
+    "lattice_area_min": 800.0,
+    "lattice_area_max": 1200.0,
+    "lattice_area_step": 100.0,
+    "lattice_floor_values": [5],
+    "lattice_total_floors_values": [12],
+    "lattice_age_values": [3],
+}
+
+
+@pytest.fixture
+def lattice_settings(tmp_path):
+    return {**SMALL_LATTICE, "lattice_path": tmp_path / "lattice.npy"}
+
+
+def test_lattice_is_built_saved_and_memory_mapped(tmp_path, lattice_settings, make_service):
+    service = make_service(**lattice_settings)
+    assert (tmp_path / "lattice.npy").exists()
+    assert isinstance(service.artifacts.lattice.values, np.memmap)
+
+    stats = service.get_lattice_stats()
+    assert stats.enabled is True
+    assert stats.shape == [21, 5, 5, 1, 1, 1, 2, 2, 5, 3]
+    assert stats.points == stats.nbytes // (4 * 3)
+
+
+def test_lattice_matches_exact_on_grid_points(lattice_settings, make_service, make_request):
+    service = make_service(**lattice_settings)
+    exact = make_service()
+
+    for area in (800, 900, 1200):
+        request = make_request(area_sqft=area)
+        assert service.predict(request).predicted_price == pytest.approx(
+            exact.predict(request).predicted_price, rel=1e-6
+        )
+
+
+def test_lattice_interpolates_along_area(lattice_settings, make_service, make_request):
+    service = make_service(**lattice_settings)
+    low = service.predict(make_request(area_sqft=900)).predicted_price
+    high = service.predict(make_request(area_sqft=1000)).predicted_price
+    mid = service.predict(make_request(area_sqft=950)).predicted_price
+    assert mid == pytest.approx((low + high) / 2, rel=1e-6)
+
+
+def test_lattice_exact_fallback_off_grid(lattice_settings, make_service, make_request):
+    service = make_service(**lattice_settings)
+    raw = service.artifacts.build_raw_vector(make_request(floor=6))[0]
+    assert service.artifacts.lattice.lookup(raw, exact_fallback=True) is None
+    assert service.artifacts.lattice.lookup(raw, exact_fallback=False) is not None
+
+    raw = service.artifacts.build_raw_vector(make_request(area_sqft=2000))[0]
+    assert service.artifacts.lattice.lookup(raw, exact_fallback=True) is None
+
+
+def test_stale_lattice_is_rebuilt(tmp_path, lattice_settings, make_service):
+    make_service(**lattice_settings)
+    service = make_service(**{**lattice_settings, "lattice_age_values": [3, 4]})
+    assert service.get_lattice_stats().shape[5] == 2
+
+    loaded = PriceLattice.load(tmp_path / "lattice.npy")
+    assert loaded.metadata["axes"]["age_of_property"] == [3.0, 4.0]
+
+
+def test_lattice_hits_serve_bounds_without_tree_traversal(
+    lattice_settings, make_service, make_request, monkeypatch
+):
+    service = make_service(**lattice_settings)
+    exact = make_service()
+    requests = [make_request(area_sqft=900), make_request(area_sqft=1000, bhk=3)]
+    expected = [exact.predict(request) for request in requests]
+
+    def no_trees(*args, **kwargs):
+        raise AssertionError("lattice hit ran the model")
+
+    artifacts = service.artifacts
+    for name in ("prepare_features", "infer", "infer_interval", "predict_raw",
+                 "predict_interval_raw"):
+        monkeypatch.setattr(artifacts, name, no_trees)
+
+    single = service.predict(requests[0])
+    batch = [item.prediction for item in service.predict_batch(requests)]
+    for got, want in zip([single, *batch], [expected[0], *expected]):
+        assert got.predicted_price == pytest.approx(want.predicted_price, rel=1e-6)
+        assert got.price_range_low == pytest.approx(want.price_range_low, rel=1e-6)
+        assert got.price_range_high == pytest.approx(want.price_range_high, rel=1e-6)
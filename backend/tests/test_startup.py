@@ -0,0 +1,65 @@
+import asyncio
+import math
+import threading
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+import app.main as main
+import app.services.ml_service as ml_service_module
+from app.services.ml_service import MLService
+from scripts.check_import_time import check
+
+PAYLOAD = {
+    "location": "Kharghar",
+    "area_sqft": 950,
+    "bhk": 2,
+    "bathrooms": 2,
+    "floor": 5,
+    "total_floors": 12,
+    "age_of_property": 3,
+    "parking": 1,
+    "lift": 1,
+}
+
+
+def test_app_import_pulls_in_no_numerical_libraries():
+    problems, _ = check(budget_ms=math.inf, first_party_budget_ms=math.inf, repeat=1)
+    assert problems == []
+
+
+@pytest.mark.perf
+def test_app_import_stays_within_budget():
+    problems, _ = check(repeat=2)
+    assert problems == []
+
+
+@pytest.mark.anyio
+async def test_background_startup_serves_degraded_until_loaded(monkeypatch):
+    service = MLService()
+    release = threading.Event()
+    load = service.load
+
+    def slow_load():
+        release.wait(timeout=10)
+        load()
+
+    monkeypatch.setattr(service, "load", slow_load)
+    monkeypatch.setattr(ml_service_module, "ml_service", service)
+    monkeypatch.setattr(main.settings, "startup_mode", "background")
+
+    transport = ASGITransport(app=main.app)
+    async with main.lifespan(main.app), AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/v1/health")
+        assert response.status_code == 200
+        assert response.json()["status"] == "degraded"
+        assert (await client.post("/api/v1/predict", json=PAYLOAD)).status_code == 503
+
+        release.set()
+        for _ in range(200):
+            if service.is_loaded:
+                break
+            await asyncio.sleep(0.05)
+
+        assert (await client.get("/api/v1/health")).json()["status"] == "healthy"
+        assert (await client.post("/api/v1/predict", json=PAYLOAD)).status_code == 200
@@ -0,0 +1,74 @@
+import pandas as pd
+import pytest
+
+from train_model import (
+    FEATURES,
+    RANDOM_STATE,
+    TARGET,
+    augment_missing_locations,
+    generate_synthetic_data,
+    load_training_data,
+    location_stats,
+)
+
+MISSING = {"ulwe", "taloja", "sector 19", "kopar khairane"}
+
+
+def test_augmentation_is_deterministic_under_random_state():
+    first = augment_missing_locations(MISSING, 50, seed=RANDOM_STATE)
+    # Same set, different iteration order.
+    second = augment_missing_locations(sorted(MISSING, reverse=True), 50, seed=RANDOM_STATE)
+    pd.testing.assert_frame_equal(first, second)
+
+    other = augment_missing_locations(MISSING, 50, seed=RANDOM_STATE + 1)
+    assert not first.equals(other)
+
+
+def test_augmentation_follows_the_synthetic_recipe():
+    df = augment_missing_locations(MISSING, 2000)
+
+    assert list(df.columns) == FEATURES + [TARGET]
+    assert df["location"].value_counts().to_dict() == {loc: 2000 for loc in MISSING}
+    assert df["bhk"].between(1, 5).all()
+    assert ((df["bathrooms"] - df["bhk"]).abs() <= 1).all() and df["bathrooms"].between(1, 5).all()
+    assert df["area_sqft"].between(300, 10000).all()
+    assert (df["floor"] <= df["total_floors"]).all() and df["total_floors"].between(2, 39).all()
+    assert (df.loc[df["total_floors"] > 4, "lift"] == 1).all()
+    assert df[TARGET].between(500_000, 50_000_000).all()
+    assert df["parking"].mean() == pytest.approx(0.75, abs=0.02)
+    # Pricier localities come out pricier per sq ft.
+    per_sqft = (df[TARGET] / df["area_sqft"]).groupby(df["location"]).median()
+    assert per_sqft["sector 19"] > per_sqft["ulwe"] > per_sqft["taloja"]
+
+
+def test_synthetic_fallback_is_deterministic():
+    pd.testing.assert_frame_equal(generate_synthetic_data(500), generate_synthetic_data(500))
+
+
+def test_location_stats_summarise_each_locality():
+    df = augment_missing_locations(MISSING, 200)
+    df.loc[0, "location"] = df.loc[0, "location"].title()
+    stats = location_stats(df)
+
+    assert stats["quantiles"] == [0.1, 0.25, 0.75, 0.9]
+    assert sorted(stats["locations"]) == sorted(MISSING)
+    ulwe = df[df["location"].str.lower() == "ulwe"]
+    per_sqft = ulwe[TARGET] / ulwe["area_sqft"]
+    entry = stats["locations"]["ulwe"]
+    assert entry["listings"] == len(ulwe)
+    assert entry["median_price"] == pytest.approx(ulwe[TARGET].median(), abs=0.01)
+    assert entry["median_price_per_sqft"] == pytest.approx(per_sqft.median(), abs=0.01)
+    assert entry["price_per_sqft_quantiles"] == sorted(entry["price_per_sqft_quantiles"])
+    assert entry["price_per_sqft_quantiles"][0] == pytest.approx(per_sqft.quantile(0.1), abs=0.01)
+
+
+def test_location_stats_cover_real_listings_only(tmp_path):
+    csv_path = tmp_path / "listings.csv"
+    real = generate_synthetic_data(300)
+    real[~real["location"].str.lower().isin(MISSING)].to_csv(csv_path, index=False)
+
+    df = load_training_data(csv_path)
+    real_rows = df.attrs["real_rows"]
+    assert 0 < real_rows < len(df)
+    stats = location_stats(df.iloc[:real_rows])
+    assert not set(stats["locations"]) & set(MISSING)
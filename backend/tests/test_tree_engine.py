@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from app.services.ml_service import ml_service
+from app.services.tree_engine import CompiledEnsemble
+from app.schemas.prediction import PredictionRequest, NaviMumbaiLocation
+
+# Ensure model is loaded for unit tests
+if not ml_service.is_loaded:
+    ml_service.load()
+
+def test_compiled_ensemble_matches_sklearn():
+    model = ml_service.artifacts.model
+    engine = CompiledEnsemble.from_gradient_boosting(model)
+    assert engine.n_trees == model.n_estimators_
+
+    X = np.random.default_rng(0).normal(size=(500, engine.n_features))
+    np.testing.assert_allclose(engine.predict(X), model.predict(X), rtol=1e-9)
+
+def test_compiled_ensemble_rejects_wrong_shape():
+    engine = CompiledEnsemble.from_gradient_boosting(ml_service.artifacts.model)
+    with pytest.raises(ValueError):
+        engine.predict(np.zeros((1, engine.n_features + 1)))
+
+def test_ml_service_compiled_engine_matches_sklearn(make_service):
+    service = make_service(inference_engine="compiled")
+
+    request = PredictionRequest(
+        location=NaviMumbaiLocation.VASHI,
+        area_sqft=1100,
+        bhk=2,
+        bathrooms=2,
+        floor=7,
+        total_floors=14,
+        age_of_property=4,
+        parking=1,
+        lift=1
+    )
+    expected = ml_service.predict(request)
+    result = service.predict(request)
+    assert result.predicted_price == pytest.approx(expected.predicted_price, rel=1e-9)
+
+def test_folded_ensemble_matches_scaled_pipeline():
+    model, scaler = ml_service.artifacts.model, ml_service.artifacts.scaler
+    engine = CompiledEnsemble.from_gradient_boosting(model, scaler=scaler)
+
+    rng = np.random.default_rng(1)
+    X_raw = np.column_stack([
+        rng.integers(0, 21, 500),
+        rng.uniform(300, 3000, 500),
+        rng.integers(1, 6, (500, 2)),
+        rng.integers(0, 30, (500, 2)),
+        rng.integers(0, 50, 500),
+        rng.integers(0, 2, (500, 2)),
+    ]).astype(float)
+    # Include rows lying exactly on the folded cut points.
+    cut_rows = np.repeat(X_raw[:1], 50, axis=0)
+    internal = np.flatnonzero(np.isfinite(engine.threshold))[:50]
+    cut_rows[np.arange(50), engine.feature[internal]] = engine.threshold[internal]
+    X_raw = np.vstack([X_raw, cut_rows])
+
+    expected = model.predict(scaler.transform(X_raw))
+    np.testing.assert_allclose(engine.predict(X_raw), expected, rtol=1e-9)
+
+def test_fused_ensemble_matches_separate_models():
+    artifacts = ml_service.artifacts
+    models = [artifacts.model] + artifacts.quantile_models
+    parts = [CompiledEnsemble.from_gradient_boosting(m, scaler=artifacts.scaler) for m in models]
+    fused = CompiledEnsemble.fuse(parts)
+    assert fused.n_outputs == 3
+    assert fused.n_trees == sum(p.n_trees for p in parts)
+
+    X_raw = np.column_stack([
+        np.arange(40) % 21,
+        np.linspace(300, 3000, 40),
+        np.ones((40, 7)),
+    ])
+    expected = np.column_stack([m.predict(artifacts.scaler.transform(X_raw)) for m in models])
+    np.testing.assert_allclose(fused.predict_outputs(X_raw), expected, rtol=1e-9)
+    np.testing.assert_allclose(fused.predict_outputs(X_raw, 1, 3), expected[:, 1:], rtol=1e-9)
+    np.testing.assert_allclose(fused.predict(X_raw), expected[:, 0], rtol=1e-9)
@@ -5,6 +5,35 @@ Regressor, and saves production-ready artifacts:
   - models/model.pkl           — trained GBR model
   - models/scaler.pkl          — StandardScaler for all features
   - models/label_encoder.pkl   — LabelEncoder for the location column
+  - models/quantiles.pkl       — 10th/90th percentile models for price ranges
+  - models/bundle/             — the same artifacts as memory-mappable .npy
+                                 arrays plus manifest.json (ARTIFACT_FORMAT=bundle)
+
+To (re)export the bundle from existing pickles without retraining:
+
+    python train_model.py --export-bundle
+
+To train the histogram-based backend (native categorical ``location``,
+multi-core OpenMP fitting, no scaler) or compare both backends side by side:
+
+    python train_model.py --backend hist
+    python train_model.py --compare
+
+To pick hyperparameters by parallel k-fold cross-validation first (fold
+results are cached under models/.search_cache/, see model_search.py):
+
+    python train_model.py --search
+    python train_model.py --search --search-space space.json --search-samples 12 --jobs 8
+
+Large listing dumps are streamed in chunks with compact dtypes, optionally
+caching the cleaned rows as .npy columns for later runs (see data_ingest.py):
+
+    python train_model.py --csv listings.csv --chunksize 500000 --data-cache models/.data_cache
+
+To add boosting stages from listings appended to the CSV since the last run
+instead of refitting from scratch (see incremental.py):
+
+    python train_model.py --incremental
 
 Run this before starting the FastAPI server (or via render.yaml build command):
 
@@ -17,16 +46,28 @@ Render cloud deployments without needing to commit the dataset.
 Google Python Style Guide compliant.
 """
 
+import argparse
+import hashlib
+import json
 import logging
+import os
 import pickle
+import shutil
+import time
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterable, Sequence
 
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import GradientBoostingRegressor
+import sklearn
+from sklearn.ensemble import GradientBoostingRegressor, HistGradientBoostingRegressor
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder, StandardScaler
 
+from app.services.model_bundle import MANIFEST_NAME, write_bundle
+from data_ingest import CHUNKED_INGEST_MIN_BYTES, DEFAULT_CHUNKSIZE, ingest_csv
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s | %(levelname)-8s | %(message)s",
@@ -42,6 +83,13 @@ MODEL_DIR = BASE_DIR / "models"
 MODEL_PATH = MODEL_DIR / "model.pkl"
 SCALER_PATH = MODEL_DIR / "scaler.pkl"
 LABEL_ENCODER_PATH = MODEL_DIR / "label_encoder.pkl"
+BUNDLE_DIR = MODEL_DIR / "bundle"
+SEARCH_CACHE_DIR = MODEL_DIR / ".search_cache"
+TRAINING_METADATA_PATH = MODEL_DIR / "training_metadata.json"
+HOLDOUT_PATH = MODEL_DIR / "holdout.npz"
+QUANTILE_MODELS_PATH = MODEL_DIR / "quantiles.pkl"
+LOCATION_STATS_PATH = MODEL_DIR / "location_stats.json"
+MODEL_METADATA_FILENAME = "model.pkl.json"
 CSV_FILENAME = "navi_mumbai_real_estate_uncleaned_2500_cleaned.csv"
 
 FEATURES = [
@@ -57,6 +105,27 @@ FEATURES = [
 ]
 TARGET = "actual_price"
 
+# "gbr": GradientBoostingRegressor on standardized features (default)
+# "hist": HistGradientBoostingRegressor, native categorical location, no scaler
+TRAINING_BACKENDS = ("gbr", "hist")
+DEFAULT_PARAMS = {
+    "gbr": {"n_estimators": 200, "learning_rate": 0.05, "max_depth": 5},
+    "hist": {"max_iter": 200, "learning_rate": 0.05, "max_depth": 5},
+}
+
+# Lower/upper quantiles served as the price range (an 80% interval). The
+# quantile models are smaller than the point model: on the real dataset 100
+# depth-4 trees reach 79% held-out coverage, while 200 depth-5 trees are
+# overconfident (75%).
+QUANTILES = (0.1, 0.9)
+QUANTILE_PARAMS = {
+    "gbr": {"n_estimators": 100, "learning_rate": 0.05, "max_depth": 4},
+    "hist": {"max_iter": 100, "learning_rate": 0.05, "max_depth": 4},
+}
+
+# Price-per-sqft quantiles recorded per locality in location_stats.json
+LOCATION_STATS_QUANTILES = (0.1, 0.25, 0.75, 0.9)
+
 # ── Locations for synthetic fallback ──────────────────────────────────────────
 
 LOCATIONS = [
@@ -74,6 +143,11 @@ LOCATION_BASE_PRICE = {
     "Taloja": 7000, "Roadpali": 7200, "Mansarovar": 7800, "Sector 19": 13000,
     "Ulwe": 8200, "Dronagiri": 6500,
 }
+_BASE_PRICE_BY_NAME = {name.lower(): price for name, price in LOCATION_BASE_PRICE.items()}
+DEFAULT_BASE_PRICE = 10000
+
+# Synthetic rows generated per locality missing from the CSV
+AUGMENT_SAMPLES_PER_LOCATION = 100
 
 
 def find_csv() -> Path | None:
@@ -94,11 +168,20 @@ def find_csv() -> Path | None:
     return None
 
 
-def load_real_data(csv_path: Path) -> pd.DataFrame:
+def load_real_data(
+    csv_path: Path, chunksize: int | None = None, cache_dir: Path | None = None
+) -> pd.DataFrame:
     """Loads and validates the real estate CSV dataset.
 
+    Large files (at least ``CHUNKED_INGEST_MIN_BYTES``), or any file when
+    ``chunksize`` or ``cache_dir`` is given, are streamed in chunks with
+    compact dtypes by ``data_ingest.ingest_csv``.
+
     Args:
         csv_path: Path to the cleaned CSV file.
+        chunksize: Rows parsed per chunk when streaming.
+        cache_dir: Columnar .npy cache of the cleaned rows, reused while the
+            CSV is unchanged.
 
     Returns:
         DataFrame with required columns present.
@@ -106,9 +189,28 @@ def load_real_data(csv_path: Path) -> pd.DataFrame:
     Raises:
         ValueError: If required columns are missing.
     """
+    if chunksize or cache_dir or csv_path.stat().st_size >= CHUNKED_INGEST_MIN_BYTES:
+        return ingest_csv(csv_path, FEATURES, TARGET, chunksize or DEFAULT_CHUNKSIZE, cache_dir)
+
     df = pd.read_csv(csv_path)
     logger.info("Loaded CSV: %d rows, %d columns", len(df), len(df.columns))
+    df = clean_listings(df)
+    logger.info("After cleanup: %d rows", len(df))
+    return df
+
+
+def clean_listings(df: pd.DataFrame) -> pd.DataFrame:
+    """Normalises column names and drops incomplete or invalid listings.
+
+    Args:
+        df: Listings as read from the CSV.
 
+    Returns:
+        DataFrame with FEATURES and TARGET columns only.
+
+    Raises:
+        ValueError: If required columns are missing.
+    """
     # Normalise column names
     df.columns = [c.strip().lower().replace(" ", "_") for c in df.columns]
 
@@ -126,33 +228,64 @@ def load_real_data(csv_path: Path) -> pd.DataFrame:
     
     if filtered_rows > 0:
         logger.warning("Filtered out %d rows with negative/zero area or price", filtered_rows)
-        
-    logger.info("After cleanup: %d rows", len(df))
     return df
 
 
-def generate_synthetic_data(n_samples: int = 2500) -> pd.DataFrame:
-    """Generates realistic synthetic Navi Mumbai data as a fallback.
+def csv_stamp(csv_path: Path) -> dict:
+    """Identifies the CSV content a model was trained on.
+
+    Incremental training treats rows after ``bytes`` as new listings, as long
+    as the first ``bytes`` bytes still hash to ``sha256``.
 
     Args:
-        n_samples: Number of synthetic property records.
+        csv_path: Training CSV.
 
     Returns:
-        DataFrame matching the real dataset schema.
+        Dict with the file's ``bytes``, ``sha256`` and whether it ends with a
+        newline.
     """
-    logger.warning("CSV not found — generating %d synthetic samples as fallback.", n_samples)
-    rng = np.random.default_rng(RANDOM_STATE)
+    digest = hashlib.sha256()
+    size = 0
+    last = b""
+    with open(csv_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+            size += len(block)
+            last = block[-1:]
+    return {"bytes": size, "sha256": digest.hexdigest(), "ends_with_newline": last in (b"\n", b"\r")}
+
+
+def synthesize_listings(
+    locations: Sequence[str], location_idx: np.ndarray, rng: np.random.Generator
+) -> pd.DataFrame:
+    """Generates synthetic listings in one vectorized pass.
+
+    Prices follow the per-locality base rate per sq ft plus fixed premiums for
+    BHK, bathrooms, floor position, parking and lift, minus depreciation by
+    age, with Gaussian noise, clipped to ₹5 L – ₹5 Cr.
+
+    Args:
+        locations: Locality names.
+        location_idx: Index into ``locations`` for every row to generate.
+        rng: Random generator; all draws are taken from it in a fixed order.
 
-    locations = rng.choice(LOCATIONS, size=n_samples)
+    Returns:
+        DataFrame matching the real dataset schema, one row per entry of
+        ``location_idx``.
+    """
+    n_samples = len(location_idx)
     bhk = rng.choice([1, 2, 3, 4, 5], size=n_samples, p=[0.10, 0.40, 0.35, 0.12, 0.03])
     bathrooms = np.clip(bhk + rng.integers(-1, 2, size=n_samples), 1, 5)
     area_sqft = (bhk * rng.uniform(300, 500, n_samples) + rng.uniform(-100, 200, n_samples)).clip(300, 10000)
     total_floors = rng.integers(2, 40, size=n_samples)
-    floor = np.array([rng.integers(0, tf + 1) for tf in total_floors])
+    floor = rng.integers(0, total_floors + 1)
     age = rng.integers(0, 30, size=n_samples)
     parking = rng.choice([0, 1], size=n_samples, p=[0.25, 0.75])
     lift = np.where(total_floors > 4, 1, rng.choice([0, 1], size=n_samples, p=[0.4, 0.6]))
-    base = np.array([LOCATION_BASE_PRICE[loc] for loc in locations])
+    base_prices = np.array(
+        [_BASE_PRICE_BY_NAME.get(loc.lower(), DEFAULT_BASE_PRICE) for loc in locations], dtype=float
+    )
+    base = base_prices[location_idx]
     prices = (
         base * area_sqft + bhk * 50_000 + bathrooms * 30_000
         + (floor / np.maximum(total_floors, 1)) * 200_000
@@ -161,82 +294,339 @@ def generate_synthetic_data(n_samples: int = 2500) -> pd.DataFrame:
     ).clip(500_000, 50_000_000)
 
     return pd.DataFrame({
-        "location": locations, "area_sqft": area_sqft.round(1), "bhk": bhk,
-        "bathrooms": bathrooms, "floor": floor, "total_floors": total_floors,
+        "location": np.asarray(locations, dtype=object)[location_idx], "area_sqft": area_sqft.round(1),
+        "bhk": bhk, "bathrooms": bathrooms, "floor": floor, "total_floors": total_floors,
         "age_of_property": age, "parking": parking, "lift": lift,
         TARGET: prices.round(0).astype(int),
     })
 
 
-def train_and_save() -> None:
-    """Orchestrates end-to-end model training and artifact persistence.
+def generate_synthetic_data(n_samples: int = 2500) -> pd.DataFrame:
+    """Generates realistic synthetic Navi Mumbai data as a fallback.
 
-    Steps:
-        1. Load real CSV or fall back to synthetic data.
-        2. Label-encode the location column.
-        3. Scale all features with StandardScaler.
-        4. Train GradientBoostingRegressor.
-        5. Evaluate on held-out test set and log metrics.
-        6. Save model.pkl, scaler.pkl, label_encoder.pkl.
+    Args:
+        n_samples: Number of synthetic property records.
+
+    Returns:
+        DataFrame matching the real dataset schema.
     """
-    MODEL_DIR.mkdir(parents=True, exist_ok=True)
+    logger.warning("CSV not found — generating %d synthetic samples as fallback.", n_samples)
+    rng = np.random.default_rng(RANDOM_STATE)
+    location_idx = rng.choice(len(LOCATIONS), size=n_samples)
+    return synthesize_listings(LOCATIONS, location_idx, rng)
 
-    # Step 1 — Load data
-    csv_path = find_csv()
-    df_real = load_real_data(csv_path) if csv_path else None
-    
-    if df_real is not None:
-        # Detect missing locations
-        present_locs = set(df_real["location"].str.lower().unique())
-        required_locs = set(l.lower() for l in LOCATIONS)
-        missing_locs = required_locs - present_locs
-        
-        if missing_locs:
-            logger.info("Localities missing from CSV: %s", missing_locs)
-            logger.info("Augmenting with synthetic data for missing regions...")
-            
-            # Generate extra data for missing regions
-            n_augment = 100 # Samples per missing location
-            augmented_records = []
-            rng = np.random.default_rng(RANDOM_STATE)
-            
-            for loc in missing_locs:
-                # Use same logic as generate_synthetic_data but for specific loc
-                for _ in range(n_augment):
-                    bhk = int(rng.choice([1, 2, 3, 4, 5], p=[0.10, 0.40, 0.35, 0.12, 0.03]))
-                    bathrooms = max(1, min(5, bhk + rng.integers(-1, 2)))
-                    area_sqft = max(300, min(10000, bhk * rng.uniform(300, 500) + rng.uniform(-100, 200)))
-                    total_floors = int(rng.integers(2, 40))
-                    floor = int(rng.integers(0, total_floors + 1))
-                    age = int(rng.integers(0, 30))
-                    parking = int(rng.choice([0, 1], p=[0.25, 0.75]))
-                    lift = 1 if total_floors > 4 else int(rng.choice([0, 1], p=[0.4, 0.6]))
-                    base = LOCATION_BASE_PRICE.get(loc.title(), LOCATION_BASE_PRICE.get(loc.lower(), 10000))
-                    
-                    price = (
-                        base * area_sqft + bhk * 50_000 + bathrooms * 30_000
-                        + (floor / max(total_floors, 1)) * 200_000
-                        - age * 15_000 + parking * 80_000 + lift * 50_000
-                        + rng.normal(0, 200_000)
-                    )
-                    price = max(500_000, min(50_000_000, price))
-                    
-                    augmented_records.append({
-                        "location": loc, "area_sqft": round(area_sqft, 1), "bhk": bhk,
-                        "bathrooms": bathrooms, "floor": floor, "total_floors": total_floors,
-                        "age_of_property": age, "parking": parking, "lift": lift,
-                        TARGET: int(round(price, 0))
-                    })
-            
-            df_augment = pd.DataFrame(augmented_records)
-            df = pd.concat([df_real, df_augment], ignore_index=True)
-            logger.info("Hybrid dataset ready: %d real, %d synthetic rows", len(df_real), len(df_augment))
-        else:
-            df = df_real
-            logger.info("All regions present in CSV. No augmentation needed.")
-    else:
+
+def augment_missing_locations(
+    missing_locations: Iterable[str],
+    n_per_location: int = AUGMENT_SAMPLES_PER_LOCATION,
+    seed: int = RANDOM_STATE,
+) -> pd.DataFrame:
+    """Generates synthetic listings for localities absent from the CSV.
+
+    Localities are sorted first, so the output depends only on the set of
+    missing localities and ``seed``, not on set iteration order.
+
+    Args:
+        missing_locations: Lower-cased names of the missing localities.
+        n_per_location: Number of rows per locality.
+        seed: Seed for the random generator.
+
+    Returns:
+        DataFrame matching the real dataset schema, grouped by locality.
+    """
+    locations = sorted(missing_locations)
+    rng = np.random.default_rng(seed)
+    location_idx = np.repeat(np.arange(len(locations)), n_per_location)
+    return synthesize_listings(locations, location_idx, rng)
+
+
+def load_model_metadata() -> dict:
+    """Loads the exported model card (model.pkl.json) if it is available.
+
+    Returns:
+        The ``model_info`` section of the model card, or an empty dict.
+    """
+    for path in (BASE_DIR / MODEL_METADATA_FILENAME, BASE_DIR.parent / MODEL_METADATA_FILENAME):
+        if path.exists():
+            return json.loads(path.read_text()).get("model_info", {})
+    return {}
+
+
+def export_bundle(
+    model, scaler, label_encoder, metrics: dict | None = None, quantile_models: dict | None = None
+) -> None:
+    """Writes the memory-mappable model bundle next to the pickles.
+
+    Args:
+        model: Fitted GradientBoostingRegressor.
+        scaler: Fitted StandardScaler.
+        label_encoder: Fitted LabelEncoder for the location column.
+        metrics: Evaluation metrics from this training run, if any.
+        quantile_models: Quantile → fitted quantile GradientBoostingRegressor,
+            fused into the bundle's trees for price ranges.
+    """
+    metadata = {"model_info": load_model_metadata()}
+    if metrics:
+        metadata["training_metrics"] = metrics
+    write_bundle(BUNDLE_DIR, model, scaler, label_encoder, FEATURES, metadata, quantile_models)
+
+
+def load_quantile_models() -> dict | None:
+    """Loads models/quantiles.pkl, if training wrote it."""
+    if not QUANTILE_MODELS_PATH.exists():
+        return None
+    with open(QUANTILE_MODELS_PATH, "rb") as f:
+        return pickle.load(f)
+
+
+def export_bundle_from_pickles() -> None:
+    """Re-exports the bundle from the pickled artifacts already on disk.
+
+    Raises:
+        ValueError: If model.pkl holds a histogram-based model.
+    """
+    with open(MODEL_PATH, "rb") as f:
+        model = pickle.load(f)
+    if not isinstance(model, GradientBoostingRegressor):
+        raise ValueError(f"Model bundles support GradientBoostingRegressor only, not {type(model).__name__}.")
+    with open(SCALER_PATH, "rb") as f:
+        scaler = pickle.load(f)
+    with open(LABEL_ENCODER_PATH, "rb") as f:
+        label_encoder = pickle.load(f)
+    export_bundle(model, scaler, label_encoder, quantile_models=load_quantile_models())
+
+
+def load_training_data(
+    csv_path: Path | None = None, chunksize: int | None = None, cache_dir: Path | None = None
+) -> pd.DataFrame:
+    """Loads the real CSV, augmented for missing localities, or synthetic data.
+
+    Args:
+        csv_path: Listings CSV; defaults to the first one ``find_csv`` finds.
+        chunksize: Rows parsed per chunk (see ``load_real_data``).
+        cache_dir: Columnar data cache directory (see ``load_real_data``).
+
+    Returns:
+        DataFrame with FEATURES and TARGET columns. Real listings come first;
+        ``df.attrs["real_rows"]`` is their count, so synthetic rows can be
+        excluded from statistics reported as market data.
+    """
+    csv_path = csv_path or find_csv()
+    df_real = load_real_data(csv_path, chunksize, cache_dir) if csv_path else None
+    if df_real is None:
         df = generate_synthetic_data()
+        df.attrs["real_rows"] = 0
+        return df
+    df_real.attrs["real_rows"] = len(df_real)
+
+    # Detect missing locations
+    present_locs = set(df_real["location"].str.lower().unique())
+    required_locs = set(l.lower() for l in LOCATIONS)
+    missing_locs = required_locs - present_locs
+    if not missing_locs:
+        logger.info("All regions present in CSV. No augmentation needed.")
+        return df_real
+
+    logger.info("Localities missing from CSV: %s", missing_locs)
+    logger.info("Augmenting with synthetic data for missing regions...")
+    df_augment = augment_missing_locations(missing_locs)
+    df = pd.concat([df_real, df_augment], ignore_index=True)
+    df.attrs["real_rows"] = len(df_real)
+    logger.info("Hybrid dataset ready: %d real, %d synthetic rows", len(df_real), len(df_augment))
+    return df
 
+
+def build_model(backend: str, params: dict | None = None):
+    """Creates an unfitted regressor for a training backend.
+
+    Args:
+        backend: ``"gbr"`` for GradientBoostingRegressor on standardized
+            features, or ``"hist"`` for HistGradientBoostingRegressor on raw
+            features with ``location`` as a native categorical feature. The
+            histogram backend fits with OpenMP on all available cores.
+        params: Hyperparameters overriding DEFAULT_PARAMS for the backend.
+
+    Returns:
+        Unfitted sklearn regressor.
+    """
+    params = {**DEFAULT_PARAMS[backend], **(params or {})}
+    if backend == "hist":
+        # Depth-limited trees with as many leaves as a full tree of that depth.
+        params.setdefault("max_leaf_nodes", 2 ** params["max_depth"])
+        return HistGradientBoostingRegressor(
+            **params,
+            categorical_features=[FEATURES.index("location")],
+            early_stopping=False,
+            random_state=RANDOM_STATE,
+        )
+    return GradientBoostingRegressor(
+        **params,
+        subsample=0.8,
+        random_state=RANDOM_STATE,
+    )
+
+
+def build_quantile_model(backend: str, alpha: float, params: dict | None = None):
+    """Creates an unfitted quantile regressor for a training backend.
+
+    Args:
+        backend: One of TRAINING_BACKENDS (see ``build_model``).
+        alpha: Quantile to predict, in (0, 1).
+        params: Hyperparameters overriding QUANTILE_PARAMS for the backend.
+
+    Returns:
+        Unfitted sklearn regressor with quantile loss.
+    """
+    model = build_model(backend, {**QUANTILE_PARAMS[backend], **(params or {})})
+    if backend == "hist":
+        return model.set_params(loss="quantile", quantile=alpha)
+    return model.set_params(loss="quantile", alpha=alpha)
+
+
+def interval_stats(y: np.ndarray, point: np.ndarray, low: np.ndarray, high: np.ndarray) -> dict:
+    """Measures empirical coverage and width of prediction intervals.
+
+    Bounds are widened to contain the point prediction, as served.
+
+    Args:
+        y: Actual prices.
+        point: Point predictions.
+        low: Lower quantile predictions.
+        high: Upper quantile predictions.
+
+    Returns:
+        Dict with ``coverage`` (share of prices inside the interval) and the
+        ``median_relative_width`` of the interval over the point prediction.
+    """
+    low, high = np.minimum(low, point), np.maximum(high, point)
+    return {
+        "coverage": float(np.mean((y >= low) & (y <= high))),
+        "median_relative_width": float(np.median((high - low) / np.maximum(point, 1.0))),
+    }
+
+
+def prepare_features(backend: str, X: pd.DataFrame) -> tuple[np.ndarray, StandardScaler | None]:
+    """Builds the model input matrix for a backend.
+
+    Args:
+        backend: One of TRAINING_BACKENDS.
+        X: Features in FEATURES order, with ``location`` label-encoded.
+
+    Returns:
+        Tuple of (feature matrix, fitted StandardScaler or None for ``hist``).
+    """
+    if backend == "gbr":
+        # Step 3 — Scale features
+        scaler = StandardScaler()
+        return scaler.fit_transform(X), scaler
+    return X.to_numpy(dtype=float), None
+
+
+def fit_and_evaluate(
+    backend: str,
+    X: pd.DataFrame,
+    y: pd.Series,
+    latency_repeat: int = 200,
+    params: dict | None = None,
+    quantiles: Sequence[float] = (),
+) -> dict:
+    """Fits one backend on the shared train/test split and measures it.
+
+    Args:
+        backend: One of TRAINING_BACKENDS.
+        X: Features in FEATURES order, with ``location`` label-encoded.
+        y: Target prices.
+        latency_repeat: Number of timed predictions per latency figure; 0
+            skips latency measurement.
+        params: Hyperparameters overriding DEFAULT_PARAMS for the backend.
+        quantiles: Quantiles to fit interval models for on the same split.
+
+    Returns:
+        Dict with the fitted ``model`` and ``scaler`` (None for ``hist``),
+        test ``r2`` and ``metrics`` (see ``regression_metrics``), ``train_s``,
+        and median single-row and full-test-set
+        ``predict_1_ms`` / ``predict_batch_ms`` latencies. With
+        ``quantiles``, also ``quantile_models`` (quantile → fitted model) and
+        the test-set ``intervals`` stats of the outermost pair (see
+        ``interval_stats``).
+    """
+    features, scaler = prepare_features(backend, X)
+
+    # Step 4 — Train/test split
+    X_train, X_test, y_train, y_test = train_test_split(
+        features, y, test_size=0.20, random_state=RANDOM_STATE
+    )
+
+    # Step 5 — Train
+    model = build_model(backend, params)
+    logger.info("Training %s %s...", type(model).__name__, {**DEFAULT_PARAMS[backend], **(params or {})})
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    train_s = time.perf_counter() - start
+
+    r2 = model.score(X_test, y_test)
+    logger.info("[%s] Test R² score: %.4f (trained in %.2fs)", backend, r2, train_s)
+    metrics = regression_metrics(np.asarray(y_test, dtype=float), model.predict(X_test))
+
+    quantile_models = {}
+    intervals = None
+    for alpha in quantiles:
+        quantile_models[alpha] = build_quantile_model(backend, alpha).fit(X_train, y_train)
+    if quantile_models:
+        intervals = interval_stats(
+            np.asarray(y_test, dtype=float),
+            model.predict(X_test),
+            quantile_models[min(quantiles)].predict(X_test),
+            quantile_models[max(quantiles)].predict(X_test),
+        )
+        logger.info(
+            "[%s] %s quantile interval: %.1f%% test coverage, median width %.1f%% of price",
+            backend, list(quantiles), 100 * intervals["coverage"], 100 * intervals["median_relative_width"],
+        )
+
+    def median_ms(fn) -> float:
+        if not latency_repeat:
+            return 0.0
+        timings = []
+        for _ in range(latency_repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        return float(np.median(timings)) * 1e3
+
+    row = X_test[:1]
+    return {
+        "backend": backend,
+        "model": model,
+        "scaler": scaler,
+        "r2": r2,
+        "metrics": metrics,
+        "train_s": train_s,
+        "predict_1_ms": median_ms(lambda: model.predict(row)),
+        "predict_batch_ms": median_ms(lambda: model.predict(X_test)),
+        "test_rows": len(X_test),
+        "quantile_models": quantile_models,
+        "intervals": intervals,
+    }
+
+
+def regression_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> dict:
+    """Returns R², RMSE and MAE of predictions, as served by /model-info."""
+    residuals = y_true - y_pred
+    total = float(((y_true - y_true.mean()) ** 2).sum())
+    return {
+        "r2_score": 1.0 - float((residuals**2).sum()) / total if total > 0 else 0.0,
+        "rmse": float(np.sqrt((residuals**2).mean())),
+        "mae": float(np.abs(residuals).mean()),
+    }
+
+
+def encode_locations(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.Series, LabelEncoder]:
+    """Splits features from target and label-encodes the location column.
+
+    Returns:
+        Tuple of (X, y, fitted LabelEncoder).
+    """
     X = df[FEATURES].copy()
     y = df[TARGET].copy()
 
@@ -244,49 +634,243 @@ def train_and_save() -> None:
     label_encoder = LabelEncoder()
     X["location"] = label_encoder.fit_transform(X["location"].astype(str).str.lower())
     logger.info("Location labels: %s", list(label_encoder.classes_))
+    return X, y, label_encoder
 
-    # Step 3 — Scale features
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
 
-    # Step 4 — Train/test split
-    X_train, X_test, y_train, y_test = train_test_split(
-        X_scaled, y, test_size=0.20, random_state=RANDOM_STATE
+def compare_backends(ingest_options: dict | None = None) -> list[dict]:
+    """Trains every backend on the same data and prints a side-by-side report.
+
+    No artifacts are written.
+
+    Args:
+        ingest_options: Keyword arguments for ``load_training_data``.
+
+    Returns:
+        One result dict per backend (see ``fit_and_evaluate``).
+    """
+    X, y, _ = encode_locations(load_training_data(**(ingest_options or {})))
+    results = [fit_and_evaluate(backend, X, y, latency_repeat=50) for backend in TRAINING_BACKENDS]
+
+    print(f"\n{'backend':<8} {'model':<32} {'train':>9} {'predict 1 row':>14} "
+          f"{'predict test set':>17} {'test R²':>8}")
+    for r in results:
+        print(
+            f"{r['backend']:<8} {type(r['model']).__name__:<32} {r['train_s']:>8.2f}s "
+            f"{r['predict_1_ms']:>12.3f}ms {r['predict_batch_ms']:>15.2f}ms {r['r2']:>8.4f}"
+        )
+    print(f"(test set: {results[0]['test_rows']} rows; {os.cpu_count()} CPU cores available)")
+    return results
+
+
+def search_hyperparameters(backend: str, X: pd.DataFrame, y: pd.Series, **options) -> dict:
+    """Runs the cross-validated hyperparameter search on the training split.
+
+    The held-out test rows of ``fit_and_evaluate`` are excluded so the final
+    test R² stays an unbiased estimate.
+
+    Args:
+        backend: One of TRAINING_BACKENDS.
+        X: Features in FEATURES order, with ``location`` label-encoded.
+        y: Target prices.
+        **options: Keyword arguments for ``model_search.run_search``.
+
+    Returns:
+        The search summary (see ``model_search.run_search``).
+    """
+    from model_search import run_search
+
+    features, _ = prepare_features(backend, X)
+    X_train, _, y_train, _ = train_test_split(
+        features, y, test_size=0.20, random_state=RANDOM_STATE
     )
+    options.setdefault("cache_dir", SEARCH_CACHE_DIR)
+    return run_search(backend, X_train, y_train.to_numpy(dtype=float), **options)
 
-    # Step 5 — Train GBR
-    logger.info("Training GradientBoostingRegressor (n_estimators=200)...")
-    model = GradientBoostingRegressor(
-        n_estimators=200,
-        learning_rate=0.05,
-        max_depth=5,
-        subsample=0.8,
-        random_state=RANDOM_STATE,
+
+def location_stats(df: pd.DataFrame) -> dict:
+    """Summarises listing prices per locality for the comparison endpoint.
+
+    The statistics are served as market data, so pass real listings only:
+    localities without any get no entry rather than synthetic figures.
+
+    Args:
+        df: Listings with FEATURES and TARGET columns, before encoding.
+
+    Returns:
+        Dict with the price-per-sqft ``quantiles`` reported and, per
+        lower-cased locality, the number of ``listings``, the
+        ``median_price``, the ``median_price_per_sqft`` and the
+        ``price_per_sqft_quantiles`` in the same order.
+    """
+    frame = pd.DataFrame(
+        {
+            "location": df["location"].astype(str).str.lower(),
+            "price": df[TARGET].astype(float),
+            "price_per_sqft": df[TARGET].astype(float) / df["area_sqft"].astype(float),
+        }
     )
-    model.fit(X_train, y_train)
+    grouped = frame.groupby("location", sort=True)
+    counts = grouped.size()
+    medians = grouped[["price", "price_per_sqft"]].median()
+    quantiles = grouped["price_per_sqft"].quantile(list(LOCATION_STATS_QUANTILES)).unstack()
+    return {
+        "quantiles": list(LOCATION_STATS_QUANTILES),
+        "locations": {
+            location: {
+                "listings": int(counts[location]),
+                "median_price": round(float(medians.at[location, "price"]), 2),
+                "median_price_per_sqft": round(float(medians.at[location, "price_per_sqft"]), 2),
+                "price_per_sqft_quantiles": [round(float(v), 2) for v in quantiles.loc[location]],
+            }
+            for location in counts.index
+        },
+    }
+
+
+def load_training_metadata() -> dict | None:
+    """Loads models/training_metadata.json, if a previous run wrote it."""
+    if not TRAINING_METADATA_PATH.exists():
+        return None
+    return json.loads(TRAINING_METADATA_PATH.read_text())
+
+
+def write_training_metadata(
+    backend: str,
+    params: dict,
+    r2: float,
+    search: dict | None,
+    data: dict | None = None,
+    history: list[dict] | None = None,
+    metrics: dict | None = None,
+    dataset_rows: int | None = None,
+) -> None:
+    """Records the trained configuration in models/training_metadata.json.
 
-    r2 = model.score(X_test, y_test)
-    logger.info("Test R² score: %.4f", r2)
+    Args:
+        backend: Training backend used.
+        params: Hyperparameters the model was trained with.
+        r2: Holdout R² of the model at its last full refit.
+        search: Hyperparameter search summary, if a search chose ``params``.
+        data: ``csv_stamp`` of the training CSV plus the ``train_rows``
+            count, or None for synthetic data.
+        history: One entry per training run since the last full refit.
+        metrics: ``regression_metrics`` of the saved model on the holdout.
+        dataset_rows: Rows the saved model was trained and evaluated on.
+    """
+    metadata = {
+        "backend": backend,
+        "params": params,
+        "r2_score": r2,
+        "trained_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        # The pickles are only guaranteed to load under the version that wrote them.
+        "sklearn_version": sklearn.__version__,
+        "hyperparameter_search": search,
+        "dataset_rows": dataset_rows,
+        "metrics": metrics,
+        "data": data,
+        "history": history or [],
+    }
+    TRAINING_METADATA_PATH.write_text(json.dumps(metadata, indent=2))
+    logger.info("Saved training metadata → %s", TRAINING_METADATA_PATH)
+
+
+def train_and_save(
+    backend: str = "gbr",
+    search_options: dict | None = None,
+    ingest_options: dict | None = None,
+    params: dict | None = None,
+) -> None:
+    """Orchestrates end-to-end model training and artifact persistence.
+
+    Steps:
+        1. Load real CSV or fall back to synthetic data.
+        2. Label-encode the location column.
+        3. Scale all features with StandardScaler (``gbr`` backend only).
+        4. Train the backend's regressor.
+        5. Evaluate on held-out test set and log metrics.
+        6. Save model.pkl, label_encoder.pkl, the per-locality listing stats
+           and, for ``gbr``, scaler.pkl and the model bundle.
+
+    Args:
+        backend: One of TRAINING_BACKENDS (see ``build_model``).
+        search_options: If given, choose hyperparameters with
+            ``search_hyperparameters`` (these are its keyword arguments)
+            instead of using DEFAULT_PARAMS.
+        ingest_options: Keyword arguments for ``load_training_data``.
+        params: Hyperparameters overriding DEFAULT_PARAMS (before any search).
+    """
+    MODEL_DIR.mkdir(parents=True, exist_ok=True)
+    ingest_options = ingest_options or {}
+
+    # Step 1 — Load data
+    csv_path = ingest_options.get("csv_path") or find_csv()
+    df = load_training_data(**ingest_options)
+    X, y, label_encoder = encode_locations(df)
+
+    search = None
+    params = {**DEFAULT_PARAMS[backend], **(params or {})}
+    if search_options is not None:
+        search = search_hyperparameters(backend, X, y, **search_options)
+        params.update(search["best_params"])
+    result = fit_and_evaluate(backend, X, y, latency_repeat=0, params=params, quantiles=QUANTILES)
+    model, scaler, r2 = result["model"], result["scaler"], result["r2"]
+    quantile_models, intervals = result["quantile_models"], result["intervals"]
 
     # Step 6 — Persist
     with open(MODEL_PATH, "wb") as f:
         pickle.dump(model, f)
     logger.info("Saved model → %s", MODEL_PATH)
 
-    with open(SCALER_PATH, "wb") as f:
-        pickle.dump(scaler, f)
-    logger.info("Saved scaler → %s", SCALER_PATH)
-
     with open(LABEL_ENCODER_PATH, "wb") as f:
         pickle.dump(label_encoder, f)
     logger.info("Saved label encoder → %s", LABEL_ENCODER_PATH)
 
+    with open(QUANTILE_MODELS_PATH, "wb") as f:
+        pickle.dump(quantile_models, f)
+    logger.info("Saved quantile models %s → %s", list(quantile_models), QUANTILE_MODELS_PATH)
+
+    expected = [MODEL_PATH, LABEL_ENCODER_PATH, QUANTILE_MODELS_PATH]
+    if scaler is not None:
+        with open(SCALER_PATH, "wb") as f:
+            pickle.dump(scaler, f)
+        logger.info("Saved scaler → %s", SCALER_PATH)
+        metrics = {"r2_score": r2, "params": params, "intervals": intervals}
+        if search is not None:
+            metrics["hyperparameter_search"] = search
+        export_bundle(model, scaler, label_encoder, metrics=metrics, quantile_models=quantile_models)
+        expected += [SCALER_PATH, BUNDLE_DIR / MANIFEST_NAME]
+    else:
+        # Artifacts of a previous GBR run would no longer match model.pkl.
+        SCALER_PATH.unlink(missing_ok=True)
+        if BUNDLE_DIR.exists():
+            shutil.rmtree(BUNDLE_DIR)
+        logger.info("Histogram backend: no scaler or bundle written (bundles support GBR only).")
+
+    # The same rows fit_and_evaluate held out, before scaling; incremental
+    # runs track drift on them.
+    _, X_holdout, _, y_holdout = train_test_split(X, y, test_size=0.20, random_state=RANDOM_STATE)
+    np.savez(HOLDOUT_PATH, X=X_holdout.to_numpy(dtype=float), y=y_holdout.to_numpy(dtype=float))
+
+    data = None
+    if csv_path is not None:
+        data = {**csv_stamp(csv_path), "train_rows": len(X) - len(X_holdout)}
+    history = [{
+        "mode": "full",
+        "trained_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "rows": len(X),
+        "holdout_r2": r2,
+        "intervals": intervals,
+    }]
+    write_training_metadata(
+        backend, params, r2, search, data, history, result["metrics"], len(X)
+    )
+    real = df.iloc[: df.attrs.get("real_rows", len(df))]
+    LOCATION_STATS_PATH.write_text(json.dumps(location_stats(real), indent=2))
+    logger.info("Saved location stats → %s", LOCATION_STATS_PATH)
+    expected += [HOLDOUT_PATH, TRAINING_METADATA_PATH, LOCATION_STATS_PATH]
+
     # Step 7 — Verify artifacts
-    missing_artifacts = []
-    for path in [MODEL_PATH, SCALER_PATH, LABEL_ENCODER_PATH]:
-        if not path.exists():
-            missing_artifacts.append(path.name)
-    
+    missing_artifacts = [path.name for path in expected if not path.exists()]
     if missing_artifacts:
         error_msg = f"CRITICAL: Failed to save artifacts: {missing_artifacts}"
         logger.error(error_msg)
@@ -299,5 +883,80 @@ def train_and_save() -> None:
     )
 
 
+def main() -> None:
+    """Parses CLI arguments and runs training, comparison or bundle export."""
+    parser = argparse.ArgumentParser(description="Train the Navi Mumbai house price model.")
+    parser.add_argument(
+        "--backend",
+        choices=TRAINING_BACKENDS,
+        default=os.environ.get("TRAINING_BACKEND", "gbr"),
+        help="gbr: GradientBoostingRegressor on scaled features (default); "
+        "hist: HistGradientBoostingRegressor with native categorical location",
+    )
+    parser.add_argument("--compare", action="store_true", help="Report all backends side by side")
+    parser.add_argument("--export-bundle", action="store_true", help="Re-export the bundle from pickles")
+    data = parser.add_argument_group("data ingestion")
+    data.add_argument("--csv", type=Path, help="Listings CSV (default: the bundled dataset)")
+    data.add_argument(
+        "--chunksize",
+        type=int,
+        help=f"Stream the CSV in chunks of N rows with compact dtypes "
+        f"(automatic with {DEFAULT_CHUNKSIZE} for files >= {CHUNKED_INGEST_MIN_BYTES >> 20} MiB)",
+    )
+    data.add_argument("--data-cache", type=Path, help="Columnar .npy cache of the cleaned rows")
+    incremental = parser.add_argument_group("incremental training")
+    incremental.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Add warm-start stages from listings appended to the CSV since the last run",
+    )
+    incremental.add_argument("--stages", type=int, help="Stages to add (default: proportional to new rows)")
+    incremental.add_argument(
+        "--max-drift",
+        type=float,
+        default=0.02,
+        help="Refit fully if holdout R² falls more than this below the last full refit",
+    )
+    search = parser.add_argument_group("hyperparameter search")
+    search.add_argument("--search", action="store_true", help="Choose hyperparameters by k-fold CV first")
+    search.add_argument("--search-space", type=Path, help="JSON file of candidate values per parameter")
+    search.add_argument("--search-samples", type=int, help="Evaluate a random sample of N grid configs")
+    search.add_argument("--folds", type=int, default=5, help="Cross-validation folds (default: 5)")
+    search.add_argument("--jobs", type=int, help="Worker processes (default: all cores)")
+    search.add_argument(
+        "--latency-weight",
+        type=float,
+        default=0.01,
+        help="R² traded per multiple of the default model's trees × depth (default: 0.01)",
+    )
+    search.add_argument("--search-cache", type=Path, default=SEARCH_CACHE_DIR, help="Fold result cache")
+    args = parser.parse_args()
+    ingest_options = {"csv_path": args.csv, "chunksize": args.chunksize, "cache_dir": args.data_cache}
+
+    if args.export_bundle:
+        export_bundle_from_pickles()
+    elif args.compare:
+        compare_backends(ingest_options)
+    elif args.incremental:
+        from incremental import train_incremental
+
+        train_incremental(ingest_options, stages=args.stages, max_drift=args.max_drift)
+    elif args.search:
+        train_and_save(
+            args.backend,
+            search_options={
+                "space": json.loads(args.search_space.read_text()) if args.search_space else None,
+                "n_samples": args.search_samples,
+                "folds": args.folds,
+                "n_jobs": args.jobs,
+                "latency_weight": args.latency_weight,
+                "cache_dir": args.search_cache,
+            },
+            ingest_options=ingest_options,
+        )
+    else:
+        train_and_save(args.backend, ingest_options=ingest_options)
+
+
 if __name__ == "__main__":
-    train_and_save()
+    main()
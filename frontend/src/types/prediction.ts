@@ -64,9 +64,9 @@ export interface ModelInfoResponse {
     model_name: string;
     model_version: string;
     task_type: string;
-    dataset_rows: number;
+    dataset_rows: number | null;
     features: string[];
-    metrics: ModelMetrics;
+    metrics: ModelMetrics | null;
     feature_importance: FeatureImportanceItem[];
 }
 